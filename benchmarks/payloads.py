@@ -0,0 +1,314 @@
+"""
+Payloads served by the benchmark server, shaped (and sized) like real
+responses of each endpoint. They are generated from a fixed seed, so every
+run serves the exact same bytes. Recorded responses can be used instead by
+pointing the server at a directory of '<route>.json' files (see server.py).
+"""
+
+import json
+from datetime import date, datetime, timedelta, timezone
+from random import Random
+
+START = date(2024, 1, 1)
+
+
+def _timestamp(rng: Random, day: date) -> str:
+    moment = datetime(day.year, day.month, day.day, tzinfo=timezone.utc) + timedelta(minutes=rng.randrange(1440))
+    return moment.strftime("%Y-%m-%dT%H:%MZ")
+
+
+def _text(rng: Random, words: int) -> str:
+    vocabulary = ("the", "solar", "coronal", "mass", "ejection", "observed", "by", "instrument",
+                  "arrival", "expected", "with", "speed", "of", "near", "earth", "asteroid",
+                  "image", "galaxy", "nebula", "star", "light", "years", "across", "field")
+    return " ".join(rng.choice(vocabulary) for _ in range(words)).capitalize() + "."
+
+
+# APOD
+def apod_entry(rng: Random, day: date) -> dict:
+    return {
+        "copyright": "Some Astrophotographer",
+        "date": day.isoformat(),
+        "explanation": _text(rng, 180),
+        "hdurl": f"https://apod.nasa.gov/apod/image/{day:%y%m}/hd_{day:%d}.jpg",
+        "media_type": "image",
+        "service_version": "v1",
+        "title": _text(rng, 4)[:-1],
+        "url": f"https://apod.nasa.gov/apod/image/{day:%y%m}/{day:%d}_1024.jpg"
+    }
+
+
+def apod(rng: Random) -> dict:
+    return apod_entry(rng, START)
+
+
+def apod_range(rng: Random) -> list:
+    return [apod_entry(rng, START + timedelta(days=offset)) for offset in range(31)]
+
+
+# NeoWs
+def _close_approach(rng: Random, day: date) -> dict:
+    speed = rng.uniform(2, 40)
+    distance = rng.uniform(0.001, 0.5)
+    return {
+        "close_approach_date": day.isoformat(),
+        "close_approach_date_full": day.strftime("%Y-%b-%d") + " 12:34",
+        "epoch_date_close_approach": int(datetime(day.year, day.month, day.day).timestamp() * 1000),
+        "relative_velocity": {"kilometers_per_second": str(speed),
+                              "kilometers_per_hour": str(speed * 3600),
+                              "miles_per_hour": str(speed * 2236.94)},
+        "miss_distance": {"astronomical": str(distance),
+                          "lunar": str(distance * 389.17),
+                          "kilometers": str(distance * 149597870.7),
+                          "miles": str(distance * 92955807.3)},
+        "orbiting_body": "Earth"
+    }
+
+
+def _orbital_data(rng: Random) -> dict:
+    return {
+        "orbit_id": str(rng.randrange(1, 900)),
+        "orbit_determination_date": "2024-01-01 06:00:00",
+        "first_observation_date": "1998-03-01",
+        "last_observation_date": "2023-12-20",
+        "data_arc_in_days": rng.randrange(100, 10000),
+        "observations_used": rng.randrange(10, 2000),
+        **{key: str(rng.uniform(0, 360)) for key in (
+            "minimum_orbit_intersection", "eccentricity", "semi_major_axis", "inclination",
+            "ascending_node_longitude", "orbital_period", "perihelion_distance",
+            "perihelion_argument", "aphelion_distance", "mean_anomaly", "mean_motion")},
+        "equinox": "J2000",
+        "orbit_class": {"orbit_class_type": "APO",
+                        "orbit_class_description": _text(rng, 12),
+                        "orbit_class_range": "a (semi-major axis) > 1.0 AU; q (perihelion) < 1.017 AU"}
+    }
+
+
+def _neo(rng: Random, day: date, approaches: int, orbital_data: bool) -> dict:
+    neo_id = str(rng.randrange(2000000, 54000000))
+    diameter = rng.uniform(0.01, 2)
+    neo = {
+        "links": {"self": f"http://api.nasa.gov/neo/rest/v1/neo/{neo_id}?api_key=DEMO_KEY"},
+        "id": neo_id,
+        "neo_reference_id": neo_id,
+        "name": f"({rng.randrange(1990, 2024)} {rng.choice('ABCDEFGH')}{rng.choice('KLMNOP')}{rng.randrange(1, 99)})",
+        "nasa_jpl_url": f"https://ssd.jpl.nasa.gov/tools/sbdb_lookup.html#/?sstr={neo_id}",
+        "absolute_magnitude_h": rng.uniform(15, 30),
+        "estimated_diameter": {unit: {"estimated_diameter_min": diameter * factor,
+                                      "estimated_diameter_max": diameter * factor * 2.2}
+                               for unit, factor in (("kilometers", 1), ("meters", 1000),
+                                                    ("miles", 0.621), ("feet", 3280.8))},
+        "is_potentially_hazardous_asteroid": rng.random() < 0.1,
+        "close_approach_data": [_close_approach(rng, day + timedelta(days=365 * index))
+                                for index in range(approaches)],
+        "is_sentry_object": False
+    }
+    if orbital_data:
+        neo["orbital_data"] = _orbital_data(rng)
+    return neo
+
+
+def neows_feed(rng: Random) -> dict:
+    days = {(START + timedelta(days=offset)).isoformat(): [_neo(rng, START + timedelta(days=offset), 1, False)
+                                                           for _ in range(rng.randrange(15, 30))]
+            for offset in range(7)}
+    return {
+        "links": {"next": "", "previous": "", "self": ""},
+        "element_count": sum(len(neos) for neos in days.values()),
+        "near_earth_objects": days
+    }
+
+
+def neows_browse(rng: Random) -> dict:
+    return {
+        "links": {"next": "", "self": ""},
+        "page": {"size": 20, "total_elements": 40000, "total_pages": 2000, "number": 0},
+        "near_earth_objects": [_neo(rng, date(1900, 1, 1), rng.randrange(20, 120), True) for _ in range(20)]
+    }
+
+
+def neows_lookup(rng: Random) -> dict:
+    return _neo(rng, date(1900, 1, 1), 150, True)
+
+
+# DONKI
+def _instruments(rng: Random) -> list:
+    return [{"displayName": rng.choice(("SOHO: LASCO/C2", "SOHO: LASCO/C3", "STEREO A: SECCHI/COR2", "GOES-P: EXIS 1.0-8.0"))}
+            for _ in range(rng.randrange(1, 4))]
+
+
+def _linked(rng: Random, day: date) -> list:
+    return [{"activityID": f"{day.isoformat()}T00:00:00-IPS-001"} for _ in range(rng.randrange(0, 3))]
+
+
+def donki_cme(rng: Random) -> list:
+    events = []
+    for offset in range(60):
+        day = START + timedelta(days=offset // 2)
+        time = _timestamp(rng, day)
+        events.append({
+            "activityID": f"{time[:-1]}:00-CME-001",
+            "catalog": "M2M_CATALOG",
+            "startTime": time,
+            "instruments": _instruments(rng),
+            "sourceLocation": f"S{rng.randrange(0, 40)}W{rng.randrange(0, 90)}",
+            "activeRegionNum": rng.randrange(13500, 13600),
+            "note": _text(rng, 40),
+            "submissionTime": time,
+            "versionId": 1,
+            "link": f"https://webtools.ccmc.gsfc.nasa.gov/DONKI/view/CME/{rng.randrange(28000, 30000)}/-1",
+            "cmeAnalyses": [{
+                "isMostAccurate": index == 0,
+                "time21_5": time,
+                "latitude": rng.uniform(-40, 40),
+                "longitude": rng.uniform(-90, 90),
+                "halfAngle": rng.uniform(10, 60),
+                "speed": rng.uniform(200, 1500),
+                "type": rng.choice("SCOR"),
+                "featureCode": "LE",
+                "imageType": None,
+                "measurementTechnique": "SWPC_CAT",
+                "note": _text(rng, 15),
+                "levelOfData": 0,
+                "tilt": None,
+                "minorHalfWidth": None,
+                "speedMeasuredAtHeight": None,
+                "link": "https://webtools.ccmc.gsfc.nasa.gov/DONKI/view/CMEAnalysis/1/-1",
+                "enlilList": None
+            } for index in range(rng.randrange(1, 4))],
+            "linkedEvents": _linked(rng, day)
+        })
+    return events
+
+
+def donki_flr(rng: Random) -> list:
+    events = []
+    for offset in range(100):
+        day = START + timedelta(days=offset // 3)
+        events.append({
+            "flrID": f"{_timestamp(rng, day)[:-1]}:00-FLR-001",
+            "catalog": "M2M_CATALOG",
+            "instruments": _instruments(rng),
+            "beginTime": _timestamp(rng, day),
+            "peakTime": _timestamp(rng, day),
+            "endTime": _timestamp(rng, day),
+            "classType": f"{rng.choice('CMX')}{rng.uniform(1, 9):.1f}",
+            "sourceLocation": f"N{rng.randrange(0, 30)}E{rng.randrange(0, 90)}",
+            "activeRegionNum": rng.randrange(13500, 13600),
+            "note": "",
+            "submissionTime": _timestamp(rng, day),
+            "versionId": 2,
+            "link": "https://webtools.ccmc.gsfc.nasa.gov/DONKI/view/FLR/28000/-1",
+            "linkedEvents": _linked(rng, day)
+        })
+    return events
+
+
+def donki_gst(rng: Random) -> list:
+    return [{
+        "gstID": f"{START + timedelta(days=offset * 6)}T00:00:00-GST-001",
+        "startTime": _timestamp(rng, START + timedelta(days=offset * 6)),
+        "allKpIndex": [{"observedTime": _timestamp(rng, START + timedelta(days=offset * 6)),
+                        "kpIndex": rng.choice((5.0, 5.67, 6.0, 6.33, 7.0)),
+                        "source": "NOAA"} for _ in range(rng.randrange(1, 6))],
+        "link": "https://webtools.ccmc.gsfc.nasa.gov/DONKI/view/GST/28000/-1",
+        "linkedEvents": _linked(rng, START),
+        "submissionTime": _timestamp(rng, START),
+        "versionId": 1
+    } for offset in range(5)]
+
+
+def donki_notifications(rng: Random) -> list:
+    return [{
+        "messageType": rng.choice(("CME", "FLR", "GST", "IPS", "Report")),
+        "messageID": f"20240101-AL-{index:03d}",
+        "messageURL": f"https://webtools.ccmc.gsfc.nasa.gov/DONKI/view/Alert/{28000 + index}/1",
+        "messageIssueTime": _timestamp(rng, START + timedelta(days=index // 2)),
+        "messageBody": "## NASA Goddard Space Flight Center, Space Weather Research Center ##\n" + _text(rng, 400)
+    } for index in range(50)]
+
+
+# EONET
+def _eonet_event(rng: Random, index: int) -> dict:
+    category = rng.choice((("wildfires", "Wildfires"), ("severeStorms", "Severe Storms"),
+                           ("volcanoes", "Volcanoes"), ("seaLakeIce", "Sea and Lake Ice")))
+    day = START + timedelta(days=index % 300)
+    return {
+        "id": f"EONET_{6000 + index}",
+        "title": f"{category[1]} {index}",
+        "description": None,
+        "link": f"https://eonet.gsfc.nasa.gov/api/v3/events/EONET_{6000 + index}",
+        "closed": None if rng.random() < 0.7 else _timestamp(rng, day),
+        "categories": [{"id": category[0], "title": category[1]}],
+        "sources": [{"id": "InciWeb", "url": "https://inciweb.nwcg.gov/incident/1/"}],
+        "geometry": [{
+            "magnitudeValue": rng.choice((None, rng.uniform(10, 5000))),
+            "magnitudeUnit": "acres",
+            "date": _timestamp(rng, day + timedelta(days=step))[:-1] + ":00Z",
+            "type": "Point",
+            "coordinates": [rng.uniform(-180, 180), rng.uniform(-80, 80)]
+        } for step in range(1 if category[0] == "wildfires" else rng.randrange(2, 30))]
+    }
+
+
+def eonet_events(rng: Random) -> dict:
+    return {
+        "title": "EONET Events",
+        "description": "Natural events from EONET.",
+        "link": "https://eonet.gsfc.nasa.gov/api/v3/events",
+        "events": [_eonet_event(rng, index) for index in range(500)]
+    }
+
+
+def eonet_events_geojson(rng: Random) -> dict:
+    features = []
+    for event in eonet_events(rng)["events"]:
+        geometries = event.pop("geometry")
+        for geometry in geometries:
+            features.append({
+                "type": "Feature",
+                "properties": dict(event, date=geometry["date"],
+                                   magnitudeValue=geometry["magnitudeValue"],
+                                   magnitudeUnit=geometry["magnitudeUnit"]),
+                "geometry": {"type": geometry["type"], "coordinates": geometry["coordinates"]}
+            })
+    return {"type": "FeatureCollection", "features": features}
+
+
+def eonet_categories(rng: Random) -> dict:
+    return {
+        "title": "EONET Event Categories",
+        "description": "List of all the available event categories in the EONET system",
+        "link": "https://eonet.gsfc.nasa.gov/api/v3/categories",
+        "categories": [{"id": name, "title": name.title(), "link": f"https://eonet.gsfc.nasa.gov/api/v3/categories/{name}",
+                        "description": _text(rng, 30), "layers": ""}
+                       for name in ("drought", "dustHaze", "earthquakes", "floods", "landslides", "manmade",
+                                    "seaLakeIce", "severeStorms", "snow", "tempExtremes", "volcanoes",
+                                    "waterColor", "wildfires")]
+    }
+
+
+# The generator of each route served by the benchmark server
+GENERATORS = {
+    "apod": apod,
+    "apod_range": apod_range,
+    "neows_feed": neows_feed,
+    "neows_browse": neows_browse,
+    "neows_lookup": neows_lookup,
+    "donki_cme": donki_cme,
+    "donki_flr": donki_flr,
+    "donki_gst": donki_gst,
+    "donki_notifications": donki_notifications,
+    "eonet_events": eonet_events,
+    "eonet_events_geojson": eonet_events_geojson,
+    "eonet_categories": eonet_categories
+}
+
+
+def generate(seed: int = 0) -> dict:
+    """
+    Returns the encoded body of every route in GENERATORS.
+    """
+
+    return {name: json.dumps(generator(Random(f"{seed}:{name}"))).encode()
+            for name, generator in GENERATORS.items()}
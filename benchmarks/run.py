@@ -0,0 +1,275 @@
+"""
+Benchmarks NASAClient (or AsyncNASAClient) against a local MockServer running in
+its own process, reporting the requests per second, p50/p99 latency, memory
+high-water mark and decode time of each endpoint. Run it from the repository root:
+
+    python -m benchmarks.run
+    python -m benchmarks.run --requests 500 --concurrency 16 --latency 0.02 --jitter 0.01
+    python -m benchmarks.run --rate-429 0.05 --timeout-rate 0.01 --timeout 1
+    python -m benchmarks.run --save baseline.json
+    python -m benchmarks.run --compare baseline.json
+    python -m benchmarks.run --record archive.sqlite
+    python -m benchmarks.run --replay archive.sqlite
+
+With --compare, endpoints whose requests per second dropped (or whose p99
+rose) by more than --threshold are flagged, and the run exits with status 1.
+With --replay, no server is started and the responses recorded with --record
+are served from memory, which leaves only the client's own overhead.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import tracemalloc
+from contextlib import nullcontext
+from time import perf_counter
+
+from pyspaceapis import (NASAClient, AsyncNASAClient, Metrics, Profiler, RetryPolicy,
+                         RequestsTransport, HTTPXTransport, RecordingTransport, ReplayTransport)
+
+from .server import serve_in_process
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# The server's port when recording or replaying, as recordings are matched by their full URL
+ARCHIVE_PORT = 8765
+
+# The client method and arguments of each benchmark
+BENCHMARKS = {
+    "apod": ("apod", {"date": "2024-01-01"}),
+    "apod_range": ("apod", {"start_date": "2024-01-01", "end_date": "2024-01-31"}),
+    "neows_feed": ("neows_feed", {"start_date": "2024-01-01", "end_date": "2024-01-07"}),
+    "neows_browse": ("neows_browse", {}),
+    "neows_lookup": ("neows_lookup", {"asteroid_id": 3542519}),
+    "donki_cme": ("donki_cme", {"start_date": "2024-01-01", "end_date": "2024-01-31"}),
+    "donki_flr": ("donki_flr", {"start_date": "2024-01-01", "end_date": "2024-01-31"}),
+    "donki_gst": ("donki_gst", {"start_date": "2024-01-01", "end_date": "2024-01-31"}),
+    "donki_ips": ("donki_ips", {"start_date": "2024-01-01", "end_date": "2024-01-31"}),
+    "donki_notifications": ("donki_notifications", {"start_date": "2024-01-01", "end_date": "2024-01-31"}),
+    "eonet_events": ("eonet_events", {}),
+    "eonet_events_geojson": ("eonet_events_geojson", {}),
+    "eonet_categories": ("eonet_categories", {})
+}
+
+
+def _decoder(name: str):
+    if name == "json":
+        return json.loads
+    if name == "orjson":
+        import orjson
+        return orjson.loads
+    return None
+
+
+def _transport(args):
+    # The transport of each client, when recording into or replaying from an archive
+    if args.replay:
+        return args.replay_transport
+    if args.record:
+        if args.use_async or args.http2:
+            transport = HTTPXTransport(max_connections=args.concurrency,
+                                       max_keepalive_connections=args.concurrency,
+                                       http2=args.http2)
+        else:
+            transport = RequestsTransport(pool_maxsize=args.concurrency)
+        return RecordingTransport(args.record, transport)
+    return None
+
+
+def _client(args, url: str):
+    options = dict(retry_policy=RetryPolicy(timeouts=(args.timeout,) * args.attempts, backoff=0.01),
+                   decoder=_decoder(args.decoder),
+                   http2=args.http2,
+                   metrics=Metrics(),
+                   transport=_transport(args))
+    if args.use_async:
+        client = AsyncNASAClient(max_connections=args.concurrency,
+                                 max_keepalive_connections=args.concurrency,
+                                 **options)
+    else:
+        client = NASAClient(pool_maxsize=args.concurrency, max_workers=args.concurrency, **options)
+
+    client._base_nasa_url = url
+    client._base_eonet_url = f"{url}/api/v3"
+    return client
+
+
+def _run_sync(client, method: str, kwargs: dict, requests: int) -> int:
+    futures = [client.submit(method, **kwargs) for _ in range(requests)]
+    return sum(1 for future in futures if future.exception() is not None)
+
+
+async def _run_async(client, method: str, kwargs: dict, requests: int, concurrency: int) -> int:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def call():
+        async with semaphore:
+            await getattr(client, method)(**kwargs)
+
+    results = await asyncio.gather(*(call() for _ in range(requests)), return_exceptions=True)
+    return sum(1 for result in results if isinstance(result, BaseException))
+
+
+def _run(client, args, method: str, kwargs: dict, requests: int) -> int:
+    if args.use_async:
+        return args.loop.run_until_complete(_run_async(client, method, kwargs, requests, args.concurrency))
+    return _run_sync(client, method, kwargs, requests)
+
+
+def _close(client, args) -> None:
+    if args.use_async:
+        args.loop.run_until_complete(client.aclose())
+    else:
+        client.close()
+
+
+def bench(args, url: str, name: str) -> dict:
+    method, kwargs = BENCHMARKS[name]
+
+    # Throughput pass
+    client = _client(args, url)
+    profiler = Profiler(sink=None).attach(client)
+    _run(client, args, method, kwargs, args.warmup)
+    client.metrics.reset()
+    profiler.reset()
+
+    start = perf_counter()
+    errors = _run(client, args, method, kwargs, args.requests)
+    elapsed = perf_counter() - start
+
+    metrics = client.metrics.snapshot()[method]
+    decode = profiler.stats()[method].get("decode", {})
+    _close(client, args)
+
+    # Memory pass (traced separately, as tracing slows everything down)
+    client = _client(args, url)
+    tracemalloc.start()
+    _run(client, args, method, kwargs, args.memory_requests)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    _close(client, args)
+
+    return {
+        "requests_per_second": args.requests / elapsed,
+        "p50": metrics["p50"],
+        "p99": metrics["p99"],
+        "errors": errors,
+        "retries": metrics["retries"],
+        "timeouts": metrics["timeouts"],
+        "bytes": metrics["bytes"] // max(metrics["calls"], 1),
+        "decode_mean": decode.get("mean"),
+        "decode_p99": decode.get("p99"),
+        "peak_memory": peak
+    }
+
+
+def _ms(seconds: float | None) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.2f}"
+
+
+def report(results: dict, baseline: dict | None, threshold: float) -> bool:
+    """
+    Prints the results as a table (against the baseline if given),
+    returning whether any endpoint regressed by more than the threshold.
+    """
+
+    regressed = False
+    print(f"{'endpoint':<22}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'decode ms':>11}"
+          f"{'decode p99':>12}{'peak KiB':>10}{'KiB/resp':>10}{'errors':>8}{'retries':>9}")
+
+    for name, result in results.items():
+        line = (f"{name:<22}{result['requests_per_second']:>10.1f}{_ms(result['p50']):>10}{_ms(result['p99']):>10}"
+                f"{_ms(result['decode_mean']):>11}{_ms(result['decode_p99']):>12}"
+                f"{result['peak_memory'] / 1024:>10.0f}{result['bytes'] / 1024:>10.1f}"
+                f"{result['errors']:>8}{result['retries']:>9}")
+
+        if baseline is not None and name in baseline:
+            before = baseline[name]
+            throughput = result["requests_per_second"] / before["requests_per_second"] - 1
+            latency = result["p99"] / before["p99"] - 1 if before["p99"] and result["p99"] else 0.0
+            line += f"   ({throughput:+.1%} req/s, {latency:+.1%} p99)"
+            if throughput < -threshold or latency > threshold:
+                line += "  REGRESSED"
+                regressed = True
+
+        print(line)
+
+    if resource is not None:
+        # ru_maxrss is in KiB on Linux, but in bytes on macOS
+        maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        print(f"\nProcess memory high-water mark: {maxrss / (1024 * 1024 if sys.platform == 'darwin' else 1024):.1f} MiB")
+
+    return regressed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the client against a local mock NASA API.")
+    parser.add_argument("endpoints", nargs="*",
+                        help=f"The benchmarks to run, out of: {', '.join(BENCHMARKS)} (all of them by default).")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per endpoint.")
+    parser.add_argument("--warmup", type=int, default=10, help="Untimed requests made first.")
+    parser.add_argument("--memory-requests", type=int, default=20, help="Requests of the traced memory pass.")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Use AsyncNASAClient.")
+    parser.add_argument("--http2", action="store_true", help="Use the httpx transport.")
+    parser.add_argument("--decoder", choices=("default", "json", "orjson"), default="default")
+    parser.add_argument("--latency", type=float, default=0, help="Server latency in seconds.")
+    parser.add_argument("--jitter", type=float, default=0, help="Maximum extra random latency in seconds.")
+    parser.add_argument("--rate-429", type=float, default=0, help="Share of requests answered with a 429.")
+    parser.add_argument("--timeout-rate", type=float, default=0, help="Share of requests which hang.")
+    parser.add_argument("--timeout", type=float, default=5, help="Client timeout per attempt in seconds.")
+    parser.add_argument("--attempts", type=int, default=3, help="Client attempts per request.")
+    parser.add_argument("--payload-dir", help="A directory of recorded '<route>.json' payloads.")
+    parser.add_argument("--record", metavar="ARCHIVE", help="Record the server's responses into an archive.")
+    parser.add_argument("--replay", metavar="ARCHIVE", help="Replay the responses of an archive instead.")
+    parser.add_argument("--save", help="Write the results to a JSON file.")
+    parser.add_argument("--compare", help="Compare against results saved with --save.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Regression threshold (0.1 = 10%%).")
+    args = parser.parse_args()
+
+    unknown = set(args.endpoints) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+    if args.record and args.replay:
+        parser.error("--record and --replay can't be used together")
+
+    # One loop for the whole run, as the async clients' connections belong to the loop they were opened on
+    args.loop = asyncio.new_event_loop() if args.use_async else None
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+
+    if args.replay:
+        # Loaded once, outside of the traced memory pass
+        args.replay_transport = ReplayTransport(args.replay)
+        server = nullcontext(f"http://127.0.0.1:{ARCHIVE_PORT}")
+    else:
+        server = serve_in_process(latency=args.latency, jitter=args.jitter, rate_429=args.rate_429,
+                                  timeout_rate=args.timeout_rate, hang=args.timeout * 2,
+                                  payload_dir=args.payload_dir, port=ARCHIVE_PORT if args.record else 0)
+
+    results = {}
+    with server as url:
+        for name in args.endpoints or BENCHMARKS:
+            results[name] = bench(args, url, name)
+
+    if args.loop is not None:
+        args.loop.close()
+
+    regressed = report(results, baseline, args.threshold)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=2)
+
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+A local stand-in for api.nasa.gov and EONET, which serves the payloads from
+payloads.py (or recorded '<route>.json' files) with configurable latency,
+jitter, 429 responses and hanging requests. It can also be run on its own:
+
+    python -m benchmarks.server --port 8000 --latency 0.05 --rate-429 0.01
+"""
+
+import argparse
+import multiprocessing
+import re
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from random import Random
+from time import sleep
+from urllib.parse import parse_qs, urlsplit
+
+from .payloads import generate
+
+# The route serving each path, with the APOD route depending on whether a date range was asked for
+ROUTES = (
+    (re.compile(r"/planetary/apod"), "apod"),
+    (re.compile(r"/neo/rest/v1/feed"), "neows_feed"),
+    (re.compile(r"/neo/rest/v1/neo/browse"), "neows_browse"),
+    (re.compile(r"/neo/rest/v1/neo/\w+"), "neows_lookup"),
+    (re.compile(r"/DONKI/CME"), "donki_cme"),
+    (re.compile(r"/DONKI/FLR"), "donki_flr"),
+    (re.compile(r"/DONKI/GST"), "donki_gst"),
+    (re.compile(r"/DONKI/notifications"), "donki_notifications"),
+    (re.compile(r"/DONKI/\w+"), None),
+    (re.compile(r"/api/v3/events/geojson"), "eonet_events_geojson"),
+    (re.compile(r"/api/v3/events"), "eonet_events"),
+    (re.compile(r"/api/v3/categories(/\w+)?"), "eonet_categories")
+)
+
+
+class MockServer:
+    """
+    Serves realistic NASA API responses from a background thread.
+
+    :param latency: The delay (in seconds) before every response.
+        This defaults to 0.
+
+    :param jitter: The maximum random delay (in seconds) added to the latency.
+        This defaults to 0.
+
+    :param rate_429: The share of requests answered with a 429 (and a
+        Retry-After of 'retry_after' seconds). This defaults to 0.
+
+    :param timeout_rate: The share of requests which hang for 'hang' seconds
+        before being answered, so clients time out. This defaults to 0.
+
+    :param hang: How long (in seconds) hanging requests hang.
+        This defaults to 2.
+
+    :param retry_after: The Retry-After of 429 responses. This defaults to 0.
+
+    :param payload_dir: A directory of recorded '<route>.json' files, which are
+        served instead of the generated payloads. This defaults to None.
+
+    :param seed: The seed of the generated payloads and of the random faults.
+        This defaults to 0.
+
+    :param port: The port to listen on. This defaults to 0 (any free port).
+    """
+
+    def __init__(self,
+                 latency: float = 0,
+                 jitter: float = 0,
+                 rate_429: float = 0,
+                 timeout_rate: float = 0,
+                 hang: float = 2,
+                 retry_after: float = 0,
+                 payload_dir: str | None = None,
+                 seed: int = 0,
+                 port: int = 0):
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_429 = rate_429
+        self.timeout_rate = timeout_rate
+        self.hang = hang
+        self.retry_after = retry_after
+
+        self.payloads = generate(seed)
+        if payload_dir is not None:
+            for path in Path(payload_dir).glob("*.json"):
+                self.payloads[path.stem] = path.read_bytes()
+
+        self.stats = {"served": 0, "throttled": 0, "hung": 0}
+        self._random = Random(seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._server.server_address[1]}"
+
+    def _fault(self) -> tuple[str | None, float]:
+        # Picks the fault (if any) and the delay of one request
+        with self._lock:
+            roll = self._random.random()
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            if roll < self.rate_429:
+                self.stats["throttled"] += 1
+                return "429", delay
+            if roll < self.rate_429 + self.timeout_rate:
+                self.stats["hung"] += 1
+                return "hang", delay + self.hang
+            self.stats["served"] += 1
+            return None, delay
+
+    def route(self, path: str, query: dict) -> str | None:
+        for pattern, route in ROUTES:
+            if pattern.fullmatch(path):
+                if route == "apod" and "start_date" in query:
+                    return "apod_range"
+                return route
+        raise KeyError(path)
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are written separately, which Nagle's algorithm would hold back
+            disable_nagle_algorithm = True
+
+            def _send(self, status: int, body: bytes, headers: dict | None = None) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("X-RateLimit-Limit", "1000000")
+                self.send_header("X-RateLimit-Remaining", "999999")
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The client gave up on a hanging request
+                    self.close_connection = True
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                try:
+                    route = server.route(url.path, parse_qs(url.query))
+                except KeyError:
+                    self._send(404, b'{"error": "Not Found"}')
+                    return
+
+                fault, delay = server._fault()
+                if delay:
+                    sleep(delay)
+
+                if fault == "429":
+                    self._send(429, b'{"error": "Too Many Requests"}', {"Retry-After": str(server.retry_after)})
+                else:
+                    # DONKI answers with an empty body when there are no events
+                    self._send(200, server.payloads[route] if route is not None else b"")
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> "MockServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def _serve(options: dict, urls) -> None:
+    server = MockServer(**options).start()
+    urls.put(server.url)
+    server._thread.join()
+
+
+@contextmanager
+def serve_in_process(**options):
+    """
+    Runs a MockServer (with the given options) in a child process, so it doesn't
+    compete with the benchmarked client for the GIL or show up in its memory use.
+    Yields the URL of the server.
+    """
+
+    urls = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_serve, args=(options, urls), daemon=True)
+    process.start()
+    try:
+        yield urls.get(timeout=60)
+    finally:
+        process.terminate()
+        process.join()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve mock NASA API responses.")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--jitter", type=float, default=0)
+    parser.add_argument("--rate-429", type=float, default=0)
+    parser.add_argument("--timeout-rate", type=float, default=0)
+    parser.add_argument("--hang", type=float, default=2)
+    parser.add_argument("--payload-dir")
+    args = parser.parse_args()
+
+    server = MockServer(latency=args.latency, jitter=args.jitter, rate_429=args.rate_429,
+                        timeout_rate=args.timeout_rate, hang=args.hang,
+                        payload_dir=args.payload_dir, port=args.port)
+    print(f"Serving on {server.url} (NASA API) and {server.url}/api/v3 (EONET)")
+    server.start()
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
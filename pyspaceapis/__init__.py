@@ -1,4 +1,13 @@
 from .nasa import NASAClient
-from .debugtools import time_this
+from .asyncnasa import AsyncNASAClient
+from .cache import DiskCache, MemoryCache
+from .transport import Transport, RequestsTransport, HTTPXTransport
+from .recording import RecordingTransport, ReplayTransport
+from .retry import RetryPolicy, RetryBudget
+from .hooks import Hooks
+from .metrics import Metrics, LatencyHistogram
+from .eonet import EONETSync, EONETDiff, EONETArrays, EONETIndex, eonet_arrays
+from .apod import APODDownloader, APODDownload
+from .debugtools import time_this, Profiler, CallProfile
 
-__all__ = ["NASAClient", "time_this"]
+__all__ = ["NASAClient", "AsyncNASAClient", "DiskCache", "MemoryCache", "Transport", "RequestsTransport", "HTTPXTransport", "RecordingTransport", "ReplayTransport", "RetryPolicy", "RetryBudget", "Hooks", "Metrics", "LatencyHistogram", "EONETSync", "EONETDiff", "EONETArrays", "EONETIndex", "eonet_arrays", "APODDownloader", "APODDownload", "time_this", "Profiler", "CallProfile"]
@@ -0,0 +1,285 @@
+import hashlib
+import json
+from asyncio import Lock, Semaphore, gather, to_thread
+from dataclasses import dataclass
+from os import makedirs, path as os_path, remove, replace
+from urllib.parse import urlsplit
+
+from requests.exceptions import ConnectionError as RequestsConnectionError, Timeout, ChunkedEncodingError
+
+from .retry import RetryPolicy
+
+# Errors which can interrupt a body halfway through, leaving a partial download to resume
+_STREAM_ERRORS = (RequestsConnectionError, Timeout, ChunkedEncodingError)
+
+# The file name suffix of each downloadable APOD field
+_SUFFIXES = {"url": "sd", "hdurl": "hd", "thumbnail_url": "thumb"}
+
+
+@dataclass
+class APODDownload:
+    """
+    The outcome of downloading one APOD file. 'status' is one of
+    "downloaded", "resumed" (a partial download was completed),
+    "skipped" (already present) or "failed" (see 'error').
+    """
+
+    date: str
+    field: str
+    url: str
+    path: str
+    status: str
+    size: int = 0
+    sha256: str | None = None
+    error: BaseException | None = None
+
+
+def _sha256(path: str, chunk_size: int) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        while chunk := file.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _content_range_total(response) -> int | None:
+    # The total size from a 'bytes */1234' (or 'bytes 0-99/1234') Content-Range header
+    total = response.headers.get("Content-Range", "").rpartition("/")[2]
+    return int(total) if total.isdigit() else None
+
+
+class APODDownloader:
+    """
+    Downloads the images of APOD results into a directory, concurrently!
+    Bodies are streamed straight to disk (into '<name>.part' files which are
+    renamed once complete), so even HD images are never held in memory.
+
+    Interrupted downloads are resumed with Range requests, both within a
+    run and across runs, and files which were already downloaded are
+    skipped once their size (and SHA-256 checksum) match the manifest
+    kept in the directory. Files are named '<date>_<sd|hd|thumb><ext>'.
+
+    Works with AsyncNASAClient, and shares its connection pool, retries and hooks.
+    Disk writes and checksums run in worker threads, so downloads never
+    hold up each other (or anything else running on the event loop).
+
+    :param client: The AsyncNASAClient used to request APOD results and images.
+
+    :param directory: The directory the files are saved into, which is
+        created if needed. This defaults to "apod".
+
+    :param fields: The APOD fields to download, out of "url", "hdurl"
+        and "thumbnail_url" (the thumbnail of video entries). Entries
+        missing a field are skipped. This defaults to ("hdurl",).
+
+    :param per_host: The maximum number of downloads from each host at once.
+        This defaults to 4.
+
+    :param verify: Whether already present files are checksummed before
+        being skipped, rather than only compared by size. This defaults to True.
+
+    :param attempts: How many times a download which broke off halfway is
+        resumed before it is given up on. This defaults to 3.
+
+    :param chunk_size: The size (in bytes) of the chunks written to disk.
+        This defaults to 65536.
+    """
+
+    manifest_name = "apod_manifest.json"
+
+    def __init__(self,
+                 client,
+                 directory: str | None = "apod",
+                 fields: tuple[str, ...] | None = ("hdurl",),
+                 per_host: int | None = 4,
+                 verify: bool | None = True,
+                 attempts: int | None = 3,
+                 chunk_size: int | None = 65536):
+        unknown = set(fields) - _SUFFIXES.keys()
+        if unknown:
+            raise ValueError(
+                f"Unknown APOD field(s): {', '.join(sorted(unknown))}. Choose from: {', '.join(_SUFFIXES)}."
+            )
+
+        self.client = client
+        self.directory = os_path.expanduser(directory)
+        self.fields = tuple(fields)
+        self.per_host = per_host
+        self.verify = verify
+        self.attempts = attempts
+        self.chunk_size = chunk_size
+
+        self._semaphores = {}
+        self._manifest_lock = Lock()
+        self.manifest = {}
+
+        makedirs(self.directory, exist_ok=True)
+        manifest_path = os_path.join(self.directory, self.manifest_name)
+        if os_path.exists(manifest_path):
+            with open(manifest_path, encoding="utf-8") as file:
+                self.manifest = json.load(file)
+
+    def _write_manifest(self, contents: str) -> None:
+        # Writes to a temporary file first, so an interrupted save never corrupts the manifest
+        path = os_path.join(self.directory, self.manifest_name)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+            file.write(contents)
+        replace(f"{path}.tmp", path)
+
+    async def _save_manifest(self) -> None:
+        # Serialized on the event loop (so no download changes it halfway), but written in a thread
+        contents = json.dumps(self.manifest, indent=2)
+        async with self._manifest_lock:
+            await to_thread(self._write_manifest, contents)
+
+    def _targets(self, entries: list) -> list[tuple[str, str, str, str]]:
+        # The (date, field, url, file name) of every file to download, without duplicates
+        targets = {}
+        for entry in entries:
+            for field in self.fields:
+                url = entry.get(field)
+                # A video's 'url' is a web page, not an image
+                if not url or (field != "thumbnail_url" and entry.get("media_type", "image") != "image"):
+                    continue
+
+                extension = os_path.splitext(urlsplit(url).path)[1].lower()
+                name = f"{entry.get('date', 'unknown')}_{_SUFFIXES[field]}{extension}"
+                targets.setdefault(name, (entry.get("date"), field, url, name))
+        return list(targets.values())
+
+    async def _present(self, name: str, url: str) -> dict | None:
+        # The manifest record of a complete, unchanged file, or None if it has to be downloaded
+        path = os_path.join(self.directory, name)
+        if not os_path.exists(path):
+            return None
+
+        record = self.manifest.get(name)
+        size = os_path.getsize(path)
+        if record is None or record.get("sha256") is None:
+            # Files are only ever renamed into place once complete, so an unknown one is adopted
+            record = {"url": url, "size": size, "sha256": await to_thread(_sha256, path, self.chunk_size)}
+            self.manifest[name] = record
+            await self._save_manifest()
+            return record
+
+        if record["url"] != url or record["size"] != size:
+            return None
+        if self.verify and await to_thread(_sha256, path, self.chunk_size) != record["sha256"]:
+            return None
+        return record
+
+    async def _stream(self, url: str, name: str, record: dict,
+                      retry_delays: list[float] | RetryPolicy | None) -> bool:
+        # Streams the rest of a file into its '.part' file, returning whether it was resumed
+        part_path = os_path.join(self.directory, f"{name}.part")
+        offset = os_path.getsize(part_path) if os_path.exists(part_path) else 0
+
+        headers = {"Accept-Encoding": "identity"}
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            # Only resumes if the file hasn't changed since the partial download started
+            validator = record.get("etag") or record.get("last_modified")
+            if validator:
+                headers["If-Range"] = validator
+
+        response = await self.client.stream(url, headers, endpoint="apod_download", chunk_size=self.chunk_size,
+                                            check_status=False, retry_delays=retry_delays)
+        if response.status_code == 416 and offset:
+            await response.aclose()
+            if _content_range_total(response) == offset:
+                # The partial file was already complete
+                return True
+            # The partial file no longer matches the remote file, so it is downloaded again
+            remove(part_path)
+            return await self._stream(url, name, record, retry_delays)
+
+        try:
+            response.raise_for_status()
+
+            resumed = offset > 0 and response.status_code == 206
+            if not resumed:
+                # The server sent the whole file (e.g. it ignores ranges, or the file changed)
+                offset = 0
+                record["etag"] = response.headers.get("ETag")
+                record["last_modified"] = response.headers.get("Last-Modified")
+                await self._save_manifest()
+
+            file = await to_thread(open, part_path, "ab" if resumed else "wb")
+            try:
+                async for chunk in response.chunks:
+                    await to_thread(file.write, chunk)
+            finally:
+                await to_thread(file.close)
+            return resumed
+        finally:
+            await response.aclose()
+
+    async def _download(self, date: str, field: str, url: str, name: str,
+                        retry_delays: list[float] | RetryPolicy | None) -> APODDownload:
+        path = os_path.join(self.directory, name)
+
+        present = await self._present(name, url)
+        if present is not None:
+            return APODDownload(date, field, url, path, "skipped", present["size"], present["sha256"])
+
+        record = self.manifest.get(name)
+        if record is None or record.get("url") != url or record.get("sha256") is not None:
+            record = self.manifest[name] = {"url": url}
+
+        host = urlsplit(url).netloc
+        semaphore = self._semaphores.setdefault(host, Semaphore(self.per_host))
+
+        resumed = False
+        async with semaphore:
+            for attempt in range(1, self.attempts + 1):
+                try:
+                    resumed = await self._stream(url, name, record, retry_delays) or resumed
+                    break
+                except _STREAM_ERRORS as e:
+                    if attempt == self.attempts:
+                        return APODDownload(date, field, url, path, "failed", error=e)
+                except Exception as e:
+                    return APODDownload(date, field, url, path, "failed", error=e)
+
+        replace(f"{path}.part", path)
+        record["size"] = os_path.getsize(path)
+        record["sha256"] = await to_thread(_sha256, path, self.chunk_size)
+        await self._save_manifest()
+        return APODDownload(date, field, url, path, "resumed" if resumed else "downloaded",
+                            record["size"], record["sha256"])
+
+    async def download(self,
+                       apod: dict | list | None = None,
+                       start_date: str | None = None,
+                       end_date: str | None = None,
+                       retry_delays: list[float] | RetryPolicy | None = None) -> list[APODDownload]:
+        """
+        Downloads the files of APOD results, returning an APODDownload for each
+        file. A failed file doesn't stop the others, and is resumed next time.
+
+        :param apod: The result of an 'apod' call (a single entry or a list).
+            This defaults to None, in which case the date range is requested.
+
+        :param start_date: The first date to download, if no result is given. (YYYY-MM-DD)
+            This defaults to None.
+
+        :param end_date: The last date to download, if no result is given. (YYYY-MM-DD)
+            This defaults to None (Today).
+
+        :param retry_delays: Overrides the client's default retry delays.
+            This defaults to None.
+        """
+
+        if apod is None:
+            if start_date is None:
+                raise TypeError("Either an 'apod' result or a 'start_date' must be given.")
+            apod = await self.client.apod(start_date=start_date, end_date=end_date,
+                                          thumbs="thumbnail_url" in self.fields or None,
+                                          retry_delays=retry_delays)
+
+        if isinstance(apod, bytes):
+            # Clients created with 'raw' return undecoded bodies
+            apod = json.loads(apod)
+
+        entries = [apod] if isinstance(apod, dict) else apod
+        return await gather(*(self._download(*target, retry_delays) for target in self._targets(entries)))
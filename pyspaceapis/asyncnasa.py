@@ -0,0 +1,928 @@
+from asyncio import create_task, gather, wait, Semaphore, FIRST_COMPLETED
+from collections import deque
+from copy import copy
+from itertools import islice
+
+from .engine import Request, Response, RequestEngine, DecodeStage, default_decoder
+from .transport import Transport, HTTPXTransport
+from .ratelimit import RateLimitStage
+from .retry import RetryPolicy, RetryStage
+from .jsonstream import aiter_array
+from .dateranges import split_date_range, merge_neows_feeds, merge_donki_events
+from .cache import CacheStage, ConditionalStage, DiskCache, MemoryCache
+from .models import TypedClient
+from .hooks import Hooks
+from .metrics import Metrics
+
+
+class AsyncNASAClient:
+
+    # APOD, NeoWs, and DONKI Base Url
+    _base_nasa_url = "https://api.nasa.gov"
+    # EONET Base Url
+    _base_eonet_url = "https://eonet.gsfc.nasa.gov/api/v3"
+
+    # DONKI Event Types (each has a matching 'donki_<kind>' method)
+    _donki_kinds = ("cme", "cme_analysis", "gst", "ips", "flr", "sep",
+                    "mpc", "rbe", "hss", "wsa_es", "notifications")
+
+    def __init__(self,
+                 api_key: str | None = "DEMO_KEY",
+                 default_retry_delays: list[float] | RetryPolicy | None = None,
+                 timeout_print: bool | None = False,
+                 retry_policy: RetryPolicy | None = None,
+                 pace_requests: bool | None = False,
+                 cache: DiskCache | None = None,
+                 memory_cache: MemoryCache | None = None,
+                 conditional_requests: bool | None = False,
+                 decoder=None,
+                 max_connections: int | None = 100,
+                 max_keepalive_connections: int | None = 20,
+                 http2: bool | None = False,
+                 hooks: Hooks | None = None,
+                 metrics: Metrics | None = None,
+                 transport: Transport | None = None):
+        """
+        This is the asyncio version of the NASAClient class! Every
+        endpoint method is a coroutine which can be awaited, and all
+        requests share one pooled connection pool, allowing for thousands
+        of concurrent requests on a single event loop.
+
+        The 'api_key', 'default_retry_delays', 'timeout_print', 'retry_policy' and 'pace_requests'
+        parameters behave exactly the same as they do in NASAClient, and
+        timeouts, connection errors and HTTP errors raise the same exceptions from
+        'requests.exceptions' (ConnectTimeout, ReadTimeout, ConnectionError and HTTPError).
+
+        This class requires the optional 'httpx' dependency, which can be
+        installed via: pip install pyspaceapis[async]
+
+        :param api_key: Your NASA API key.
+            This defaults to the DEMO_KEY.
+            (DEMO_KEY is limited to 10 requests per hour!)
+
+        :param default_retry_delays: The DEFAULT retry delays which will
+            be attempted when a timeout occurs. (e.g. the list [5, 10, 15] will
+            cause the wrapper to try three times, once for five seconds, once again
+            for ten seconds, etc.) This defaults to [10, 15, 30]
+
+        :param timeout_print: If this parameter is set to True, timeout
+            debug prints will be made visible!
+            This defaults to False.
+
+        :param retry_policy: A RetryPolicy controlling how requests are retried,
+            exactly as in NASAClient. This defaults to None (RetryPolicy()).
+
+        :param pace_requests: If this parameter is set to True, requests
+            made with the API key wait for the hourly budget to refill
+            instead of failing with a 429 error!
+            This defaults to False.
+
+        :param cache: An optional cache backend (e.g. DiskCache) for storing
+            responses, which can be shared with a NASAClient.
+            This defaults to None (No Caching).
+
+        :param memory_cache: An optional in-process cache (MemoryCache) which keeps
+            recently decoded responses in memory, and coalesces identical
+            requests made at the same time into a single request.
+            This defaults to None (No Caching).
+
+        :param conditional_requests: Whether to revalidate repeated requests with
+            their ETag and Last-Modified headers, serving unchanged data from memory.
+            This defaults to False.
+
+        :param decoder: A callable which decodes a JSON response body (bytes).
+            This defaults to None, which picks the fastest installed decoder
+            (orjson, then msgspec, then the standard library's 'json.loads').
+
+        :param max_connections: The maximum number of simultaneous
+            connections kept in the connection pool.
+            This defaults to 100.
+
+        :param max_keepalive_connections: The maximum number of idle
+            connections kept alive in the connection pool for reuse.
+            This defaults to 20.
+
+        :param http2: If this parameter is set to True, requests are sent over HTTP/2
+            where supported, multiplexing concurrent requests over one connection per host.
+            This requires: pip install pyspaceapis[http2]
+            This defaults to False.
+
+        :param hooks: A Hooks registry whose callbacks are called on events during requests
+            (request start/end, retries, cache hits, rate limit waits and bytes received).
+            Callbacks can also be added later via 'client.hooks.on'.
+            This defaults to None, which creates an empty Hooks registry.
+
+        :param metrics: An optional Metrics collector, which records the latency
+            percentiles, errors, timeouts and retries of each endpoint from the hooks.
+            (e.g. NASAClient(metrics=Metrics()), then read 'client.metrics.snapshot()')
+            This defaults to None (No Metrics).
+
+        :param transport: The transport which sends the requests, such as a RecordingTransport
+            or a ReplayTransport (for runs without network access), which must support
+            asynchronous requests. The connection parameters above are then ignored.
+            This defaults to None, which uses a pooled HTTPXTransport.
+        """
+
+        # API Key
+        self._api_key = api_key
+
+        # Retry Policy (immutable, with 'default_retry_delays' as its per-attempt timeouts if given)
+        self._retry_policy = retry_policy or RetryPolicy()
+        if default_retry_delays:
+            self._retry_policy = self._retry_policy.with_timeouts(default_retry_delays)
+
+        # Whether results are returned as undecoded bytes (see the 'raw' property)
+        self._raw = False
+
+        # Request Engine (shares its stages with NASAClient, over a pooled httpx transport)
+        if transport is not None:
+            self._transport = transport
+        else:
+            self._transport = HTTPXTransport(max_connections=max_connections,
+                                             max_keepalive_connections=max_keepalive_connections,
+                                             http2=http2)
+        self._rate_limit = RateLimitStage(pace=pace_requests)
+        self._cache_stages = {}
+
+        stages = []
+        if memory_cache is not None:
+            # Outside of decoding, so cache hits skip decoding entirely
+            self._cache_stages["memory"] = CacheStage(memory_cache, decoded=True)
+            stages.append(self._cache_stages["memory"])
+        stages.append(DecodeStage(decoder or default_decoder()))
+        if cache is not None:
+            self._cache_stages["disk"] = CacheStage(cache)
+            stages.append(self._cache_stages["disk"])
+        if conditional_requests:
+            self._cache_stages["conditional"] = ConditionalStage()
+            stages.append(self._cache_stages["conditional"])
+        stages.append(RetryStage(self._retry_policy, timeout_print))
+        stages.append(self._rate_limit)
+        self._engine = RequestEngine(self._transport, stages, hooks or Hooks())
+
+        # Metrics (collected from the engine's hooks)
+        self._metrics = metrics
+        if metrics is not None:
+            metrics.attach(self._engine.hooks)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    async def aclose(self):
+        """
+        Closes the underlying connection pool. This is called
+        automatically when the client is used as an
+        'async with' context manager!
+        (Closing a 'raw' view does nothing, as it borrows this client's pool)
+        """
+
+        if self._raw:
+            return
+
+        await self._engine.aclose()
+
+    async def _request(self,
+                       endpoint: str,
+                       url: str,
+                       params: dict | None = None,
+                       retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        request = Request(endpoint, url, params or {}, retry_delays=retry_delays,
+                          options={"decode": False} if self._raw else {})
+        response = await self._engine.send_async(request)
+        return response.content if self._raw else response.data
+
+    def _check_decoded(self, method: str) -> None:
+        if self._raw:
+            raise ValueError(
+                f"'{method}' works with decoded results, so it is not available on 'raw'."
+            )
+
+    @staticmethod
+    async def _fan_out(calls: list, max_concurrency: int) -> list:
+        # Awaits the (coroutine function, kwargs) calls concurrently, returning their results in order
+        semaphore = Semaphore(max_concurrency)
+
+        async def run(function, kwargs):
+            async with semaphore:
+                return await function(**kwargs)
+
+        return await gather(*(run(function, kwargs) for function, kwargs in calls))
+
+    @property
+    def cache_stats(self) -> dict:
+        """
+        The hit, miss and coalesced request counts of each configured
+        cache, e.g. {'memory': {'hits': 10, 'misses': 2, 'coalesced': 3}}
+        (and the revalidated/modified counts of conditional requests)
+        """
+
+        return {name: dict(stage.stats) for name, stage in self._cache_stages.items()}
+
+    @property
+    def hooks(self) -> Hooks:
+        """
+        The Hooks registry of this client, e.g. client.hooks.on("retry", callback)
+        """
+
+        return self._engine.hooks
+
+    @property
+    def metrics(self) -> Metrics | None:
+        """
+        The Metrics collector given to this client, if any.
+        """
+
+        return self._metrics
+
+    @property
+    def typed(self) -> TypedClient:
+        """
+        A view of this client whose methods return typed, slotted models
+        (e.g. APOD, NEO or CME) instead of plain dicts! Numeric and date
+        fields are parsed once, and nested data is only decoded when used.
+        (e.g. client.typed.neows_lookup(3542519).close_approaches)
+        """
+
+        return TypedClient(self)
+
+    @property
+    def raw(self) -> "AsyncNASAClient":
+        """
+        A view of this client whose methods return the undecoded response
+        body (bytes) instead of decoded JSON, so payloads can be forwarded
+        without being parsed and re-serialized! The view shares its connection
+        pool, caches and rate limit tracking with this client, so closing the
+        view does nothing (only this client closes them).
+        (Methods which merge results, such as 'neows_feed_range', are not available.)
+        """
+
+        view = copy(self)
+        view._raw = True
+        return view
+
+    async def get_headers(self,
+                          remaining_amount: bool | None = True,
+                          total_amount: bool | None = True,
+                          use_last_response: bool | None = False) -> dict:
+        """
+        Asynchronous version of NASAClient.get_headers! Retrieves
+        the X-RateLimit HTTP headers for the current API key as a dict.
+
+        :param remaining_amount: Whether to retrieve the
+            number of remaining requests. This defaults to True.
+
+        :param total_amount: Whether to retrieve the total
+            number of requests. This defaults to True.
+
+        :param use_last_response: Whether to read the headers from the
+            last api.nasa.gov response instead of making a new request.
+            This defaults to False.
+        """
+
+        if not remaining_amount and not total_amount:
+            raise TypeError(
+                "Both remaining_amount and total_amount cannot be False."
+            )
+
+        if not use_last_response:
+            request = Request("get_headers",
+                              f"{self._base_nasa_url}/neo/rest/v1/neo/2001980",
+                              {"api_key": self._api_key},
+                              check_status=False,
+                              options={"decode": False})
+            await self._engine.send_async(request)
+
+        headers = {}
+        if remaining_amount:
+            headers["rate_limit_remaining"] = self._rate_limit.remaining_header
+        if total_amount:
+            headers["rate_limit_total"] = self._rate_limit.limit_header
+
+        return headers
+
+    async def stream(self,
+                     url: str,
+                     headers: dict | None = None,
+                     endpoint: str | None = "stream",
+                     chunk_size: int | None = 65536,
+                     check_status: bool | None = True,
+                     retry_delays: list[float] | RetryPolicy | None = None) -> Response:
+        """
+        Sends a streamed GET request to any URL (such as an APOD image)
+        through this client's connection pool, retries and hooks, returning
+        the Response without reading its body. The body is read from
+        'response.chunks', and the response must be closed via 'aclose'!
+
+        :param url: The URL to request.
+
+        :param headers: Any extra request headers (e.g. a Range).
+            This defaults to None.
+
+        :param endpoint: The name the request is grouped under by hooks and Metrics.
+            This defaults to "stream".
+
+        :param chunk_size: The size (in bytes) of the chunks of 'response.chunks'.
+            This defaults to 65536.
+
+        :param check_status: Whether 4xx and 5xx responses raise an HTTPError.
+            This defaults to True.
+
+        :param retry_delays: Overrides the client's default retry delays.
+            This defaults to None.
+        """
+
+        request = Request(endpoint, url, headers=headers or {}, retry_delays=retry_delays,
+                          check_status=check_status, stream=True, options={"chunk_size": chunk_size})
+        return await self._engine.send_async(request)
+
+    # Astronomy Picture of the Day API ( APOD )
+    async def apod(self,
+                   date: str | None = None,
+                   start_date: str | None = None,
+                   end_date: str | None = None,
+                   count: int | None = None,
+                   thumbs: bool | None = None,
+                   retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.apod! Retrieves the
+        Astronomy Picture of the Day imagery and metadata.
+        All parameters behave the same as in NASAClient.apod.
+        """
+
+        url = f"{self._base_nasa_url}/planetary/apod"
+        params = {"api_key": self._api_key}
+
+        if date:
+            params["date"] = date
+        if start_date:
+            params["start_date"] = start_date
+        if end_date:
+            params["end_date"] = end_date
+        if count:
+            params["count"] = str(count)
+        if thumbs:
+            params["thumbs"] = str(thumbs)
+
+        return await self._request("apod", url, params, retry_delays)
+
+    # Near Earth Object Web Service ( NeoWs )
+    async def neows_feed(self,
+                         start_date: str | None = None,
+                         end_date: str | None = None,
+                         retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.neows_feed! Retrieves a list
+        of Asteroids based on their closest approach date to Earth.
+        All parameters behave the same as in NASAClient.neows_feed.
+        """
+
+        url = f"{self._base_nasa_url}/neo/rest/v1/feed"
+        params = {"api_key": self._api_key}
+
+        if start_date:
+            params["start_date"] = start_date
+        if end_date:
+            params["end_date"] = end_date
+
+        return await self._request("neows_feed", url, params, retry_delays)
+
+    async def neows_feed_range(self,
+                               start_date: str,
+                               end_date: str,
+                               max_concurrency: int | None = 4,
+                               retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.neows_feed_range! Retrieves the
+        Asteroids closest approaching Earth within a date range of any length,
+        by requesting seven-day windows concurrently and merging the results.
+
+        :param max_concurrency: The maximum number of windows requested at once.
+            This defaults to 4.
+        """
+
+        self._check_decoded("neows_feed_range")
+
+        calls = [
+            (self.neows_feed, {"start_date": start, "end_date": end, "retry_delays": retry_delays})
+            for start, end in split_date_range(start_date, end_date, 7)
+        ]
+
+        return merge_neows_feeds(await self._fan_out(calls, max_concurrency))
+
+    async def neows_lookup(self,
+                           asteroid_id: int,
+                           retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.neows_lookup! Looks up a specific
+        asteroid based on its NASA JPL small body (SPK-ID) ID.
+        All parameters behave the same as in NASAClient.neows_lookup.
+        """
+
+        url = f"{self._base_nasa_url}/neo/rest/v1/neo/{asteroid_id}"
+        params = {"api_key": self._api_key}
+
+        return await self._request("neows_lookup", url, params, retry_delays)
+
+    async def neows_lookup_many(self,
+                                asteroid_ids,
+                                max_concurrency: int | None = 8,
+                                on_error: str | None = "collect",
+                                retry_delays: list[float] | RetryPolicy | None = None):
+        """
+        Asynchronous version of NASAClient.neows_lookup_many! Looks up many
+        Asteroids at once (via 'async for'), yielding (asteroid_id, data, error)
+        tuples as soon as each lookup finishes.
+        All parameters behave the same as in NASAClient.neows_lookup_many.
+        """
+
+        if on_error not in ("collect", "skip", "raise"):
+            raise ValueError(
+                f"on_error must be 'collect', 'skip' or 'raise', not {on_error!r}."
+            )
+
+        def unique(ids):
+            # IDs are compared as strings, so 2001980 and "2001980" are only looked up once
+            seen = set()
+            for asteroid_id in ids:
+                if str(asteroid_id) not in seen:
+                    seen.add(str(asteroid_id))
+                    yield asteroid_id
+
+        ids = unique(asteroid_ids)
+        in_flight = {}
+        try:
+            for asteroid_id in islice(ids, max_concurrency):
+                in_flight[create_task(self.neows_lookup(asteroid_id, retry_delays))] = asteroid_id
+
+            while in_flight:
+                done, _ = await wait(in_flight, return_when=FIRST_COMPLETED)
+                for task in done:
+                    asteroid_id = in_flight.pop(task)
+
+                    for next_id in islice(ids, 1):
+                        in_flight[create_task(self.neows_lookup(next_id, retry_delays))] = next_id
+
+                    error = task.exception()
+                    if error is None:
+                        yield asteroid_id, task.result(), None
+                    elif on_error == "raise":
+                        raise error
+                    elif on_error == "collect":
+                        yield asteroid_id, None, error
+
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    async def neows_browse(self,
+                           page: int | None = None,
+                           size: int | None = None,
+                           retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.neows_browse!
+        Browses the overall Asteroid data-set.
+        All parameters behave the same as in NASAClient.neows_browse.
+        """
+
+        url = f"{self._base_nasa_url}/neo/rest/v1/neo/browse"
+        params = {"api_key": self._api_key}
+
+        if page:
+            params["page"] = str(page)
+        if size:
+            params["size"] = str(size)
+
+        return await self._request("neows_browse", url, params, retry_delays)
+
+    async def iter_neows_browse(self,
+                                page_size: int | None = 20,
+                                start_page: int | None = 0,
+                                prefetch: int | None = 2,
+                                retry_delays: list[float] | RetryPolicy | None = None):
+        """
+        Asynchronous version of NASAClient.iter_neows_browse! Iterates over
+        the overall Asteroid data-set one Asteroid at a time (via 'async for'),
+        requesting the next 'prefetch' pages in the background.
+        """
+
+        self._check_decoded("iter_neows_browse")
+
+        def fetch(page):
+            return create_task(self.neows_browse(page=page, size=page_size, retry_delays=retry_delays))
+
+        pending = deque()
+        try:
+            data = await self.neows_browse(page=start_page, size=page_size, retry_delays=retry_delays)
+            total_pages = data["page"]["total_pages"]
+            next_page = start_page + 1
+
+            while True:
+                while len(pending) < max(prefetch, 1) and next_page < total_pages:
+                    pending.append(fetch(next_page))
+                    next_page += 1
+
+                for asteroid in data["near_earth_objects"]:
+                    yield asteroid
+
+                if not pending or not data.get("links", {}).get("next"):
+                    break
+                data = await pending.popleft()
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+    # Space Weather Database Of Notifications, Knowledge, Information ( DONKI )
+    async def _donki(self,
+                     name: str,
+                     endpoint: str,
+                     start_date: str | None,
+                     end_date: str | None,
+                     retry_delays: list[float] | None,
+                     **extra_params) -> dict:
+        url = f"{self._base_nasa_url}/DONKI/{endpoint}"
+        params = {"api_key": self._api_key}
+
+        if start_date:
+            params["startDate"] = start_date
+        if end_date:
+            params["endDate"] = end_date
+        for key, value in extra_params.items():
+            if value:
+                params[key] = value
+
+        return await self._request(name, url, params, retry_delays)
+
+    async def donki_cme(self,
+                        start_date: str | None = None,
+                        end_date: str | None = None,
+                        retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.donki_cme! Retrieves basic
+        DONKI Coronal Mass Injection analyses (CMEs) within a specific time frame.
+        """
+
+        return await self._donki("donki_cme", "CME", start_date, end_date, retry_delays)
+
+    async def donki_cme_analysis(self,
+                                 start_date: str | None = None,
+                                 end_date: str | None = None,
+                                 most_accurate_only: bool = True,
+                                 complete_entry_only: bool = True,
+                                 speed: int = 0,
+                                 half_angle: int = 0,
+                                 catalog: str | None = None,
+                                 keyword: str | None = None,
+                                 retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.donki_cme_analysis! Retrieves more
+        robust analyses from DONKI Coronal Mass Injections (CMEs) within a specific
+        time frame, accuracy, catalog, and/or keyword.
+        All parameters behave the same as in NASAClient.donki_cme_analysis.
+        """
+
+        return await self._donki("donki_cme_analysis", "CMEAnalysis", start_date, end_date, retry_delays,
+                                 most_accurate_only=str(most_accurate_only) if most_accurate_only else None,
+                                 complete_entry_only=str(complete_entry_only) if complete_entry_only else None,
+                                 speed=str(speed) if speed else None,
+                                 half_angle=str(half_angle) if half_angle else None,
+                                 catalog=catalog,
+                                 keyword=keyword)
+
+    async def donki_gst(self,
+                        start_date: str | None = None,
+                        end_date: str | None = None,
+                        retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.donki_gst! Retrieves DONKI
+        Geomagnetic Storm analyses (GSTs) within a specific time frame.
+        """
+
+        return await self._donki("donki_gst", "GST", start_date, end_date, retry_delays)
+
+    async def donki_ips(self,
+                        start_date: str | None = None,
+                        end_date: str | None = None,
+                        location: str | None = None,
+                        catalog: str | None = None,
+                        retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.donki_ips! Retrieves DONKI
+        Interplanetary Shock analyses (IPSs) within a specific time frame,
+        location, and/or catalog.
+        """
+
+        return await self._donki("donki_ips", "IPS", start_date, end_date, retry_delays,
+                                 location=location,
+                                 catalog=catalog)
+
+    async def donki_flr(self,
+                        start_date: str | None = None,
+                        end_date: str | None = None,
+                        retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.donki_flr! Retrieves DONKI
+        Solar Flare analyses (FLRs) within a specific time frame.
+        """
+
+        return await self._donki("donki_flr", "FLR", start_date, end_date, retry_delays)
+
+    async def donki_sep(self,
+                        start_date: str | None = None,
+                        end_date: str | None = None,
+                        retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.donki_sep! Retrieves DONKI
+        Solar Energetic Particle analyses (SEP) within a specific time frame.
+        """
+
+        return await self._donki("donki_sep", "SEP", start_date, end_date, retry_delays)
+
+    async def donki_mpc(self,
+                        start_date: str | None = None,
+                        end_date: str | None = None,
+                        retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.donki_mpc! Retrieves DONKI
+        Magnetopause Crossing analyses (MPC) within a specific time frame.
+        """
+
+        return await self._donki("donki_mpc", "MPC", start_date, end_date, retry_delays)
+
+    async def donki_rbe(self,
+                        start_date: str | None = None,
+                        end_date: str | None = None,
+                        retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.donki_rbe! Retrieves DONKI
+        Radiation Belt Enhancement analyses (RBE) within a specific time frame.
+        """
+
+        return await self._donki("donki_rbe", "RBE", start_date, end_date, retry_delays)
+
+    async def donki_hss(self,
+                        start_date: str | None = None,
+                        end_date: str | None = None,
+                        retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.donki_hss! Retrieves DONKI
+        Hight Speed Stream analyses (HSS) within a specific time frame.
+        """
+
+        return await self._donki("donki_hss", "HSS", start_date, end_date, retry_delays)
+
+    async def donki_wsa_es(self,
+                           start_date: str | None = None,
+                           end_date: str | None = None,
+                           retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.donki_wsa_es! Retrieves DONKI
+        WSA+EnlilSimulation analyses within a specific time frame.
+        """
+
+        return await self._donki("donki_wsa_es", "WSAEnlilSimulations", start_date, end_date, retry_delays)
+
+    async def donki_notifications(self,
+                                  start_date: str | None = None,
+                                  end_date: str | None = None,
+                                  notification_type: str | None = None,
+                                  retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.donki_notifications! Retrieves DONKI
+        Notifications within a specific time frame and/or a notification type.
+        """
+
+        return await self._donki("donki_notifications", "notifications", start_date, end_date, retry_delays,
+                                 type=notification_type)
+
+    async def donki_snapshot(self,
+                             start_date: str | None = None,
+                             end_date: str | None = None,
+                             kinds: list[str] | None = None,
+                             max_concurrency: int | None = None,
+                             retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.donki_snapshot! Retrieves multiple
+        DONKI event types within the same time frame concurrently, returning
+        a dict keyed by event type.
+
+        :param max_concurrency: The maximum number of requests made at once.
+            This defaults to the number of event types.
+        """
+
+        kinds = list(kinds or self._donki_kinds)
+        for kind in kinds:
+            if kind not in self._donki_kinds:
+                raise ValueError(
+                    f"Unknown DONKI event type {kind!r}. (Options: {', '.join(self._donki_kinds)})"
+                )
+
+        calls = [
+            (getattr(self, f"donki_{kind}"),
+             {"start_date": start_date, "end_date": end_date, "retry_delays": retry_delays})
+            for kind in kinds
+        ]
+
+        return dict(zip(kinds, await self._fan_out(calls, max_concurrency or len(kinds))))
+
+    async def donki_range(self,
+                          kind: str,
+                          start_date: str,
+                          end_date: str,
+                          window_days: int | None = 30,
+                          max_concurrency: int | None = 4,
+                          retry_delays: list[float] | RetryPolicy | None = None,
+                          **params) -> list:
+        """
+        Asynchronous version of NASAClient.donki_range! Retrieves one DONKI
+        event type over a long time frame, by requesting smaller windows
+        concurrently and merging them into one de-duplicated list.
+
+        :param max_concurrency: The maximum number of windows requested at once.
+            This defaults to 4.
+        """
+
+        self._check_decoded("donki_range")
+
+        if kind not in self._donki_kinds:
+            raise ValueError(
+                f"Unknown DONKI event type {kind!r}. (Options: {', '.join(self._donki_kinds)})"
+            )
+        if window_days < 1:
+            raise ValueError(
+                f"window_days must be at least 1, not {window_days}."
+            )
+
+        calls = [
+            (getattr(self, f"donki_{kind}"),
+             {"start_date": start, "end_date": end, "retry_delays": retry_delays, **params})
+            for start, end in split_date_range(start_date, end_date, window_days - 1)
+        ]
+
+        return merge_donki_events(await self._fan_out(calls, max_concurrency))
+
+    # The Earth Observatory Natural Event Tracker (EONET)
+    @staticmethod
+    def _eonet_params(source, category, status, limit, days, start_date,
+                      end_date, mag_id, mag_min, mag_max, bounding_box) -> dict:
+        params = {}
+
+        if source:
+            params["source"] = source
+        if category:
+            params["category"] = category
+        if status:
+            params["status"] = status
+        if limit:
+            params["limit"] = limit
+        if days:
+            params["days"] = days
+        if start_date:
+            params["start"] = start_date
+        if end_date:
+            params["end"] = end_date
+        if mag_id:
+            params["magID"] = mag_id
+        if mag_min:
+            params["magMin"] = mag_min
+        if mag_max:
+            params["magMax"] = mag_max
+        if bounding_box:
+            values = ",".join(map(str, bounding_box))
+            params["bbox"] = values
+
+        return params
+
+    async def eonet_events(self,
+                           source: str | None = None,
+                           category: str | None = None,
+                           status: str | None = None,
+                           limit: int | None = None,
+                           days: int | None = None,
+                           start_date: str | None = None,
+                           end_date: str | None = None,
+                           mag_id: str | None = None,
+                           mag_min: float | None = None,
+                           mag_max: float | None = None,
+                           bounding_box: list[float] | None = None,
+                           retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.eonet_events! Retrieves Earth
+        Observatory Natural Event Tracker (EONET) events.
+        All parameters behave the same as in NASAClient.eonet_events.
+        """
+
+        url = f"{self._base_eonet_url}/events"
+        params = self._eonet_params(source, category, status, limit, days, start_date,
+                                    end_date, mag_id, mag_min, mag_max, bounding_box)
+
+        return await self._request("eonet_events", url, params, retry_delays)
+
+    async def eonet_events_geojson(self,
+                                   source: str | None = None,
+                                   category: str | None = None,
+                                   status: str | None = None,
+                                   limit: int | None = None,
+                                   days: int | None = None,
+                                   start_date: str | None = None,
+                                   end_date: str | None = None,
+                                   mag_id: str | None = None,
+                                   mag_min: float | None = None,
+                                   mag_max: float | None = None,
+                                   bounding_box: list[float] | None = None,
+                                   retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.eonet_events_geojson! Retrieves Earth
+        Observatory Natural Event Tracker (EONET) GeoJSON events.
+        All parameters behave the same as in NASAClient.eonet_events_geojson.
+        """
+
+        url = f"{self._base_eonet_url}/events/geojson"
+        params = self._eonet_params(source, category, status, limit, days, start_date,
+                                    end_date, mag_id, mag_min, mag_max, bounding_box)
+
+        return await self._request("eonet_events_geojson", url, params, retry_delays)
+
+    async def iter_eonet_events(self,
+                                source: str | None = None,
+                                category: str | None = None,
+                                status: str | None = None,
+                                limit: int | None = None,
+                                days: int | None = None,
+                                start_date: str | None = None,
+                                end_date: str | None = None,
+                                mag_id: str | None = None,
+                                mag_min: float | None = None,
+                                mag_max: float | None = None,
+                                bounding_box: list[float] | None = None,
+                                geojson: bool | None = False,
+                                chunk_size: int | None = 65536,
+                                retry_delays: list[float] | RetryPolicy | None = None):
+        """
+        Asynchronous version of NASAClient.iter_eonet_events! Streams EONET
+        events, yielding each one as soon as it has been received and parsed.
+        All parameters behave the same as in NASAClient.iter_eonet_events.
+        """
+
+        url = f"{self._base_eonet_url}/events/geojson" if geojson else f"{self._base_eonet_url}/events"
+        params = self._eonet_params(source, category, status, limit, days, start_date,
+                                    end_date, mag_id, mag_min, mag_max, bounding_box)
+
+        request = Request("iter_eonet_events", url, params, retry_delays=retry_delays,
+                          stream=True, options={"chunk_size": chunk_size})
+        response = await self._engine.send_async(request)
+        try:
+            async for event in aiter_array(response.chunks, "features" if geojson else "events"):
+                yield event
+        finally:
+            await response.aclose()
+
+    async def eonet_categories(self,
+                               category: str | None = None,
+                               source: str | None = None,
+                               status: str | None = None,
+                               limit: int | None = None,
+                               days: int | None = None,
+                               start_date: str | None = None,
+                               end_date: str | None = None,
+                               retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.eonet_categories! Retrieves the
+        EONET categories, or the events of a single category.
+        All parameters behave the same as in NASAClient.eonet_categories.
+        """
+
+        url = f"{self._base_eonet_url}/categories"
+        params = {}
+
+        if category:
+            url = f"{self._base_eonet_url}/categories/{category}"
+        if source:
+            params["source"] = source
+        if status:
+            params["status"] = status
+        if limit:
+            params["limit"] = limit
+        if days:
+            params["days"] = days
+        if start_date:
+            params["start"] = start_date
+        if end_date:
+            params["end"] = end_date
+
+        return await self._request("eonet_categories", url, params, retry_delays)
+
+    async def eonet_layers(self,
+                           category: str,
+                           retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Asynchronous version of NASAClient.eonet_layers! Retrieves the
+        imagery layers mapped to an EONET category.
+        """
+
+        url = f"{self._base_eonet_url}/layers/{category}"
+
+        return await self._request("eonet_layers", url, retry_delays=retry_delays)
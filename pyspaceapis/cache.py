@@ -0,0 +1,507 @@
+import json
+import sqlite3
+from asyncio import get_running_loop, shield, to_thread
+from collections import OrderedDict
+from datetime import date, datetime, timedelta, timezone
+from os import path as os_path
+from threading import Event, Lock
+from time import monotonic, time
+
+from requests.structures import CaseInsensitiveDict
+
+from .engine import Request, Response, Stage
+
+
+# Cache TTLs (in seconds) for each endpoint family, None meaning the entry never expires
+TTLS = {
+    # Closed past date ranges (e.g. yesterday's APOD, or DONKI data from weeks ago)
+    "closed": None,
+    # Reference data which rarely changes (e.g. NeoWs lookups and EONET layers)
+    "reference": 7 * 24 * 60 * 60,
+    # Data for the current day (e.g. today's APOD or NeoWs feed)
+    "today": 60 * 60,
+    # Recent DONKI ranges, which can still receive new or revised analyses
+    "recent": 15 * 60,
+    # Open EONET events, which keep receiving new geometry
+    "open": 5 * 60,
+}
+
+# DONKI ranges ending at least this many days ago are treated as closed
+DONKI_SETTLE_DAYS = 30
+
+
+def _parse_date(value) -> date | None:
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def cache_key(request: Request) -> str:
+    """
+    Builds the cache key of a request from its method, URL and
+    sorted parameters. The API key is left out, so cached responses
+    are shared between API keys and never stored alongside one.
+    """
+
+    params = sorted((key, str(value)) for key, value in request.params.items() if key != "api_key")
+    return json.dumps([request.method, request.url, params], separators=(",", ":"))
+
+
+def default_ttl(request: Request) -> float | None:
+    """
+    Picks the TTL of a request based on its endpoint family and dates.
+    Returns None for responses which never change, and 0 for
+    responses which should not be cached at all.
+    """
+
+    endpoint = request.endpoint
+    params = request.params
+    today = datetime.now(timezone.utc).date()
+
+    if endpoint == "apod":
+        if "count" in params:
+            # Random images are different every time
+            return 0
+        last = _parse_date(params.get("date") or params.get("end_date") or today)
+        return TTLS["closed"] if last and last < today else TTLS["today"]
+
+    if endpoint == "neows_feed":
+        start = _parse_date(params.get("start_date") or today)
+        last = _parse_date(params.get("end_date")) or (start and start + timedelta(days=7))
+        return TTLS["closed"] if last and last < today else TTLS["today"]
+
+    if endpoint in ("neows_lookup", "neows_browse", "eonet_layers"):
+        return TTLS["reference"]
+
+    if endpoint.startswith("donki_"):
+        last = _parse_date(params.get("endDate") or today)
+        settled = today - timedelta(days=DONKI_SETTLE_DAYS)
+        return TTLS["closed"] if last and last < settled else TTLS["recent"]
+
+    if endpoint in ("eonet_events", "eonet_events_geojson"):
+        last = _parse_date(params.get("end"))
+        if params.get("status") == "closed" and last and last < today:
+            return TTLS["reference"]
+        return TTLS["open"]
+
+    if endpoint == "eonet_categories":
+        return TTLS["open"] if request.url.rstrip("/").split("/")[-1] != "categories" else TTLS["reference"]
+
+    if endpoint == "get_headers":
+        return 0
+
+    return TTLS["recent"]
+
+
+class DiskCache:
+    """
+    A persistent response cache stored in a single SQLite file.
+    Once the stored responses grow past 'max_size' bytes, the least
+    recently used entries are evicted first!
+
+    Cache hits only note their access time in memory, which is written
+    in batches (of up to 'touch_batch' entries, at least every 'touch_interval'
+    seconds, and whenever a response is stored or the cache is closed),
+    rather than committing to disk on every hit.
+
+    :param path: The path of the SQLite cache file.
+        This defaults to "pyspaceapis_cache.sqlite".
+
+    :param max_size: The maximum total size (in bytes) of the cached
+        response bodies. This defaults to 256 MB.
+
+    :param touch_batch: The number of entries whose access times are written at once.
+        This defaults to 256.
+
+    :param touch_interval: The maximum number of seconds an access time is held in memory.
+        This defaults to 5.
+    """
+
+    # Reads and writes the disk, so asynchronous clients use it from worker threads
+    blocking = True
+
+    def __init__(self,
+                 path: str | None = "pyspaceapis_cache.sqlite",
+                 max_size: int | None = 256 * 1024 * 1024,
+                 touch_batch: int | None = 256,
+                 touch_interval: float | None = 5):
+        self.path = os_path.expanduser(path)
+        self.max_size = max_size
+        self.touch_batch = touch_batch
+        self.touch_interval = touch_interval
+
+        self._lock = Lock()
+        # The access times of recent hits, which are yet to be written
+        self._touched = {}
+        self._touched_since = 0.0
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, status INTEGER, headers TEXT, content BLOB, url TEXT, "
+            "expires_at REAL, accessed_at REAL, size INTEGER)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+        )
+        self._connection.commit()
+
+    def get(self, key: str) -> Response | None:
+        now = time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status, headers, content, url, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            status, headers, content, url, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._connection.commit()
+                return None
+
+            if not self._touched:
+                self._touched_since = monotonic()
+            self._touched[key] = now
+            if (len(self._touched) >= self.touch_batch
+                    or monotonic() - self._touched_since >= self.touch_interval):
+                self._flush_touched()
+                self._connection.commit()
+
+        return Response(status_code=status,
+                        headers=CaseInsensitiveDict(json.loads(headers)),
+                        content=content,
+                        url=url,
+                        reason="OK")
+
+    def set(self, key: str, response: Response, ttl: float | None) -> None:
+        now = time()
+        expires_at = None if ttl is None else now + ttl
+        headers = json.dumps(dict(response.headers))
+        # Stores the URL without its query string, so the API key is never written to disk
+        url = response.request.url if response.request else response.url.split("?")[0]
+
+        with self._lock:
+            self._touched.pop(key, None)
+            # Eviction goes by access time, so it has to see every hit so far
+            self._flush_touched()
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, response.status_code, headers, response.content, url,
+                 expires_at, now, len(response.content))
+            )
+            self._evict()
+            self._connection.commit()
+
+    def _flush_touched(self) -> None:
+        if self._touched:
+            self._connection.executemany("UPDATE responses SET accessed_at = ? WHERE key = ?",
+                                         [(accessed_at, key) for key, accessed_at in self._touched.items()])
+            self._touched.clear()
+
+    def _evict(self) -> None:
+        total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_size:
+            return
+
+        rows = self._connection.execute("SELECT key, size FROM responses ORDER BY accessed_at")
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_size:
+                break
+            evicted.append((key,))
+            total -= size
+
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._touched.clear()
+            self._connection.execute("DELETE FROM responses")
+            self._connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_touched()
+            self._connection.commit()
+            self._connection.close()
+
+
+class MemoryCache:
+    """
+    An in-process response cache, bounded to 'max_entries' responses
+    with the least recently used ones evicted first. Every entry expires
+    after its own TTL, which can be capped via 'max_ttl'.
+
+    Cached results are shared between callers, so they should
+    be treated as read-only!
+
+    :param max_entries: The maximum number of cached responses.
+        This defaults to 1024.
+
+    :param max_ttl: The maximum number of seconds any entry is kept for.
+        This defaults to None (Only the per-endpoint TTLs apply).
+    """
+
+    blocking = False
+
+    def __init__(self,
+                 max_entries: int | None = 1024,
+                 max_ttl: float | None = None):
+        self.max_entries = max_entries
+        self.max_ttl = max_ttl
+
+        self._lock = Lock()
+        self._entries = OrderedDict()
+
+    def get(self, key: str) -> Response | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            response, expires_at = entry
+            if expires_at is not None and expires_at <= monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: Response, ttl: float | None) -> None:
+        if self.max_ttl is not None:
+            ttl = self.max_ttl if ttl is None else min(ttl, self.max_ttl)
+        expires_at = None if ttl is None else monotonic() + ttl
+
+        with self._lock:
+            self._entries[key] = (response, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _Flight:
+    # A request in progress, which other identical requests wait on
+    __slots__ = ("event", "response", "error")
+
+    def __init__(self):
+        self.event = Event()
+        self.response = None
+        self.error = None
+
+
+class CacheStage(Stage):
+    """
+    Serves successful responses from a cache backend (e.g. DiskCache
+    or MemoryCache) and stores new ones with the TTL picked by 'ttl',
+    which defaults to the per-endpoint TTLs of 'default_ttl'.
+
+    Identical requests which miss the cache at the same time are
+    coalesced, so only one of them is actually sent and the others
+    wait for its result. The 'stats' dict counts cache hits, misses,
+    and coalesced requests.
+
+    'decoded' is True for a stage outside the DecodeStage, whose entries
+    hold decoded data and are therefore kept apart from undecoded ones.
+
+    Asynchronous requests use backends whose 'blocking' attribute is True
+    (e.g. DiskCache, and any backend without the attribute) from worker
+    threads, so the event loop never waits on the disk.
+    """
+
+    def __init__(self, backend, ttl=default_ttl, decoded: bool = False):
+        self.backend = backend
+        self.ttl = ttl
+        self.decoded = decoded
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0}
+
+        self._lock = Lock()
+        self._in_flight = {}
+        self._in_flight_async = {}
+        self._blocking = getattr(backend, "blocking", True)
+
+    def _count(self, request: Request, counter: str) -> None:
+        with self._lock:
+            self.stats[counter] += 1
+
+        if counter != "misses":
+            request.emit("cache_hit", cache=type(self.backend).__name__, coalesced=counter == "coalesced")
+
+    def _key(self, request: Request) -> tuple[str | None, float | None]:
+        ttl = self.ttl(request)
+        if ttl == 0 or request.stream or not request.options.get("cache", True):
+            return None, ttl
+
+        key = cache_key(request)
+        if self.decoded and not request.options.get("decode", True):
+            # Undecoded responses carry no 'data', so they never share an entry with decoded ones
+            key = f"raw:{key}"
+        return key, ttl
+
+    def _store(self, key: str, ttl: float | None, response: Response) -> Response:
+        if response.status_code == 200:
+            self.backend.set(key, response, ttl)
+        return response
+
+    async def _store_async(self, key: str, ttl: float | None, response: Response) -> Response:
+        if self._blocking:
+            return await to_thread(self._store, key, ttl, response)
+        return self._store(key, ttl, response)
+
+    def handle(self, request: Request, call_next) -> Response:
+        key, ttl = self._key(request)
+        if key is None:
+            return call_next(request)
+
+        cached = self.backend.get(key)
+        if cached is not None:
+            self._count(request, "hits")
+            return cached
+
+        with self._lock:
+            flight = self._in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._in_flight[key] = _Flight()
+
+        if not leader:
+            flight.event.wait()
+            self._count(request, "coalesced")
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
+
+        try:
+            # Another request may have filled the cache right before this one took the lead
+            cached = self.backend.get(key)
+            if cached is not None:
+                self._count(request, "hits")
+                flight.response = cached
+            else:
+                self._count(request, "misses")
+                flight.response = self._store(key, ttl, call_next(request))
+            return flight.response
+
+        except BaseException as e:
+            flight.error = e
+            raise
+
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            flight.event.set()
+
+    async def handle_async(self, request: Request, call_next) -> Response:
+        key, ttl = self._key(request)
+        if key is None:
+            return await call_next(request)
+
+        if not self._blocking:
+            cached = self.backend.get(key)
+            if cached is not None:
+                self._count(request, "hits")
+                return cached
+
+        future = self._in_flight_async.get(key)
+        if future is not None:
+            self._count(request, "coalesced")
+            return await shield(future)
+
+        future = self._in_flight_async[key] = get_running_loop().create_future()
+        try:
+            if self._blocking:
+                # Identical requests wait on this lookup too, rather than each reading the disk
+                cached = await to_thread(self.backend.get, key)
+                if cached is not None:
+                    self._count(request, "hits")
+                    future.set_result(cached)
+                    return cached
+
+            self._count(request, "misses")
+            response = await self._store_async(key, ttl, await call_next(request))
+            future.set_result(response)
+            return response
+
+        except BaseException as e:
+            future.set_exception(e)
+            # Marks the exception as retrieved when no other request was waiting on it
+            future.exception()
+            raise
+
+        finally:
+            del self._in_flight_async[key]
+
+
+class ConditionalStage(Stage):
+    """
+    Stores the ETag and Last-Modified validators of responses along
+    with their bodies, and sends them back as If-None-Match and
+    If-Modified-Since headers on later identical requests. When the
+    server answers with 304 Not Modified, the stored response is served
+    instead, which (being already decoded) skips decoding as well!
+
+    Up to 'max_entries' responses are stored, with the least
+    recently used ones evicted first.
+    """
+
+    def __init__(self, max_entries: int | None = 256):
+        self.max_entries = max_entries
+        self.stats = {"revalidated": 0, "modified": 0}
+
+        self._lock = Lock()
+        self._entries = OrderedDict()
+
+    def _prepare(self, request: Request) -> tuple[str, Response | None]:
+        key = cache_key(request)
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is not None:
+                self._entries.move_to_end(key)
+
+        if stored is not None:
+            if "ETag" in stored.headers:
+                request.headers["If-None-Match"] = stored.headers["ETag"]
+            if "Last-Modified" in stored.headers:
+                request.headers["If-Modified-Since"] = stored.headers["Last-Modified"]
+
+        return key, stored
+
+    def _process(self, request: Request, key: str, stored: Response | None, response: Response) -> Response:
+        if response.status_code == 304 and stored is not None:
+            with self._lock:
+                self.stats["revalidated"] += 1
+            request.emit("cache_hit", cache="conditional", coalesced=False)
+            return stored
+
+        if response.status_code == 200 and ("ETag" in response.headers or "Last-Modified" in response.headers):
+            with self._lock:
+                if stored is not None:
+                    self.stats["modified"] += 1
+                self._entries[key] = response
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+        return response
+
+    def handle(self, request: Request, call_next) -> Response:
+        if request.stream:
+            return call_next(request)
+
+        key, stored = self._prepare(request)
+        return self._process(request, key, stored, call_next(request))
+
+    async def handle_async(self, request: Request, call_next) -> Response:
+        if request.stream:
+            return await call_next(request)
+
+        key, stored = self._prepare(request)
+        return self._process(request, key, stored, await call_next(request))
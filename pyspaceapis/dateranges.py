@@ -0,0 +1,97 @@
+import json
+from datetime import date, timedelta
+
+
+def to_date(value: str | date) -> date:
+    """
+    Converts a YYYY-MM-DD string (or a date) into a date.
+    """
+
+    if isinstance(value, date):
+        return value
+    return date.fromisoformat(value)
+
+
+def split_date_range(start_date: str | date,
+                     end_date: str | date,
+                     window_days: int) -> list[tuple[str, str]]:
+    """
+    Splits the (inclusive) date range between 'start_date' and 'end_date'
+    into consecutive windows, where the end date of each window is at most
+    'window_days' days after its start date. Returns a list of
+    (start_date, end_date) pairs as YYYY-MM-DD strings.
+    """
+
+    start = to_date(start_date)
+    end = to_date(end_date)
+
+    if end < start:
+        raise ValueError(
+            f"end_date ({end}) cannot be before start_date ({start})."
+        )
+    if window_days < 0:
+        raise ValueError(
+            "window_days cannot be negative."
+        )
+
+    windows = []
+    while start <= end:
+        window_end = min(start + timedelta(days=window_days), end)
+        windows.append((start.isoformat(), window_end.isoformat()))
+        start = window_end + timedelta(days=1)
+
+    return windows
+
+
+def merge_neows_feeds(feeds: list[dict]) -> dict:
+    """
+    Merges multiple 'neows_feed' results into a single result, with
+    'near_earth_objects' combined (and sorted) by date and a combined
+    'element_count'.
+    """
+
+    near_earth_objects = {}
+    for feed in feeds:
+        for day, objects in feed.get("near_earth_objects", {}).items():
+            near_earth_objects.setdefault(day, []).extend(objects)
+
+    return {
+        "element_count": sum(len(objects) for objects in near_earth_objects.values()),
+        "near_earth_objects": dict(sorted(near_earth_objects.items()))
+    }
+
+
+# The fields which uniquely identify each type of DONKI event
+DONKI_ID_FIELDS = ("activityID", "flrID", "gstID", "sepID", "mpcID",
+                   "rbeID", "hssID", "simulationID", "messageID")
+
+
+def donki_event_id(event: dict):
+    """
+    Returns the unique ID of a DONKI event (e.g. its 'activityID' or 'flrID'),
+    falling back to the whole event for event types without an ID field.
+    """
+
+    for field in DONKI_ID_FIELDS:
+        if event.get(field):
+            return event[field]
+
+    return json.dumps(event, sort_keys=True)
+
+
+def merge_donki_events(results: list[list | None]) -> list:
+    """
+    Merges the results of multiple DONKI requests into one list,
+    leaving out events which appear in more than one result.
+    """
+
+    events = []
+    seen = set()
+    for result in results:
+        for event in result or []:
+            event_id = donki_event_id(event)
+            if event_id not in seen:
+                seen.add(event_id)
+                events.append(event)
+
+    return events
@@ -1,21 +1,226 @@
-from time import perf_counter
+import logging
+from dataclasses import dataclass, field
 from functools import wraps
+from inspect import iscoroutinefunction
+from threading import Lock
+from time import perf_counter
+
+from .metrics import LatencyHistogram
+
+logger = logging.getLogger("pyspaceapis.profile")
+
+# The phases of a request, in the order they happen
+PHASES = ("dns", "connect", "tls", "ttfb", "download", "decode")
+
+
+@dataclass
+class CallProfile:
+    """
+    The timings (in seconds) of one profiled call. 'phases' holds the
+    request phases which were measured (see PHASES), summed over retries.
+    DNS, connect and TLS only appear when a new connection was opened!
+    """
+
+    name: str
+    total: float
+    phases: dict = field(default_factory=dict)
+    error: BaseException | None = None
+
+    @property
+    def other(self) -> float:
+        """
+        The time not spent in any phase, such as retry
+        backoff, rate limit pacing and the client itself.
+        """
+
+        return max(0.0, self.total - sum(self.phases.values()))
+
+    def __str__(self) -> str:
+        phases = ", ".join(f"{phase} {self.phases[phase]:.4f}s" for phase in PHASES if phase in self.phases)
+        failed = f" [{type(self.error).__name__}]" if self.error is not None else ""
+        return f"{self.name}: {self.total:.4f}s{failed}" + (f" ({phases})" if phases else "")
 
 
-def time_this(func):
+def log_sink(profile: CallProfile) -> None:
+    """
+    Logs a CallProfile to the "pyspaceapis.profile" logger at the INFO level.
+    """
+
+    logger.info("%s", profile)
+
+
+def _timed(func, finished):
+    # Wraps a sync or async function, calling finished(elapsed, error) after every call
+    if iscoroutinefunction(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            start = perf_counter()
+            error = None
+            try:
+                return await func(*args, **kwargs)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                finished(perf_counter() - start, error)
+    else:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            error = None
+            try:
+                return func(*args, **kwargs)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                finished(perf_counter() - start, error)
+    return wrapper
+
+
+def time_this(func=None, *, sink=None):
     """
     This decorator can be used
     to count the execution time
-    of a function, then print
-    the elapsed time!
-    """
-
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        start = perf_counter()
-        result = func(*args, **kwargs)
-        end = perf_counter()
-        elapsed_time = end - start
-        print(f"\n\n(Finished in: {elapsed_time:.4f} seconds.)")
-        return result
-    return wrapper
+    of a function (sync or async),
+    then print the elapsed time!
+
+    :param sink: A callable which is given a CallProfile
+        of each call instead of printing it (e.g. log_sink).
+        This defaults to None (Printing).
+    """
+
+    if func is None:
+        return lambda function: time_this(function, sink=sink)
+
+    def finished(elapsed: float, error: BaseException | None) -> None:
+        if sink is None:
+            print(f"\n\n(Finished in: {elapsed:.4f} seconds.)")
+        else:
+            sink(CallProfile(func.__qualname__, elapsed, error=error))
+
+    return _timed(func, finished)
+
+
+class Profiler:
+    """
+    Profiles every request of the clients it is attached to, timing the
+    DNS, connect, TLS, TTFB (time to first byte), download and decode
+    phases separately, which tells whether slow calls are network-bound
+    or decode-bound! Each call's CallProfile is given to the 'sink',
+    and the phases are aggregated per endpoint (see stats and report).
+
+    :param sink: A callable which is given the CallProfile of every call,
+        or None to only aggregate them. This defaults to log_sink.
+    """
+
+    def __init__(self, sink=log_sink):
+        self.sink = sink
+
+        self._lock = Lock()
+        self._calls = {}
+        self._stats = {}
+
+    def attach(self, client) -> "Profiler":
+        """
+        Starts profiling the requests of a client (NASAClient or AsyncNASAClient).
+        """
+
+        client.hooks.on("request_start", self._request_start)
+        client.hooks.on("phase", self._phase)
+        client.hooks.on("request_end", self._request_end)
+        return self
+
+    def detach(self, client) -> None:
+        client.hooks.off("request_start", self._request_start)
+        client.hooks.off("phase", self._phase)
+        client.hooks.off("request_end", self._request_end)
+
+    def _request_start(self, request) -> None:
+        with self._lock:
+            self._calls[id(request)] = {}
+
+    def _phase(self, request, name, seconds) -> None:
+        with self._lock:
+            phases = self._calls.get(id(request))
+            if phases is not None:
+                phases[name] = phases.get(name, 0.0) + seconds
+
+    def _request_end(self, request, response, error, elapsed) -> None:
+        with self._lock:
+            phases = self._calls.pop(id(request), {})
+        self.record(CallProfile(request.endpoint, elapsed, phases, error))
+
+    def record(self, profile: CallProfile) -> None:
+        """
+        Aggregates a CallProfile and passes it on to the sink.
+        """
+
+        with self._lock:
+            histograms = self._stats.setdefault(profile.name, {})
+            timings = dict(profile.phases, total=profile.total)
+            if profile.phases:
+                timings["other"] = profile.other
+            for phase, seconds in timings.items():
+                histograms.setdefault(phase, LatencyHistogram()).record(seconds)
+
+        if self.sink is not None:
+            self.sink(profile)
+
+    def profile(self, func=None, *, name: str | None = None):
+        """
+        A decorator which profiles the total time of a function (sync or async),
+        aggregated under 'name'. This defaults to the function's name.
+        """
+
+        if func is None:
+            return lambda function: self.profile(function, name=name)
+
+        def finished(elapsed: float, error: BaseException | None) -> None:
+            self.record(CallProfile(name or func.__qualname__, elapsed, error=error))
+
+        return _timed(func, finished)
+
+    def stats(self) -> dict:
+        """
+        Returns the count, mean, p50, p95, p99 and max (in seconds) of each phase
+        of each endpoint, along with the "total" time of the calls and the "other"
+        time spent outside of the phases. e.g. stats()["donki_cme"]["decode"]["p95"]
+        """
+
+        with self._lock:
+            return {
+                name: {
+                    phase: {
+                        "count": histogram.count,
+                        "mean": histogram.total / histogram.count,
+                        "p50": histogram.percentile(50),
+                        "p95": histogram.percentile(95),
+                        "p99": histogram.percentile(99),
+                        "max": histogram.max
+                    }
+                    for phase, histogram in histograms.items()
+                }
+                for name, histograms in self._stats.items()
+            }
+
+    def report(self) -> str:
+        """
+        Returns the stats as a readable table, one block per endpoint.
+        """
+
+        lines = []
+        for name, phases in self.stats().items():
+            lines.append(f"{name} ({phases['total']['count']} calls)")
+            for phase in ("total", *PHASES, "other"):
+                if phase in phases:
+                    stat = phases[phase]
+                    lines.append(
+                        f"    {phase:<9} mean {stat['mean']:.4f}s  p50 {stat['p50']:.4f}s  "
+                        f"p95 {stat['p95']:.4f}s  p99 {stat['p99']:.4f}s  ({stat['count']} calls)"
+                    )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
@@ -0,0 +1,253 @@
+import json
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from requests.exceptions import HTTPError
+from requests.structures import CaseInsensitiveDict
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if TYPE_CHECKING:
+    # Only for annotations, as retry imports from this module
+    from .retry import RetryPolicy
+
+
+@dataclass
+class Request:
+    """
+    A single API request as it travels through the request engine.
+
+    'endpoint' is the name of the client method which created the
+    request (e.g. "apod" or "donki_cme"), which stages can use to
+    group requests by endpoint. 'options' holds per-call settings
+    for individual stages. Streamed requests ('stream' set to True)
+    are not decoded or cached, and their body is read via 'response.chunks'.
+    """
+
+    endpoint: str
+    url: str
+    params: dict = field(default_factory=dict)
+    headers: dict = field(default_factory=dict)
+    method: str = "GET"
+    retry_delays: "list[float] | RetryPolicy | None" = None
+    timeout: float | None = None
+    check_status: bool = True
+    stream: bool = False
+    options: dict = field(default_factory=dict)
+    hooks: object = field(default=None, repr=False, compare=False)
+
+    def emit(self, event: str, **data) -> None:
+        """
+        Emits a hook event for this request, if the engine has hooks.
+        """
+
+        if self.hooks is not None:
+            self.hooks.emit(event, self, **data)
+
+    def listening(self, event: str) -> bool:
+        """
+        Whether the engine's hooks have a callback for an event.
+        """
+
+        return self.hooks is not None and self.hooks.listening(event)
+
+
+@dataclass
+class Response:
+    """
+    A transport-independent HTTP response. Once the response
+    has passed through the DecodeStage, the decoded JSON
+    body is available via 'data'.
+
+    For streamed requests, 'content' is empty and the body is instead
+    read from 'chunks', an iterator (or async iterator) of bytes. The
+    response should then be closed via 'close' (or 'aclose') once read.
+    """
+
+    status_code: int
+    headers: CaseInsensitiveDict
+    content: bytes
+    url: str
+    reason: str = ""
+    request: Request | None = None
+    elapsed: float = 0.0
+    data: object = None
+    chunks: object = None
+    closer: object = None
+
+    def json(self):
+        return json.loads(self.content)
+
+    def close(self) -> None:
+        if self.closer is not None:
+            self.closer()
+
+    async def aclose(self) -> None:
+        if self.closer is not None:
+            await self.closer()
+
+    def raise_for_status(self) -> None:
+        # Mirrors requests.Response.raise_for_status so every transport raises the same HTTPError
+        if 400 <= self.status_code < 500:
+            raise HTTPError(
+                f"{self.status_code} Client Error: {self.reason} for url: {self.url}", response=self
+            )
+        if 500 <= self.status_code < 600:
+            raise HTTPError(
+                f"{self.status_code} Server Error: {self.reason} for url: {self.url}", response=self
+            )
+
+
+class Stage:
+    """
+    A single middleware stage of the request engine. Each stage
+    receives the Request and a 'call_next' callable which passes
+    the request on to the next stage (and eventually the transport),
+    and returns the resulting Response. Stages can modify the request,
+    the response, or skip calling 'call_next' entirely (e.g. on a cache hit)!
+
+    The 'handle' method is used by NASAClient and 'handle_async'
+    by AsyncNASAClient. By default, both simply pass the request on.
+    """
+
+    def handle(self, request: Request, call_next) -> Response:
+        return call_next(request)
+
+    async def handle_async(self, request: Request, call_next) -> Response:
+        return await call_next(request)
+
+
+def default_decoder():
+    """
+    Returns the fastest installed JSON decoder, being 'orjson.loads' or
+    'msgspec.json.decode' if either is installed, and 'json.loads' otherwise.
+    All of them decode a bytes body into the same plain dicts and lists.
+    """
+
+    if orjson is not None:
+        return orjson.loads
+    if msgspec is not None:
+        return msgspec.json.decode
+    return json.loads
+
+
+class DecodeStage(Stage):
+    """
+    Decodes the JSON body of successful responses into 'response.data'.
+    Empty bodies (which DONKI returns when there are no events) are
+    decoded as None. Decoding can be skipped per request via the "decode" option.
+    """
+
+    def __init__(self, decoder=json.loads):
+        self.decoder = decoder
+
+    def _decode(self, request: Request, response: Response) -> Response:
+        if request.stream or not request.options.get("decode", True):
+            return response
+
+        if response.data is None and 200 <= response.status_code < 300 and response.content.strip():
+            start = perf_counter()
+            response.data = self.decoder(response.content)
+            request.emit("phase", name="decode", seconds=perf_counter() - start)
+
+        return response
+
+    def handle(self, request: Request, call_next) -> Response:
+        return self._decode(request, call_next(request))
+
+    async def handle_async(self, request: Request, call_next) -> Response:
+        return self._decode(request, await call_next(request))
+
+
+class RequestEngine:
+    """
+    The single request-execution pipeline that every endpoint
+    method goes through. Requests pass through each stage in
+    'stages' in order (outermost first) before reaching the transport,
+    so features like retries, caching, rate limiting and metrics only
+    need to be implemented once as a Stage to apply to every endpoint!
+    """
+
+    def __init__(self, transport, stages: list[Stage] | None = None, hooks=None):
+        self.transport = transport
+        self.stages = list(stages or [])
+        self.hooks = hooks
+
+    @staticmethod
+    def _count_chunks(request: Request, chunks):
+        for chunk in chunks:
+            request.emit("bytes_received", size=len(chunk))
+            yield chunk
+
+    @staticmethod
+    async def _count_chunks_async(request: Request, chunks):
+        async for chunk in chunks:
+            request.emit("bytes_received", size=len(chunk))
+            yield chunk
+
+    def _received(self, request: Request, response: Response) -> Response:
+        if request.hooks is not None:
+            if request.stream:
+                if isinstance(response.chunks, AsyncIterator):
+                    response.chunks = self._count_chunks_async(request, response.chunks)
+                else:
+                    response.chunks = self._count_chunks(request, response.chunks)
+            else:
+                request.emit("bytes_received", size=len(response.content))
+        return response
+
+    def send(self, request: Request) -> Response:
+        stages = tuple(self.stages)
+
+        def call_next(request, index=0):
+            if index == len(stages):
+                return self._received(request, self.transport.send(request))
+            return stages[index].handle(request, lambda r: call_next(r, index + 1))
+
+        request.hooks = self.hooks
+        request.emit("request_start")
+        start = perf_counter()
+        try:
+            response = call_next(request)
+        except Exception as e:
+            request.emit("request_end", response=None, error=e, elapsed=perf_counter() - start)
+            raise
+
+        request.emit("request_end", response=response, error=None, elapsed=perf_counter() - start)
+        return response
+
+    async def send_async(self, request: Request) -> Response:
+        stages = tuple(self.stages)
+
+        async def call_next(request, index=0):
+            if index == len(stages):
+                return self._received(request, await self.transport.send_async(request))
+            return await stages[index].handle_async(request, lambda r: call_next(r, index + 1))
+
+        request.hooks = self.hooks
+        request.emit("request_start")
+        start = perf_counter()
+        try:
+            response = await call_next(request)
+        except Exception as e:
+            request.emit("request_end", response=None, error=e, elapsed=perf_counter() - start)
+            raise
+
+        request.emit("request_end", response=response, error=None, elapsed=perf_counter() - start)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
@@ -0,0 +1,477 @@
+import json
+from array import array
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from math import asin, cos, degrees, floor, radians, sin, sqrt
+from os import path as os_path, replace
+
+from .retry import RetryPolicy
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _geometry_key(geometry: dict) -> tuple:
+    # Identifies a single geometry point of an event
+    return geometry.get("date"), geometry.get("type"), json.dumps(geometry.get("coordinates"))
+
+
+@dataclass
+class EONETDiff:
+    """
+    The changes found by a single EONETSync.sync call.
+
+    'new' holds events which had not been seen before, 'updated' holds
+    known events which have received new geometry points, and 'closed'
+    holds known events which were open and have since been closed.
+    An event can be both updated and closed in the same sync.
+    """
+
+    new: list = field(default_factory=list)
+    updated: list = field(default_factory=list)
+    closed: list = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.new or self.updated or self.closed)
+
+
+class EONETSync:
+    """
+    Keeps a local store of EONET events (keyed by their EONET ID) up to
+    date, while only requesting the events which have changed since
+    the last sync! The first sync retrieves the currently open events,
+    and each sync after that only requests the days since the previous
+    one, returning an EONETDiff of new, updated and closed events.
+    Closures are detected once the closed event is returned by EONET
+    for the synced time frame.
+
+    Works with both NASAClient (via 'sync') and AsyncNASAClient (via 'sync_async').
+
+    :param client: The NASAClient or AsyncNASAClient used to request events.
+
+    :param path: The path of a JSON file in which the store and the date of the
+        last sync are saved after every sync, and loaded from on creation,
+        so syncing can continue across runs. This defaults to None (memory only).
+
+    :param filters: Any other 'eonet_events' parameters (e.g. 'category'
+        or 'bounding_box') to apply to every sync. 'status' and the
+        time frame parameters are managed by the sync itself.
+    """
+
+    def __init__(self, client, path: str | None = None, **filters):
+        managed = {"status", "days", "start_date", "end_date", "limit"} & filters.keys()
+        if managed:
+            raise ValueError(
+                f"{', '.join(sorted(managed))} cannot be used as a filter, as it is managed by EONETSync."
+            )
+
+        self.client = client
+        self.path = os_path.expanduser(path) if path else None
+        self.filters = filters
+
+        self.events = {}
+        self.last_sync = None
+
+        if self.path and os_path.exists(self.path):
+            with open(self.path, encoding="utf-8") as file:
+                state = json.load(file)
+            self.events = state["events"]
+            self.last_sync = date.fromisoformat(state["last_sync"]) if state["last_sync"] else None
+
+    @property
+    def open_events(self) -> list:
+        """
+        The stored events which are currently open.
+        """
+
+        return [event for event in self.events.values() if not event.get("closed")]
+
+    def _params(self, today: date) -> dict:
+        params = dict(self.filters)
+
+        if self.last_sync is not None:
+            # Includes the day of the last sync, as events may have changed later that day
+            params["status"] = "all"
+            params["days"] = (today - self.last_sync).days + 1
+
+        return params
+
+    def _apply(self, data: dict, today: date) -> EONETDiff:
+        diff = EONETDiff()
+
+        for event in data.get("events", []):
+            stored = self.events.get(event["id"])
+
+            if stored is None:
+                self.events[event["id"]] = event
+                diff.new.append(event)
+                continue
+
+            # Keeps every known geometry point, in case the response only includes recent ones
+            known = {_geometry_key(geometry) for geometry in stored.get("geometry", [])}
+            added = [geometry for geometry in event.get("geometry", []) if _geometry_key(geometry) not in known]
+
+            merged = {**event, "geometry": sorted(stored.get("geometry", []) + added,
+                                                  key=lambda geometry: geometry.get("date") or "")}
+            self.events[event["id"]] = merged
+
+            if added:
+                diff.updated.append(merged)
+            if merged.get("closed") and not stored.get("closed"):
+                diff.closed.append(merged)
+
+        self.last_sync = today
+        self._save()
+        return diff
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+
+        # Writes to a temporary file first, so an interrupted save never corrupts the store
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump({"last_sync": self.last_sync.isoformat(), "events": self.events}, file)
+        replace(temporary_path, self.path)
+
+    def sync(self, retry_delays: list[float] | RetryPolicy | None = None) -> EONETDiff:
+        """
+        Requests the events which have changed since the last
+        sync, and applies them to the store.
+
+        :param retry_delays: Overrides the client's default retry delays.
+            This defaults to None.
+        """
+
+        today = datetime.now(timezone.utc).date()
+        data = self.client.eonet_events(**self._params(today), retry_delays=retry_delays)
+        return self._apply(data, today)
+
+    async def sync_async(self, retry_delays: list[float] | RetryPolicy | None = None) -> EONETDiff:
+        """
+        Asynchronous version of 'sync', for use with AsyncNASAClient!
+        """
+
+        today = datetime.now(timezone.utc).date()
+        data = await self.client.eonet_events(**self._params(today), retry_delays=retry_delays)
+        return self._apply(data, today)
+
+
+@dataclass
+class EONETArrays:
+    """
+    The geometry points of EONET events, flattened into contiguous
+    NumPy arrays (one element per point) for vectorized spatial work!
+    Polygon geometries contribute one point per vertex, which share
+    the same 'geometry_index'.
+
+    'event_index' and 'category_code' index into 'event_ids' and
+    'categories' respectively. Points without a magnitude have a NaN
+    'magnitude', and events without a category have a 'category_code' of -1.
+    """
+
+    event_index: object
+    geometry_index: object
+    timestamp: object
+    lon: object
+    lat: object
+    magnitude: object
+    category_code: object
+    event_ids: list = field(default_factory=list)
+    categories: list = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.event_index)
+
+
+def _timestamp(value: str) -> int:
+    # Converts an EONET date (e.g. "2024-01-01T00:00:00Z") into Unix seconds, assuming UTC
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return int(moment.timestamp())
+
+
+def _events_with_geometry(data: dict | list):
+    # Yields (item, event, geometries) from an 'eonet_events' or 'eonet_events_geojson' result, or a list of events
+    if isinstance(data, dict):
+        data = data.get("events") or data.get("features") or []
+
+    # GeoJSON features hold one geometry each, with the event in their properties, so the
+    # features of each event are grouped together (in the order the events first appear)
+    features = {}
+    for event in data:
+        if event.get("type") == "Feature":
+            properties = event.get("properties", {})
+            geometry = {**properties, **(event.get("geometry") or {})}
+            key = properties.get("id") or id(event)
+            if key in features:
+                features[key][2].append(geometry)
+            else:
+                features[key] = (properties, properties, [geometry])
+        else:
+            yield event, event, event.get("geometry", [])
+
+    yield from features.values()
+
+
+def _vertices(geometry_type: str, coordinates):
+    # Yields the (lon, lat) pairs of a Point or Polygon geometry
+    if geometry_type == "Point":
+        yield coordinates[0], coordinates[1]
+    else:
+        for ring in coordinates:
+            for lon, lat, *_ in ring:
+                yield lon, lat
+
+
+def eonet_arrays(data: dict | list) -> EONETArrays:
+    """
+    Flattens EONET events into an EONETArrays of NumPy arrays, with one
+    element per geometry point: event index, geometry index, timestamp
+    (int64 Unix seconds), lon/lat (float64), magnitude (float64) and
+    category code (int32).
+
+    *This requires NumPy: pip install pyspaceapis[numpy]*
+
+    :param data: The result of 'eonet_events' or 'eonet_events_geojson',
+        or a list of events (e.g. from 'iter_eonet_events' or EONETSync).
+        The GeoJSON features of each event are grouped into one event.
+    """
+
+    if numpy is None:
+        raise ImportError(
+            "eonet_arrays requires 'numpy'. Install it via: pip install pyspaceapis[numpy]"
+        )
+
+    # Collected in typed stdlib arrays, so no per-point Python objects are kept around
+    event_index = array("q")
+    geometry_index = array("q")
+    timestamp = array("q")
+    lon = array("d")
+    lat = array("d")
+    magnitude = array("d")
+    category_code = array("i")
+
+    event_ids = []
+    categories = []
+    category_codes = {}
+    geometries = 0
+
+    for _, event, event_geometries in _events_with_geometry(data):
+        event_categories = event.get("categories") or []
+        if event_categories:
+            category = event_categories[0]["id"]
+            if category not in category_codes:
+                category_codes[category] = len(categories)
+                categories.append(category)
+            code = category_codes[category]
+        else:
+            code = -1
+
+        index = len(event_ids)
+        event_ids.append(event.get("id"))
+
+        for geometry in event_geometries:
+            seconds = _timestamp(geometry["date"])
+            value = geometry.get("magnitudeValue")
+            value = float("nan") if value is None else float(value)
+
+            for point_lon, point_lat in _vertices(geometry.get("type"), geometry.get("coordinates")):
+                event_index.append(index)
+                geometry_index.append(geometries)
+                timestamp.append(seconds)
+                lon.append(point_lon)
+                lat.append(point_lat)
+                magnitude.append(value)
+                category_code.append(code)
+
+            geometries += 1
+
+    return EONETArrays(event_index=numpy.frombuffer(event_index, dtype=numpy.int64),
+                       geometry_index=numpy.frombuffer(geometry_index, dtype=numpy.int64),
+                       timestamp=numpy.frombuffer(timestamp, dtype=numpy.int64),
+                       lon=numpy.frombuffer(lon, dtype=numpy.float64),
+                       lat=numpy.frombuffer(lat, dtype=numpy.float64),
+                       magnitude=numpy.frombuffer(magnitude, dtype=numpy.float64),
+                       category_code=numpy.frombuffer(category_code, dtype=numpy.int32),
+                       event_ids=event_ids,
+                       categories=categories)
+
+
+# The mean radius of the Earth, in kilometers
+EARTH_RADIUS_KM = 6371.0088
+
+
+def _distance_km(lat_1: float, lon_1: float, lat_2: float, lon_2: float) -> float:
+    # The great-circle (haversine) distance between two points
+    lat_1, lon_1, lat_2, lon_2 = map(radians, (lat_1, lon_1, lat_2, lon_2))
+    a = sin((lat_2 - lat_1) / 2) ** 2 + cos(lat_1) * cos(lat_2) * sin((lon_2 - lon_1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(a)))
+
+
+class EONETIndex:
+    """
+    An in-process spatial index (a uniform grid) over the geometry
+    points of EONET events, built from one broad request. Bounding box
+    and radius queries are then answered locally, without making a
+    new request for every box! Polygon geometries are indexed by
+    their vertices.
+
+    :param client: The NASAClient or AsyncNASAClient used by 'refresh'.
+        This defaults to None, in which case the index is only
+        filled via 'build'.
+
+    :param cell_size: The width and height of each grid cell, in degrees.
+        Smaller cells make small queries faster at the cost of memory.
+        This defaults to 1.0.
+
+    :param filters: Any 'eonet_events' parameters (e.g. 'category'
+        or 'status') to apply to every 'refresh'.
+    """
+
+    def __init__(self, client=None, cell_size: float | None = 1.0, **filters):
+        if cell_size <= 0:
+            raise ValueError(
+                "cell_size must be greater than zero."
+            )
+
+        self.client = client
+        self.cell_size = cell_size
+        self.filters = filters
+
+        # The indexed events and the grid cells of their points, as (lon, lat, event index)
+        self._index = ([], {})
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    @property
+    def events(self) -> list:
+        """
+        The indexed events, in the order they were built from.
+        """
+
+        return self._index[0]
+
+    def _cell(self, lon: float, lat: float) -> tuple[int, int]:
+        return floor(lon / self.cell_size), floor(lat / self.cell_size)
+
+    def build(self, data: dict | list) -> None:
+        """
+        Replaces the indexed events.
+
+        :param data: The result of 'eonet_events' or 'eonet_events_geojson',
+            or a list of events (e.g. EONETSync.open_events). The GeoJSON
+            features of each event are indexed as one event, their 'properties'.
+        """
+
+        events = []
+        cells = {}
+
+        for item, _, geometries in _events_with_geometry(data):
+            index = len(events)
+            events.append(item)
+
+            for geometry in geometries:
+                for lon, lat in _vertices(geometry.get("type"), geometry.get("coordinates")):
+                    cells.setdefault(self._cell(lon, lat), []).append((lon, lat, index))
+
+        # Swapped in at once, so queries running during a rebuild see either the old or the new index
+        self._index = (events, cells)
+
+    def refresh(self, retry_delays: list[float] | RetryPolicy | None = None) -> None:
+        """
+        Requests the events via 'eonet_events' (with the index's filters)
+        and rebuilds the index from them.
+
+        :param retry_delays: Overrides the client's default retry delays.
+            This defaults to None.
+        """
+
+        self.build(self.client.eonet_events(**self.filters, retry_delays=retry_delays))
+
+    async def refresh_async(self, retry_delays: list[float] | RetryPolicy | None = None) -> None:
+        """
+        Asynchronous version of 'refresh', for use with AsyncNASAClient!
+        """
+
+        self.build(await self.client.eonet_events(**self.filters, retry_delays=retry_delays))
+
+    def _points(self, cells: dict, min_lon: float, min_lat: float, max_lon: float, max_lat: float):
+        # Yields the indexed points in the cells overlapping a (non antimeridian crossing) box
+        min_x, min_y = self._cell(min_lon, min_lat)
+        max_x, max_y = self._cell(max_lon, max_lat)
+
+        if (max_x - min_x + 1) * (max_y - min_y + 1) > len(cells):
+            # Large boxes are cheaper to answer by walking the occupied cells instead
+            for (x, y), points in cells.items():
+                if min_x <= x <= max_x and min_y <= y <= max_y:
+                    yield from points
+            return
+
+        for x in range(min_x, max_x + 1):
+            for y in range(min_y, max_y + 1):
+                yield from cells.get((x, y), ())
+
+    def query_bbox(self,
+                   min_lon: float,
+                   max_lat: float,
+                   max_lon: float,
+                   min_lat: float) -> list:
+        """
+        Returns the indexed events with at least one point inside the box.
+        The coordinates use the same order as the 'bounding_box' parameter
+        of 'eonet_events': min lon, max lat, max lon, min lat. A box where
+        'min_lon' is greater than 'max_lon' crosses the antimeridian.
+        """
+
+        events, cells = self._index
+        if min_lon <= max_lon:
+            boxes = [(min_lon, max_lon)]
+        else:
+            boxes = [(min_lon, 180.0), (-180.0, max_lon)]
+
+        found = set()
+        for box_min_lon, box_max_lon in boxes:
+            for lon, lat, index in self._points(cells, box_min_lon, min_lat, box_max_lon, max_lat):
+                if box_min_lon <= lon <= box_max_lon and min_lat <= lat <= max_lat:
+                    found.add(index)
+
+        return [events[index] for index in sorted(found)]
+
+    def query_radius(self, lat: float, lon: float, km: float) -> list:
+        """
+        Returns the indexed events with at least one point within
+        'km' kilometers (great-circle distance) of the given point.
+        """
+
+        events, cells = self._index
+
+        # The box around the circle, in degrees
+        distance = km / EARTH_RADIUS_KM
+        min_lat = lat - degrees(distance)
+        max_lat = lat + degrees(distance)
+
+        if min_lat <= -90 or max_lat >= 90 or sin(distance) >= cos(radians(lat)):
+            # The circle contains a pole, so it spans every longitude
+            min_lat, max_lat = max(min_lat, -90.0), min(max_lat, 90.0)
+            boxes = [(-180.0, 180.0)]
+        else:
+            lon_delta = degrees(asin(sin(distance) / cos(radians(lat))))
+            if lon - lon_delta < -180:
+                boxes = [(-180.0, lon + lon_delta), (lon - lon_delta + 360, 180.0)]
+            elif lon + lon_delta > 180:
+                boxes = [(lon - lon_delta, 180.0), (-180.0, lon + lon_delta - 360)]
+            else:
+                boxes = [(lon - lon_delta, lon + lon_delta)]
+
+        found = set()
+        for box_min_lon, box_max_lon in boxes:
+            for point_lon, point_lat, index in self._points(cells, box_min_lon, min_lat, box_max_lon, max_lat):
+                if index not in found and _distance_km(lat, lon, point_lat, point_lon) <= km:
+                    found.add(index)
+
+        return [events[index] for index in sorted(found)]
@@ -0,0 +1,82 @@
+from threading import Lock
+
+
+# The events which can be hooked, along with the keyword arguments passed to their callbacks
+EVENTS = {
+    "request_start": (),
+    "request_end": ("response", "error", "elapsed"),
+    "retry": ("attempt", "wait", "status"),
+    "cache_hit": ("cache", "coalesced"),
+    "throttle_wait": ("wait",),
+    "bytes_received": ("size",),
+    "phase": ("name", "seconds")
+}
+
+
+class Hooks:
+    """
+    A registry of callbacks for events happening during requests, which
+    are called with the Request (its 'endpoint' being the client method
+    name) and the keyword arguments of the event:
+
+    - "request_start": A client method call starts its request.
+    - "request_end": The request finished (including any retries), with the
+      'response' (or None), the 'error' raised (or None) and 'elapsed' seconds.
+    - "retry": A retry is about to happen after 'wait' seconds, with the
+      'attempt' which failed and its HTTP 'status' (None for timeouts).
+    - "cache_hit": The response was served by a 'cache' ("MemoryCache",
+      "DiskCache" or "conditional"), or 'coalesced' with an identical request.
+    - "throttle_wait": Rate limit pacing holds the request for 'wait' seconds.
+    - "bytes_received": 'size' bytes of a response body were received.
+    - "phase": A 'name'd phase of the request ("dns", "connect", "tls", "ttfb",
+      "download" or "decode") took 'seconds'. Transports only time the network
+      phases while a callback is listening, see debugtools.Profiler!
+
+    Callbacks run on the thread (or event loop) making the request, so
+    they should return quickly! Errors raised by callbacks are not caught.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._callbacks = {event: () for event in EVENTS}
+
+    def _check(self, event: str) -> None:
+        if event not in EVENTS:
+            raise ValueError(
+                f"Unknown hook event {event!r}. (Options: {', '.join(EVENTS)})"
+            )
+
+    def on(self, event: str, callback=None):
+        """
+        Registers a callback for an event. This can also be
+        used as a decorator, e.g. @client.hooks.on("retry")
+        """
+
+        self._check(event)
+        if callback is None:
+            return lambda function: self.on(event, function)
+
+        with self._lock:
+            self._callbacks[event] += (callback,)
+        return callback
+
+    def off(self, event: str, callback) -> None:
+        """
+        Removes a previously registered callback.
+        """
+
+        self._check(event)
+        with self._lock:
+            self._callbacks[event] = tuple(c for c in self._callbacks[event] if c is not callback)
+
+    def listening(self, event: str) -> bool:
+        """
+        Whether any callback is registered for an event.
+        """
+
+        return bool(self._callbacks[event])
+
+    def emit(self, event: str, request, **data) -> None:
+        # Callbacks are stored as tuples, so emitting never needs the lock
+        for callback in self._callbacks[event]:
+            callback(request, **data)
@@ -0,0 +1,173 @@
+import codecs
+import json
+
+_decoder = json.JSONDecoder()
+_whitespace = " \t\n\r"
+# The characters which can follow a complete number (or true, false and null)
+_terminators = _whitespace + ",]}"
+
+
+class JSONArrayStream:
+    """
+    Incrementally parses a JSON document fed in chunks, and returns the
+    items of one array in its top-level object (e.g. the "events" array
+    of EONET) one at a time, as soon as each item has been received.
+    Only the item currently being received is held in memory, no matter
+    how large the whole document is!
+
+    :param key: The top-level key of the array to return the items of.
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self.done = False
+
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+        self._state = "start"
+
+    def feed(self, chunk: bytes) -> list:
+        """
+        Feeds the next chunk of the document, returning the
+        array items which have been completed by it.
+        """
+
+        self._buffer = self._buffer[self._position:] + self._utf8.decode(chunk)
+        self._position = 0
+        return self._parse(final=False)
+
+    def close(self) -> list:
+        """
+        Signals the end of the document, returning any remaining
+        items and raising a JSONDecodeError if the document was incomplete.
+        """
+
+        self._buffer = self._buffer[self._position:] + self._utf8.decode(b"", final=True)
+        self._position = 0
+        return self._parse(final=True)
+
+    def _skip(self, characters: str = _whitespace) -> str | None:
+        # Skips the given characters, returning the next one (or None at the end of the buffer)
+        while self._position < len(self._buffer) and self._buffer[self._position] in characters:
+            self._position += 1
+        return self._buffer[self._position] if self._position < len(self._buffer) else None
+
+    def _value(self, final: bool):
+        # Decodes the next complete value, returning (True, value) or (False, None) if more data is needed
+        try:
+            value, end = _decoder.raw_decode(self._buffer, self._position)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return False, None
+
+        # A number is only complete once something other than a digit follows it, as "22." or "-3e"
+        # at the end of a chunk decode as 22 and -3, with the rest of the number still to come
+        if (not final and not isinstance(value, (dict, list, str))
+                and (end == len(self._buffer) or self._buffer[end] not in _terminators)):
+            return False, None
+
+        self._position = end
+        return True, value
+
+    def _parse(self, final: bool) -> list:
+        items = []
+
+        while not self.done:
+            if self._state == "start":
+                character = self._skip()
+                if character is None:
+                    break
+                if character != "{":
+                    raise json.JSONDecodeError("Expecting '{'", self._buffer, self._position)
+                self._position += 1
+                self._state = "key"
+
+            elif self._state == "key":
+                character = self._skip(_whitespace + ",")
+                if character is None:
+                    break
+                if character == "}":
+                    self.done = True
+                    break
+
+                start = self._position
+                complete, key = self._value(final)
+                if not complete or self._skip() is None:
+                    self._position = start
+                    break
+                if self._buffer[self._position] != ":":
+                    raise json.JSONDecodeError("Expecting ':' delimiter", self._buffer, self._position)
+
+                if key == self.key:
+                    if self._skip(_whitespace + ":") is None:
+                        self._position = start
+                        break
+                    if self._buffer[self._position] != "[":
+                        raise json.JSONDecodeError("Expecting '['", self._buffer, self._position)
+                    self._position += 1
+                    self._state = "items"
+                else:
+                    self._position += 1
+                    self._state = "value"
+
+            elif self._state == "value":
+                if self._skip() is None:
+                    break
+                complete, _ = self._value(final)
+                if not complete:
+                    break
+                self._state = "key"
+
+            elif self._state == "items":
+                character = self._skip(_whitespace + ",")
+                if character is None:
+                    break
+                if character == "]":
+                    # Everything after the array is of no interest
+                    self.done = True
+                    break
+
+                complete, item = self._value(final)
+                if not complete:
+                    break
+                items.append(item)
+
+        if final and not self.done:
+            raise json.JSONDecodeError(
+                f"Document ended before the end of the {self.key!r} array", self._buffer, self._position
+            )
+
+        return items
+
+
+def iter_array(chunks, key: str):
+    """
+    Yields the items of the top-level 'key' array of a JSON document,
+    given as an iterable of byte chunks, one item at a time.
+    """
+
+    parser = JSONArrayStream(key)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+        if parser.done:
+            return
+
+    yield from parser.close()
+
+
+async def aiter_array(chunks, key: str):
+    """
+    Asynchronous version of 'iter_array', for an async iterable of byte chunks.
+    """
+
+    parser = JSONArrayStream(key)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+        if parser.done:
+            return
+
+    for item in parser.close():
+        yield item
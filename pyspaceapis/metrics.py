@@ -0,0 +1,171 @@
+from math import ceil, log
+from threading import Lock
+
+from requests.exceptions import ConnectTimeout, ReadTimeout
+
+
+class LatencyHistogram:
+    """
+    A histogram of latencies with logarithmic buckets, each one 'growth'
+    times wider than the last, starting at 'smallest' seconds. Memory use
+    is fixed no matter how many latencies are recorded, and percentiles are
+    read from the bucket bounds, so they overestimate by at most 'growth'.
+
+    :param smallest: The upper bound (in seconds) of the first bucket.
+        This defaults to 0.001 (one millisecond).
+
+    :param growth: The ratio between the bounds of neighbouring buckets.
+        This defaults to 1.1 (so percentiles are within 10%).
+    """
+
+    def __init__(self,
+                 smallest: float | None = 0.001,
+                 growth: float | None = 1.1):
+        self.smallest = smallest
+        self.growth = growth
+
+        self.counts = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def _bucket(self, seconds: float) -> int:
+        if seconds <= self.smallest:
+            return 0
+        return ceil(log(seconds / self.smallest, self.growth))
+
+    def bound(self, bucket: int) -> float:
+        """
+        The upper bound (in seconds) of a bucket.
+        """
+
+        return self.smallest * self.growth ** bucket
+
+    def record(self, seconds: float) -> None:
+        bucket = self._bucket(seconds)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float | None:
+        """
+        The latency (in seconds) below which 'q' percent of the recorded latencies
+        fall, or None if nothing was recorded. E.g. percentile(99) is the p99!
+        """
+
+        if not self.count:
+            return None
+
+        rank = q / 100 * self.count
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                # The largest latency is known exactly, so no bound is ever reported above it
+                return min(self.bound(bucket), self.max)
+        return self.max
+
+
+class Metrics:
+    """
+    Collects per-endpoint metrics (the endpoint being the client method name)
+    from a client's hooks: the number of calls, errors, timeouts, retries,
+    cache hits, time spent waiting on rate limits, bytes received, and a
+    LatencyHistogram of how long the calls took, retries included.
+
+    Give one to a client via its 'metrics' parameter (or call attach with
+    the client's hooks), then read the numbers with snapshot!
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._endpoints = {}
+
+    def attach(self, hooks) -> "Metrics":
+        """
+        Subscribes this collector to the events of a Hooks registry.
+        """
+
+        hooks.on("request_end", self._request_end)
+        hooks.on("retry", self._retry)
+        hooks.on("cache_hit", self._cache_hit)
+        hooks.on("throttle_wait", self._throttle_wait)
+        hooks.on("bytes_received", self._bytes_received)
+        return self
+
+    def detach(self, hooks) -> None:
+        hooks.off("request_end", self._request_end)
+        hooks.off("retry", self._retry)
+        hooks.off("cache_hit", self._cache_hit)
+        hooks.off("throttle_wait", self._throttle_wait)
+        hooks.off("bytes_received", self._bytes_received)
+
+    def _endpoint(self, request) -> dict:
+        # Only called with the lock held
+        endpoint = self._endpoints.get(request.endpoint)
+        if endpoint is None:
+            endpoint = self._endpoints[request.endpoint] = {
+                "calls": 0,
+                "errors": 0,
+                "timeouts": 0,
+                "retries": 0,
+                "cache_hits": 0,
+                "throttle_wait": 0.0,
+                "bytes": 0,
+                "latency": LatencyHistogram()
+            }
+        return endpoint
+
+    def _request_end(self, request, response, error, elapsed) -> None:
+        with self._lock:
+            endpoint = self._endpoint(request)
+            endpoint["calls"] += 1
+            endpoint["latency"].record(elapsed)
+            if error is not None:
+                endpoint["errors"] += 1
+                if isinstance(error, (ConnectTimeout, ReadTimeout)):
+                    endpoint["timeouts"] += 1
+
+    def _retry(self, request, attempt, wait, status) -> None:
+        with self._lock:
+            self._endpoint(request)["retries"] += 1
+
+    def _cache_hit(self, request, cache, coalesced) -> None:
+        with self._lock:
+            self._endpoint(request)["cache_hits"] += 1
+
+    def _throttle_wait(self, request, wait) -> None:
+        with self._lock:
+            self._endpoint(request)["throttle_wait"] += wait
+
+    def _bytes_received(self, request, size) -> None:
+        with self._lock:
+            self._endpoint(request)["bytes"] += size
+
+    def snapshot(self) -> dict:
+        """
+        Returns the metrics collected so far, as a dict of endpoints to dicts
+        of their counters, along with the mean, p50, p95, p99 and max latency
+        (in seconds) and the average number of retries per call.
+        """
+
+        with self._lock:
+            snapshot = {}
+            for name, endpoint in self._endpoints.items():
+                latency = endpoint["latency"]
+                counters = {key: value for key, value in endpoint.items() if key != "latency"}
+                counters.update(
+                    retries_per_call=endpoint["retries"] / endpoint["calls"] if endpoint["calls"] else 0.0,
+                    mean=latency.total / latency.count if latency.count else None,
+                    p50=latency.percentile(50),
+                    p95=latency.percentile(95),
+                    p99=latency.percentile(99),
+                    max=latency.max if latency.count else None
+                )
+                snapshot[name] = counters
+            return snapshot
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
@@ -0,0 +1,462 @@
+from datetime import date, datetime, timezone
+from functools import wraps
+from inspect import isasyncgenfunction, iscoroutinefunction, isgeneratorfunction
+
+
+def _lookup(data: dict, key: str):
+    # Reads a (possibly dotted, e.g. "miss_distance.kilometers") key, returning None if any part is missing
+    for part in key.split("."):
+        if not isinstance(data, dict):
+            return None
+        data = data.get(part)
+    return data
+
+
+def _datetime(value: str) -> datetime:
+    # Parses DONKI and EONET timestamps (e.g. "2024-01-01T12:34Z"), assuming UTC if no timezone is given
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment
+
+
+def _neows_datetime(value: str) -> datetime:
+    # Parses NeoWs close approach timestamps (e.g. "2024-Jan-01 12:34")
+    return datetime.strptime(value, "%Y-%b-%d %H:%M").replace(tzinfo=timezone.utc)
+
+
+def _frozen(value):
+    # Turns nested coordinate lists into tuples
+    return tuple(_frozen(item) for item in value) if isinstance(value, list) else value
+
+
+def _display_names(instruments: list) -> tuple:
+    return tuple(instrument.get("displayName") for instrument in instruments)
+
+
+def _activity_ids(linked_events: list) -> tuple:
+    return tuple(event.get("activityID") for event in linked_events)
+
+
+class _Undecoded:
+    # Marks a lazy field's raw value until it is decoded, as decoded values can be dicts or lists too
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class _Lazy:
+    """
+    Decodes a nested field on first access, replacing the stored
+    raw value with the decoded one.
+    """
+
+    def __init__(self, slot: str, parser):
+        self.slot = slot
+        self.parser = parser
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        value = getattr(instance, self.slot)
+        if type(value) is _Undecoded:
+            value = self.parser(value.value)
+            object.__setattr__(instance, self.slot, value)
+
+        return value
+
+
+class _ModelMeta(type):
+    # Builds the __slots__ of each model from its fields, so no instance carries a __dict__
+    def __new__(mcs, name, bases, namespace):
+        fields = namespace.get("_fields", ())
+        lazy = namespace.get("_lazy", ())
+
+        namespace["__slots__"] = (tuple(attribute for attribute, _, _ in fields)
+                                  + tuple(f"_{attribute}" for attribute, _, _ in lazy))
+        for attribute, _, parser in lazy:
+            namespace[attribute] = _Lazy(f"_{attribute}", parser)
+
+        return super().__new__(mcs, name, bases, namespace)
+
+
+class Model(metaclass=_ModelMeta):
+    """
+    The base class of every typed result model. Models are immutable
+    and slotted, numeric and date fields are parsed once on creation,
+    and nested sub-objects (e.g. close approaches or geometry) are only
+    decoded when first accessed!
+
+    Fields which are missing from the API response are None.
+    """
+
+    # (attribute, key, parser) of the fields decoded on creation
+    _fields = ()
+    # (attribute, key, parser) of the nested fields decoded on first access
+    _lazy = ()
+
+    def __init__(self, data: dict):
+        for attribute, key, parser in self._fields:
+            value = _lookup(data, key)
+            object.__setattr__(self, attribute, None if value is None else parser(value))
+
+        for attribute, key, _ in self._lazy:
+            value = _lookup(data, key)
+            object.__setattr__(self, f"_{attribute}", None if value is None else _Undecoded(value))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            f"{type(self).__name__} models are immutable."
+        )
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{attribute}={getattr(self, attribute)!r}" for attribute, _, _ in self._fields)
+        return f"{type(self).__name__}({values})"
+
+    def __eq__(self, other) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, attribute) == getattr(other, attribute)
+                   for attribute, _, _ in self._fields + self._lazy)
+
+    __hash__ = None
+
+    def __setstate__(self, state) -> None:
+        # Models are immutable, so unpickling has to bypass __setattr__
+        for name, value in state[1].items():
+            object.__setattr__(self, name, value)
+
+    @classmethod
+    def many(cls, items: list | None) -> list:
+        """
+        Creates a model from each item of a list (None being an empty list).
+        """
+
+        return [cls(item) for item in items or []]
+
+    @classmethod
+    def _tuple(cls, items: list) -> tuple:
+        return tuple(cls(item) for item in items)
+
+
+# Astronomy Picture of the Day (APOD)
+class APOD(Model):
+    _fields = (("date", "date", date.fromisoformat),
+               ("title", "title", str),
+               ("explanation", "explanation", str),
+               ("media_type", "media_type", str),
+               ("url", "url", str),
+               ("hdurl", "hdurl", str),
+               ("thumbnail_url", "thumbnail_url", str),
+               ("copyright", "copyright", str),
+               ("service_version", "service_version", str))
+
+
+# Near Earth Object Web Service (NeoWs)
+class CloseApproach(Model):
+    _fields = (("date", "close_approach_date", date.fromisoformat),
+               ("datetime", "close_approach_date_full", _neows_datetime),
+               ("epoch_ms", "epoch_date_close_approach", int),
+               ("velocity_km_s", "relative_velocity.kilometers_per_second", float),
+               ("velocity_km_h", "relative_velocity.kilometers_per_hour", float),
+               ("miss_distance_km", "miss_distance.kilometers", float),
+               ("miss_distance_au", "miss_distance.astronomical", float),
+               ("miss_distance_lunar", "miss_distance.lunar", float),
+               ("orbiting_body", "orbiting_body", str))
+
+
+class OrbitalData(Model):
+    _fields = (("orbit_id", "orbit_id", str),
+               ("orbit_determination_date", "orbit_determination_date", str),
+               ("first_observation_date", "first_observation_date", date.fromisoformat),
+               ("last_observation_date", "last_observation_date", date.fromisoformat),
+               ("data_arc_in_days", "data_arc_in_days", int),
+               ("observations_used", "observations_used", int),
+               ("minimum_orbit_intersection", "minimum_orbit_intersection", float),
+               ("eccentricity", "eccentricity", float),
+               ("semi_major_axis", "semi_major_axis", float),
+               ("inclination", "inclination", float),
+               ("ascending_node_longitude", "ascending_node_longitude", float),
+               ("orbital_period", "orbital_period", float),
+               ("perihelion_distance", "perihelion_distance", float),
+               ("perihelion_argument", "perihelion_argument", float),
+               ("aphelion_distance", "aphelion_distance", float),
+               ("mean_anomaly", "mean_anomaly", float),
+               ("mean_motion", "mean_motion", float),
+               ("orbit_class_type", "orbit_class.orbit_class_type", str))
+
+
+class NEO(Model):
+    _fields = (("id", "id", str),
+               ("neo_reference_id", "neo_reference_id", str),
+               ("name", "name", str),
+               ("nasa_jpl_url", "nasa_jpl_url", str),
+               ("absolute_magnitude_h", "absolute_magnitude_h", float),
+               ("diameter_km_min", "estimated_diameter.kilometers.estimated_diameter_min", float),
+               ("diameter_km_max", "estimated_diameter.kilometers.estimated_diameter_max", float),
+               ("is_potentially_hazardous", "is_potentially_hazardous_asteroid", bool),
+               ("is_sentry_object", "is_sentry_object", bool))
+    _lazy = (("close_approaches", "close_approach_data", CloseApproach._tuple),
+             ("orbital_data", "orbital_data", OrbitalData))
+
+
+def _neos_by_date(near_earth_objects: dict) -> dict:
+    return {date.fromisoformat(day): NEO._tuple(objects) for day, objects in near_earth_objects.items()}
+
+
+class NEOFeed(Model):
+    _fields = (("element_count", "element_count", int),)
+    _lazy = (("near_earth_objects", "near_earth_objects", _neos_by_date),)
+
+
+class NEOBrowsePage(Model):
+    _fields = (("number", "page.number", int),
+               ("size", "page.size", int),
+               ("total_pages", "page.total_pages", int),
+               ("total_elements", "page.total_elements", int))
+    _lazy = (("near_earth_objects", "near_earth_objects", NEO._tuple),)
+
+
+# Space Weather Database Of Notifications, Knowledge, Information (DONKI)
+class CMEAnalysis(Model):
+    _fields = (("time21_5", "time21_5", _datetime),
+               ("latitude", "latitude", float),
+               ("longitude", "longitude", float),
+               ("half_angle", "halfAngle", float),
+               ("speed", "speed", float),
+               ("type", "type", str),
+               ("is_most_accurate", "isMostAccurate", bool),
+               ("associated_cme_id", "associatedCMEID", str),
+               ("catalog", "catalog", str),
+               ("note", "note", str),
+               ("link", "link", str))
+
+
+class CME(Model):
+    _fields = (("activity_id", "activityID", str),
+               ("catalog", "catalog", str),
+               ("start_time", "startTime", _datetime),
+               ("source_location", "sourceLocation", str),
+               ("active_region_num", "activeRegionNum", int),
+               ("note", "note", str),
+               ("link", "link", str))
+    _lazy = (("instruments", "instruments", _display_names),
+             ("analyses", "cmeAnalyses", CMEAnalysis._tuple),
+             ("linked_events", "linkedEvents", _activity_ids))
+
+
+class KpIndex(Model):
+    _fields = (("observed_time", "observedTime", _datetime),
+               ("kp_index", "kpIndex", float),
+               ("source", "source", str))
+
+
+class GST(Model):
+    _fields = (("gst_id", "gstID", str),
+               ("start_time", "startTime", _datetime),
+               ("link", "link", str))
+    _lazy = (("kp_indexes", "allKpIndex", KpIndex._tuple),
+             ("linked_events", "linkedEvents", _activity_ids))
+
+
+class IPS(Model):
+    _fields = (("activity_id", "activityID", str),
+               ("catalog", "catalog", str),
+               ("location", "location", str),
+               ("event_time", "eventTime", _datetime),
+               ("link", "link", str))
+    _lazy = (("instruments", "instruments", _display_names),
+             ("linked_events", "linkedEvents", _activity_ids))
+
+
+class FLR(Model):
+    _fields = (("flr_id", "flrID", str),
+               ("catalog", "catalog", str),
+               ("begin_time", "beginTime", _datetime),
+               ("peak_time", "peakTime", _datetime),
+               ("end_time", "endTime", _datetime),
+               ("class_type", "classType", str),
+               ("source_location", "sourceLocation", str),
+               ("active_region_num", "activeRegionNum", int),
+               ("note", "note", str),
+               ("link", "link", str))
+    _lazy = (("instruments", "instruments", _display_names),
+             ("linked_events", "linkedEvents", _activity_ids))
+
+
+class SEP(Model):
+    _fields = (("sep_id", "sepID", str),
+               ("event_time", "eventTime", _datetime),
+               ("link", "link", str))
+    _lazy = (("instruments", "instruments", _display_names),
+             ("linked_events", "linkedEvents", _activity_ids))
+
+
+class MPC(Model):
+    _fields = (("mpc_id", "mpcID", str),
+               ("event_time", "eventTime", _datetime),
+               ("link", "link", str))
+    _lazy = (("instruments", "instruments", _display_names),
+             ("linked_events", "linkedEvents", _activity_ids))
+
+
+class RBE(Model):
+    _fields = (("rbe_id", "rbeID", str),
+               ("event_time", "eventTime", _datetime),
+               ("link", "link", str))
+    _lazy = (("instruments", "instruments", _display_names),
+             ("linked_events", "linkedEvents", _activity_ids))
+
+
+class HSS(Model):
+    _fields = (("hss_id", "hssID", str),
+               ("event_time", "eventTime", _datetime),
+               ("link", "link", str))
+    _lazy = (("instruments", "instruments", _display_names),
+             ("linked_events", "linkedEvents", _activity_ids))
+
+
+class WSAEnlilSimulation(Model):
+    _fields = (("simulation_id", "simulationID", str),
+               ("model_completion_time", "modelCompletionTime", _datetime),
+               ("au", "au", float),
+               ("estimated_shock_arrival_time", "estimatedShockArrivalTime", _datetime),
+               ("estimated_duration", "estimatedDuration", float),
+               ("rmin_re", "rmin_re", float),
+               ("kp_18", "kp_18", float),
+               ("kp_90", "kp_90", float),
+               ("kp_135", "kp_135", float),
+               ("kp_180", "kp_180", float),
+               ("is_earth_gb", "isEarthGB", bool),
+               ("link", "link", str))
+    _lazy = (("cme_inputs", "cmeInputs", tuple),
+             ("impacts", "impactList", tuple))
+
+
+class Notification(Model):
+    _fields = (("message_type", "messageType", str),
+               ("message_id", "messageID", str),
+               ("message_url", "messageURL", str),
+               ("message_issue_time", "messageIssueTime", _datetime),
+               ("message_body", "messageBody", str))
+
+
+# The model of each DONKI event type, as named in NASAClient.donki_range and donki_snapshot
+DONKI_MODELS = {"cme": CME, "cme_analysis": CMEAnalysis, "gst": GST, "ips": IPS,
+                "flr": FLR, "sep": SEP, "mpc": MPC, "rbe": RBE, "hss": HSS,
+                "wsa_es": WSAEnlilSimulation, "notifications": Notification}
+
+
+# The Earth Observatory Natural Event Tracker (EONET)
+class EONETGeometry(Model):
+    _fields = (("date", "date", _datetime),
+               ("type", "type", str),
+               ("magnitude_value", "magnitudeValue", float),
+               ("magnitude_unit", "magnitudeUnit", str))
+    _lazy = (("coordinates", "coordinates", _frozen),)
+
+
+class EONETEvent(Model):
+    _fields = (("id", "id", str),
+               ("title", "title", str),
+               ("description", "description", str),
+               ("link", "link", str),
+               ("closed", "closed", _datetime))
+    _lazy = (("categories", "categories", lambda categories: tuple(category["id"] for category in categories)),
+             ("sources", "sources", lambda sources: tuple(source["id"] for source in sources)),
+             ("geometry", "geometry", EONETGeometry._tuple))
+
+
+def _one_or_many(model):
+    # APOD returns a single entry, or a list of entries for 'count' and date ranges
+    return lambda data: model.many(data) if isinstance(data, list) else model(data)
+
+
+# How the result of each supported client method is turned into models
+_PARSERS = {
+    "apod": _one_or_many(APOD),
+    "neows_feed": NEOFeed,
+    "neows_feed_range": NEOFeed,
+    "neows_lookup": NEO,
+    "neows_browse": NEOBrowsePage,
+    "iter_neows_browse": NEO,
+    "neows_lookup_many": lambda result: (result[0], None if result[1] is None else NEO(result[1]), result[2]),
+    "donki_snapshot": lambda results: {kind: DONKI_MODELS[kind].many(events) for kind, events in results.items()},
+    "eonet_events": lambda data: EONETEvent.many(data.get("events")),
+    "iter_eonet_events": EONETEvent,
+    **{f"donki_{kind}": model.many for kind, model in DONKI_MODELS.items()}
+}
+
+
+class TypedClient:
+    """
+    Wraps a NASAClient or AsyncNASAClient (usually via its 'typed'
+    property), so its methods return typed models instead of plain
+    dicts! Every method takes the same parameters as on the wrapped
+    client. Generators yield models one at a time, and coroutines
+    return models once awaited.
+
+    Only methods with a model are available, being APOD, NeoWs,
+    DONKI and EONET events (not GeoJSON, categories or layers).
+    """
+
+    def __init__(self, client):
+        self._client = client
+
+    def __getattr__(self, name: str):
+        parser = _PARSERS.get(name)
+        if parser is None:
+            raise AttributeError(
+                f"{type(self._client).__name__}.{name} has no typed model."
+            )
+
+        return _wrap(getattr(self._client, name), parser)
+
+    def donki_range(self, kind: str, *args, **kwargs):
+        """
+        Typed version of 'donki_range', returning the models of the given event type.
+        """
+
+        model = DONKI_MODELS.get(kind)
+        return _wrap(self._client.donki_range, model.many if model else list)(kind, *args, **kwargs)
+
+    def iter_eonet_events(self, *args, **kwargs):
+        """
+        Typed version of 'iter_eonet_events', yielding EONETEvent models.
+        """
+
+        if kwargs.get("geojson"):
+            raise ValueError(
+                "GeoJSON features have no typed model. Use the client's own 'iter_eonet_events' instead."
+            )
+
+        return _wrap(self._client.iter_eonet_events, EONETEvent)(*args, **kwargs)
+
+
+def _wrap(method, parser):
+    # Applies 'parser' to the result (or each yielded item) of a sync or async client method
+    if isasyncgenfunction(method):
+        @wraps(method)
+        async def wrapper(*args, **kwargs):
+            async for item in method(*args, **kwargs):
+                yield parser(item)
+
+    elif isgeneratorfunction(method):
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            for item in method(*args, **kwargs):
+                yield parser(item)
+
+    elif iscoroutinefunction(method):
+        @wraps(method)
+        async def wrapper(*args, **kwargs):
+            return parser(await method(*args, **kwargs))
+
+    else:
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            return parser(method(*args, **kwargs))
+
+    return wrapper
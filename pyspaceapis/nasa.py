@@ -1,18 +1,67 @@
-import requests
-from requests.exceptions import HTTPError, ReadTimeout, ConnectTimeout
+from collections import deque
+from copy import copy
+from concurrent.futures import Future, ThreadPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+from threading import local
+
+from .engine import Request, RequestEngine, DecodeStage, default_decoder
+from .transport import Transport, RequestsTransport, HTTPXTransport
+from .ratelimit import RateLimitStage
+from .retry import RetryPolicy, RetryStage
+from .jsonstream import iter_array
+from .dateranges import split_date_range, merge_neows_feeds, merge_donki_events
+from .cache import CacheStage, ConditionalStage, DiskCache, MemoryCache
+from .models import TypedClient
+from .hooks import Hooks
+from .metrics import Metrics
+
+# Marks the threads of every client's managed executor
+_worker = local()
+
+
+def _mark_worker() -> None:
+    _worker.active = True
 
 
 class NASAClient:
+    """
+    A client for the APOD, NeoWs, DONKI and EONET APIs.
+
+    A single NASAClient is safe to share between threads (e.g. one per
+    process, used by a whole worker pool)! Its configuration never changes
+    after creation, and all shared state (the connection pool, caches and
+    rate limit tracking) is guarded by locks. Calls can also be run on the
+    client's own managed executor via 'submit' and 'map'.
+    """
 
     # APOD, NeoWs, and DONKI Base Url
     _base_nasa_url = "https://api.nasa.gov"
     # EONET Base Url
     _base_eonet_url = "https://eonet.gsfc.nasa.gov/api/v3"
 
+    # DONKI Event Types (each has a matching 'donki_<kind>' method)
+    _donki_kinds = ("cme", "cme_analysis", "gst", "ips", "flr", "sep",
+                    "mpc", "rbe", "hss", "wsa_es", "notifications")
+
     def __init__(self,
                  api_key: str | None = "DEMO_KEY",
-                 default_retry_delays: list[float] | None = None,
-                 timeout_print: bool | None = False):
+                 default_retry_delays: list[float] | RetryPolicy | None = None,
+                 timeout_print: bool | None = False,
+                 retry_policy: RetryPolicy | None = None,
+                 pace_requests: bool | None = False,
+                 cache: DiskCache | None = None,
+                 memory_cache: MemoryCache | None = None,
+                 conditional_requests: bool | None = False,
+                 decoder=None,
+                 pool_connections: int | None = 10,
+                 pool_maxsize: int | None = 10,
+                 pool_block: bool | None = False,
+                 keep_alive: bool | None = True,
+                 http2: bool | None = False,
+                 max_workers: int | None = None,
+                 hooks: Hooks | None = None,
+                 metrics: Metrics | None = None,
+                 transport: Transport | None = None):
         """
         This is where you enter your NASA API key
         for handling requests made to the NASA API. If
@@ -46,24 +95,296 @@ class NASAClient:
             debug prints will be made visible! (e.g. '(Request timed out
             after 15 seconds. Retrying for 30 seconds.)')
             This defaults to False.
+
+        :param retry_policy: A RetryPolicy controlling how requests are retried,
+            such as the exponential backoff (with jitter) between attempts, which
+            HTTP statuses are retried (429, 502, 503 and 504 by default), honoring
+            Retry-After headers, and an optional RetryBudget shared by all requests.
+            This defaults to None, which uses RetryPolicy() with the 'default_retry_delays'.
+
+        :param pace_requests: If this parameter is set to True, requests
+            made with the API key will be paced using the X-RateLimit headers
+            of previous responses, so that requests wait for the hourly budget
+            to refill instead of failing with a 429 error!
+            This defaults to False.
+
+        :param cache: An optional cache backend (e.g. DiskCache) for storing
+            responses, so data which does not change (such as a past APOD
+            or a DONKI date range which ended weeks ago) is only downloaded once!
+            Each endpoint family is cached for a different amount of time.
+            This defaults to None (No Caching).
+
+        :param memory_cache: An optional in-process cache (MemoryCache) which keeps
+            recently decoded responses in memory. When multiple threads make the same
+            request at the same time, only one request is sent and the others wait
+            for its result! Hit, miss and coalesced counts can be read via 'cache_stats'.
+            This defaults to None (No Caching).
+
+        :param conditional_requests: If this parameter is set to True, the ETag and
+            Last-Modified headers of responses are sent back on later identical requests,
+            so data which has not changed since the last request is answered with an
+            empty "304 Not Modified" response and served from memory instead. This is
+            useful when polling endpoints such as 'eonet_events' or 'donki_notifications'!
+            This defaults to False.
+
+        :param decoder: A callable which decodes a JSON response body (bytes)
+            into dicts and lists, such as 'orjson.loads'.
+            This defaults to None, which picks the fastest installed decoder
+            (orjson, then msgspec, then the standard library's 'json.loads').
+
+        :param pool_connections: The number of per-host connection pools to keep.
+            This defaults to 10.
+
+        :param pool_maxsize: The maximum number of connections kept open per host.
+            When making requests from many threads at once (e.g. via 'neows_lookup_many'),
+            set this to at least the number of threads, so connections (and their TLS
+            handshakes) are reused instead of thrown away! This defaults to 10.
+
+        :param pool_block: If this parameter is set to True, requests wait for a free
+            connection once 'pool_maxsize' connections to a host are in use, instead
+            of opening extra ones. This defaults to False.
+
+        :param keep_alive: Whether connections are kept open and reused between requests.
+            This defaults to True.
+
+        :param http2: If this parameter is set to True, requests are sent over
+            HTTP/2 (via httpx) where supported, which multiplexes concurrent requests
+            over a single connection per host. 'pool_maxsize' then becomes httpx's
+            connection limit ('pool_connections' and 'pool_block' have no effect,
+            as httpx pools every host together and always waits).
+            This requires: pip install pyspaceapis[http2]
+            This defaults to False.
+
+        :param max_workers: The number of threads of the client's managed executor,
+            which runs the calls given to 'submit' and 'map'.
+            This defaults to None, which uses 'pool_maxsize'.
+
+        :param hooks: A Hooks registry whose callbacks are called on events during requests
+            (request start/end, retries, cache hits, rate limit waits and bytes received).
+            Callbacks can also be added later via 'client.hooks.on'.
+            This defaults to None, which creates an empty Hooks registry.
+
+        :param metrics: An optional Metrics collector, which records the latency
+            percentiles, errors, timeouts and retries of each endpoint from the hooks.
+            (e.g. NASAClient(metrics=Metrics()), then read 'client.metrics.snapshot()')
+            This defaults to None (No Metrics).
+
+        :param transport: The transport which sends the requests, such as a RecordingTransport
+            (which records responses into an archive) or a ReplayTransport (which serves
+            them back without any network access). The pool parameters above are then ignored.
+            This defaults to None, which uses a pooled RequestsTransport (or HTTPXTransport with 'http2').
         """
 
-        # Requests Session and API Key
-        self._session = requests.Session()
+        # API Key
         self._api_key = api_key
 
-        # Default Timeout Retry Delays
-        self._default_retry_delays = default_retry_delays or [10, 15, 30]
+        # Retry Policy (immutable, with 'default_retry_delays' as its per-attempt timeouts if given)
+        self._retry_policy = retry_policy or RetryPolicy()
+        if default_retry_delays:
+            self._retry_policy = self._retry_policy.with_timeouts(default_retry_delays)
+
+        # Whether results are returned as undecoded bytes (see the 'raw' property)
+        self._raw = False
+
+        # Request Engine (every endpoint method goes through these stages, outermost first)
+        if transport is not None:
+            self._transport = transport
+        elif http2:
+            self._transport = HTTPXTransport(max_connections=pool_maxsize,
+                                             max_keepalive_connections=pool_maxsize if keep_alive else 0,
+                                             http2=True)
+        else:
+            self._transport = RequestsTransport(pool_connections=pool_connections,
+                                                pool_maxsize=pool_maxsize,
+                                                pool_block=pool_block,
+                                                keep_alive=keep_alive)
+        self._rate_limit = RateLimitStage(pace=pace_requests)
+        self._cache_stages = {}
+
+        stages = []
+        if memory_cache is not None:
+            # Outside of decoding, so cache hits skip decoding entirely
+            self._cache_stages["memory"] = CacheStage(memory_cache, decoded=True)
+            stages.append(self._cache_stages["memory"])
+        stages.append(DecodeStage(decoder or default_decoder()))
+        if cache is not None:
+            self._cache_stages["disk"] = CacheStage(cache)
+            stages.append(self._cache_stages["disk"])
+        if conditional_requests:
+            self._cache_stages["conditional"] = ConditionalStage()
+            stages.append(self._cache_stages["conditional"])
+        stages.append(RetryStage(self._retry_policy, timeout_print))
+        stages.append(self._rate_limit)
+        self._engine = RequestEngine(self._transport, stages, hooks or Hooks())
+
+        # Metrics (collected from the engine's hooks)
+        self._metrics = metrics
+        if metrics is not None:
+            metrics.attach(self._engine.hooks)
+
+        # Managed Executor (for 'submit' and 'map', threads are only started once used)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers or pool_maxsize,
+                                            thread_name_prefix="pyspaceapis",
+                                            initializer=_mark_worker)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """
+        Closes the underlying connection pool and shuts down the managed
+        executor (waiting for submitted calls to finish). This is called
+        automatically when the client is used as a 'with' context manager!
+        (Closing a 'raw' view does nothing, as it borrows this client's pool)
+        """
+
+        if self._raw:
+            return
+
+        self._executor.shutdown(wait=True)
+        self._engine.close()
+
+    def submit(self, method, /, **kwargs) -> Future:
+        """
+        Runs a single endpoint method call on the client's managed executor,
+        returning a Future of its result.
+        (e.g. client.submit("neows_lookup", asteroid_id=3542519))
+
+        :param method: The name of the method (e.g. "donki_flr"),
+            or the method itself (e.g. client.donki_flr).
+
+        :param kwargs: The parameters of the call.
+        """
+
+        if isinstance(method, str):
+            method = getattr(self, method)
+
+        return self._executor.submit(method, **kwargs)
+
+    def map(self, calls) -> list[Future]:
+        """
+        Runs many endpoint method calls on the client's managed executor,
+        returning a list of Futures in the same order as 'calls'.
+        (e.g. client.map([("apod", {"date": "2024-01-01"}), ("donki_flr", {})]))
+
+        :param calls: An iterable of (method, kwargs) pairs,
+            with the same meaning as in 'submit'.
+        """
+
+        return [self.submit(method, **kwargs) for method, kwargs in calls]
+
+    def _request(self,
+                 endpoint: str,
+                 url: str,
+                 params: dict | None = None,
+                 retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        request = Request(endpoint, url, params or {}, retry_delays=retry_delays,
+                          options={"decode": False} if self._raw else {})
+        response = self._engine.send(request)
+        return response.content if self._raw else response.data
+
+    def _check_decoded(self, method: str) -> None:
+        if self._raw:
+            raise ValueError(
+                f"'{method}' works with decoded results, so it is not available on 'raw'."
+            )
+
+    def _submit(self, function, *args, **kwargs) -> Future:
+        # Runs a call on the managed executor, or right away when already on one of its
+        # threads (e.g. a 'donki_range' given to 'submit'), as waiting for a free thread could deadlock
+        if getattr(_worker, "active", False):
+            future = Future()
+            try:
+                future.set_result(function(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        return self._executor.submit(function, *args, **kwargs)
+
+    def _fan_out(self, calls: list, max_concurrency: int) -> list:
+        # Runs the (function, kwargs) calls on the managed executor, up to 'max_concurrency'
+        # at once, returning their results in order (or raising the first error)
+        results = [None] * len(calls)
+        remaining = iter(enumerate(calls))
+        in_flight = {}
+
+        def start(count: int) -> None:
+            for index, (function, kwargs) in islice(remaining, count):
+                in_flight[self._submit(function, **kwargs)] = index
+
+        start(max_concurrency)
+        try:
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    results[in_flight.pop(future)] = future.result()
+                start(len(done))
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+        return results
+
+    @property
+    def cache_stats(self) -> dict:
+        """
+        The hit, miss and coalesced request counts of each configured
+        cache, e.g. {'memory': {'hits': 10, 'misses': 2, 'coalesced': 3}}
+        (and the revalidated/modified counts of conditional requests)
+        """
+
+        return {name: dict(stage.stats) for name, stage in self._cache_stages.items()}
+
+    @property
+    def hooks(self) -> Hooks:
+        """
+        The Hooks registry of this client, e.g. client.hooks.on("retry", callback)
+        """
+
+        return self._engine.hooks
+
+    @property
+    def metrics(self) -> Metrics | None:
+        """
+        The Metrics collector given to this client, if any.
+        """
 
-        # Timeout Print
-        if timeout_print:
-            self._timeout_print = "(Request timed out after {previous_delay} seconds. Retrying for {delay} seconds.)\n"
-        if not timeout_print:
-            self._timeout_print = ""
+        return self._metrics
+
+    @property
+    def typed(self) -> TypedClient:
+        """
+        A view of this client whose methods return typed, slotted models
+        (e.g. APOD, NEO or CME) instead of plain dicts! Numeric and date
+        fields are parsed once, and nested data is only decoded when used.
+        (e.g. client.typed.neows_lookup(3542519).close_approaches)
+        """
+
+        return TypedClient(self)
+
+    @property
+    def raw(self) -> "NASAClient":
+        """
+        A view of this client whose methods return the undecoded response
+        body (bytes) instead of decoded JSON, so payloads can be forwarded
+        without being parsed and re-serialized! The view shares its connection
+        pool, caches and rate limit tracking with this client, so closing the
+        view does nothing (only this client closes them).
+        (Methods which merge results, such as 'neows_feed_range', are not available.)
+        """
+
+        view = copy(self)
+        view._raw = True
+        return view
 
     def get_headers(self,
                     remaining_amount: bool | None = True,
-                    total_amount: bool | None = True) -> dict:
+                    total_amount: bool | None = True,
+                    use_last_response: bool | None = False) -> dict:
         """
          Using this class method, you can retrieve the X-RateLimit
          HTTP headers containing the remaining requests and total
@@ -82,6 +403,12 @@ class NASAClient:
 
         :param total_amount: Whether to retrieve the total
             number of requests. This defaults to True.
+
+        :param use_last_response: If this parameter is set to True, the headers
+            are read from the last api.nasa.gov response instead of making a new
+            request, which does not use up any of the API key's requests!
+            (Both values are None if no request has been made yet.)
+            This defaults to False.
         """
 
         if not remaining_amount and not total_amount:
@@ -89,27 +416,22 @@ class NASAClient:
                 "Both remaining_amount and total_amount cannot be False."
             )
 
-        response = self._session.get(f"{self._base_nasa_url}/neo/rest/v1/neo/2001980?api_key={self._api_key}")
+        if not use_last_response:
+            request = Request("get_headers",
+                              f"{self._base_nasa_url}/neo/rest/v1/neo/2001980",
+                              {"api_key": self._api_key},
+                              check_status=False,
+                              options={"decode": False})
+            self._engine.send(request)
 
-        remaining = response.headers.get("X-RateLimit-Remaining")
-        total = response.headers.get("X-RateLimit-Limit")
+        remaining = self._rate_limit.remaining_header
+        total = self._rate_limit.limit_header
 
-        headers = None
+        headers = {}
         if remaining_amount:
-            headers = {
-                "rate_limit_remaining": remaining
-            }
-
+            headers["rate_limit_remaining"] = remaining
         if total_amount:
-            headers = {
-                "rate_limit_total": total
-            }
-
-        if remaining_amount and total_amount:
-            headers = {
-                "rate_limit_remaining": remaining,
-                "rate_limit_total": total
-            }
+            headers["rate_limit_total"] = total
 
         return headers
 
@@ -120,7 +442,7 @@ class NASAClient:
              end_date: str | None = None,
              count: int | None = None,
              thumbs: bool | None = None,
-             retry_delays: list[float] | None = None) -> dict:
+             retry_delays: list[float] | RetryPolicy | None = None) -> dict:
         """
         "This endpoint structures the APOD
         imagery and associated metadata so
@@ -162,7 +484,9 @@ class NASAClient:
             parameter if specified as well, allowing for further customization
             between API requests! (e.g. the list [5, 10, 15] will cause the
             wrapper to try three times, once for five seconds, once again for
-            ten seconds, etc.) This defaults to [10, 15, 30]
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
         """
 
         url = f"{self._base_nasa_url}/planetary/apod"
@@ -179,47 +503,13 @@ class NASAClient:
         if thumbs:
             params["thumbs"] = str(thumbs)
 
-        timing_out = False
-        previous_delay = None
-        timeout_error = None
-
-        for delay in retry_delays or self._default_retry_delays:
-            if timing_out:
-                print(
-                    self._timeout_print.format(previous_delay=previous_delay, delay=delay)
-                )
-
-            try:
-                response = self._session.get(url, params=params, timeout=delay)
-                response.raise_for_status()
-
-                return response.json()
-
-            except (ConnectTimeout,
-                    ReadTimeout) as e:
-                timing_out = True
-                previous_delay = delay
-
-                if ConnectTimeout:
-                    timeout_error = ConnectTimeout(
-                        f"{e}"
-                    )
-                if ReadTimeout:
-                    timeout_error = ReadTimeout(
-                        f"{e}"
-                    )
-
-            except HTTPError:
-                raise
-
-        else:
-            raise timeout_error
+        return self._request("apod", url, params, retry_delays)
 
     # Near Earth Object Web Service ( NeoWs )
     def neows_feed(self,
                    start_date: str | None = None,
                    end_date: str | None = None,
-                   retry_delays: list[float] | None = None) -> dict:
+                   retry_delays: list[float] | RetryPolicy | None = None) -> dict:
         """
         "Retrieve a list of Asteroids based on their closest approach date to Earth!"
 
@@ -238,7 +528,9 @@ class NASAClient:
             parameter if specified as well, allowing for further customization
             between API requests! (e.g. the list [5, 10, 15] will cause the
             wrapper to try three times, once for five seconds, once again for
-            ten seconds, etc.) This defaults to [10, 15, 30]
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
         """
 
         url = f"{self._base_nasa_url}/neo/rest/v1/feed"
@@ -249,45 +541,54 @@ class NASAClient:
         if end_date:
             params["end_date"] = end_date
 
-        timing_out = False
-        previous_delay = None
-        timeout_error = None
+        return self._request("neows_feed", url, params, retry_delays)
 
-        for delay in retry_delays or self._default_retry_delays:
-            if timing_out:
-                print(
-                    self._timeout_print.format(previous_delay=previous_delay, delay=delay)
-                )
+    def neows_feed_range(self,
+                         start_date: str,
+                         end_date: str,
+                         max_concurrency: int | None = 4,
+                         retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Retrieves the Asteroids closest approaching Earth within a date
+        range of any length! Since 'neows_feed' is limited to seven days
+        at a time, the range is split into seven-day windows which are
+        requested concurrently, and then merged into one result with the
+        'near_earth_objects' of every date and a combined 'element_count'.
 
-            try:
-                response = self._session.get(url, params=params, timeout=delay)
-                response.raise_for_status()
+        Date Format: YYYY-MM-DD
+
+        :param start_date: Starting date for the asteroid search.
+
+        :param end_date: Ending date for the asteroid search.
 
-                return response.json()
+        :param max_concurrency: The maximum number of windows requested at once.
+            (Requests still follow the 'pace_requests' class parameter!)
+            This defaults to 4.
 
-            except (ConnectTimeout,
-                    ReadTimeout) as e:
-                timing_out = True
-                previous_delay = delay
+        :param retry_delays: This parameter can be specified
+            with a list of floats/integers to override the DEFAULT timeout
+            retry delays in which will be attempted if a timeout occurs.
+            This will also override the main 'default_retry_delays'
+            parameter if specified as well, allowing for further customization
+            between API requests! (e.g. the list [5, 10, 15] will cause the
+            wrapper to try three times, once for five seconds, once again for
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
+        """
 
-                if ConnectTimeout:
-                    timeout_error = ConnectTimeout(
-                        f"{e}"
-                    )
-                if ReadTimeout:
-                    timeout_error = ReadTimeout(
-                        f"{e}"
-                    )
+        self._check_decoded("neows_feed_range")
 
-            except HTTPError:
-                raise
+        calls = [
+            (self.neows_feed, {"start_date": start, "end_date": end, "retry_delays": retry_delays})
+            for start, end in split_date_range(start_date, end_date, 7)
+        ]
 
-        else:
-            raise timeout_error
+        return merge_neows_feeds(self._fan_out(calls, max_concurrency))
 
     def neows_lookup(self,
                      asteroid_id: int,
-                     retry_delays: list[float] | None = None) -> dict:
+                     retry_delays: list[float] | RetryPolicy | None = None) -> dict:
         """
         "Lookup a specific asteroid based on its NASA JPL small body (SPK-ID) ID!"
 
@@ -302,53 +603,108 @@ class NASAClient:
             parameter if specified as well, allowing for further customization
             between API requests! (e.g. the list [5, 10, 15] will cause the
             wrapper to try three times, once for five seconds, once again for
-            ten seconds, etc.) This defaults to [10, 15, 30]
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
         """
 
         url = f"{self._base_nasa_url}/neo/rest/v1/neo/{asteroid_id}"
         params = {"api_key": self._api_key}
 
-        timing_out = False
-        previous_delay = None
-        timeout_error = None
+        return self._request("neows_lookup", url, params, retry_delays)
 
-        for delay in retry_delays or self._default_retry_delays:
-            if timing_out:
-                print(
-                    self._timeout_print.format(previous_delay=previous_delay, delay=delay)
-                )
-
-            try:
-                response = self._session.get(url, params=params, timeout=delay)
-                response.raise_for_status()
-
-                return response.json()
-
-            except (ConnectTimeout,
-                    ReadTimeout) as e:
-                timing_out = True
-                previous_delay = delay
+    def neows_lookup_many(self,
+                          asteroid_ids,
+                          max_concurrency: int | None = 8,
+                          on_error: str | None = "collect",
+                          retry_delays: list[float] | RetryPolicy | None = None):
+        """
+        Looks up many Asteroids by their NASA JPL small body (SPK-ID) IDs at
+        once! Duplicate IDs are only looked up once, up to 'max_concurrency'
+        lookups run at the same time on the client's managed executor, and
+        results are yielded as soon as they finish (not in the given order)
+        as (asteroid_id, data, error) tuples.
+
+        :param asteroid_ids: An iterable of Asteroid SPK-IDs. This can also
+            be a generator, which is only consumed as lookups finish.
+
+        :param max_concurrency: The maximum number of lookups running at once,
+            which is also capped by the 'max_workers' class parameter.
+            (Requests still follow the 'pace_requests' class parameter!)
+            This defaults to 8.
+
+        :param on_error: What to do when a single lookup fails.
+            "collect" yields (asteroid_id, None, error) and carries on,
+            "skip" leaves the failed ID out and carries on,
+            and "raise" stops the batch and raises the error.
+            This defaults to "collect".
 
-                if ConnectTimeout:
-                    timeout_error = ConnectTimeout(
-                        f"{e}"
-                    )
-                if ReadTimeout:
-                    timeout_error = ReadTimeout(
-                        f"{e}"
-                    )
+        :param retry_delays: This parameter can be specified
+            with a list of floats/integers to override the DEFAULT timeout
+            retry delays in which will be attempted if a timeout occurs.
+            This will also override the main 'default_retry_delays'
+            parameter if specified as well, allowing for further customization
+            between API requests! (e.g. the list [5, 10, 15] will cause the
+            wrapper to try three times, once for five seconds, once again for
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
+        """
 
-            except HTTPError:
-                raise
+        if on_error not in ("collect", "skip", "raise"):
+            raise ValueError(
+                f"on_error must be 'collect', 'skip' or 'raise', not {on_error!r}."
+            )
 
-        else:
-            raise timeout_error
+        def unique(ids):
+            # IDs are compared as strings, so 2001980 and "2001980" are only looked up once
+            seen = set()
+            for asteroid_id in ids:
+                if str(asteroid_id) not in seen:
+                    seen.add(str(asteroid_id))
+                    yield asteroid_id
+
+        ids = unique(asteroid_ids)
+        in_flight = {}
+        try:
+            for asteroid_id in islice(ids, max_concurrency):
+                in_flight[self._submit(self.neows_lookup, asteroid_id, retry_delays)] = asteroid_id
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    asteroid_id = in_flight.pop(future)
+
+                    # Refill the freed slot before handing out the result
+                    for next_id in islice(ids, 1):
+                        in_flight[self._submit(self.neows_lookup, next_id, retry_delays)] = next_id
+
+                    error = future.exception()
+                    if error is None:
+                        yield asteroid_id, future.result(), None
+                    elif on_error == "raise":
+                        raise error
+                    elif on_error == "collect":
+                        yield asteroid_id, None, error
+
+        finally:
+            # Lookups which haven't started yet are dropped when the iteration stops early
+            for future in in_flight:
+                future.cancel()
 
     def neows_browse(self,
-                     retry_delays: list[float] | None = None) -> dict:
+                     page: int | None = None,
+                     size: int | None = None,
+                     retry_delays: list[float] | RetryPolicy | None = None) -> dict:
         """
         "Browse the overall Asteroid data-set!"
 
+        :param page: The page of the data-set to retrieve, starting at 0.
+            This defaults to the first page.
+
+        :param size: The number of Asteroids per page.
+            This defaults to 20.
+
         :param retry_delays: This parameter can be specified
             with a list of floats/integers to override the DEFAULT timeout
             retry delays in which will be attempted if a timeout occurs.
@@ -356,53 +712,92 @@ class NASAClient:
             parameter if specified as well, allowing for further customization
             between API requests! (e.g. the list [5, 10, 15] will cause the
             wrapper to try three times, once for five seconds, once again for
-            ten seconds, etc.) This defaults to [10, 15, 30]
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
         """
 
         url = f"{self._base_nasa_url}/neo/rest/v1/neo/browse"
         params = {"api_key": self._api_key}
 
-        timing_out = False
-        previous_delay = None
-        timeout_error = None
+        if page:
+            params["page"] = str(page)
+        if size:
+            params["size"] = str(size)
 
-        for delay in retry_delays or self._default_retry_delays:
-            if timing_out:
-                print(
-                    self._timeout_print.format(previous_delay=previous_delay, delay=delay)
-                )
+        return self._request("neows_browse", url, params, retry_delays)
 
-            try:
-                response = self._session.get(url, params=params, timeout=delay)
-                response.raise_for_status()
+    def iter_neows_browse(self,
+                          page_size: int | None = 20,
+                          start_page: int | None = 0,
+                          prefetch: int | None = 2,
+                          retry_delays: list[float] | RetryPolicy | None = None):
+        """
+        Iterates over the overall Asteroid data-set one Asteroid at a time,
+        walking through every page of 'neows_browse'! The next pages are
+        requested in the background while the current page is being processed,
+        and only the pages being prefetched are held in memory, so the whole
+        data-set can be swept without ever loading all of it at once.
+
+        :param page_size: The number of Asteroids per page.
+            This defaults to 20.
 
-                return response.json()
+        :param start_page: The page to start iterating from.
+            This defaults to 0 (The first page).
 
-            except (ConnectTimeout,
-                    ReadTimeout) as e:
-                timing_out = True
-                previous_delay = delay
+        :param prefetch: The number of pages to request ahead of the current one,
+            on the client's worker threads. 0 requests each page only once the
+            previous one has been iterated through. This defaults to 2.
 
-                if ConnectTimeout:
-                    timeout_error = ConnectTimeout(
-                        f"{e}"
-                    )
-                if ReadTimeout:
-                    timeout_error = ReadTimeout(
-                        f"{e}"
-                    )
+        :param retry_delays: This parameter can be specified
+            with a list of floats/integers to override the DEFAULT timeout
+            retry delays in which will be attempted if a timeout occurs.
+            This will also override the main 'default_retry_delays'
+            parameter if specified as well, allowing for further customization
+            between API requests! (e.g. the list [5, 10, 15] will cause the
+            wrapper to try three times, once for five seconds, once again for
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
+        """
 
-            except HTTPError:
-                raise
+        self._check_decoded("iter_neows_browse")
 
-        else:
-            raise timeout_error
+        def fetch(page):
+            return self.neows_browse(page=page, size=page_size, retry_delays=retry_delays)
+
+        pending = deque()
+        try:
+            data = fetch(start_page)
+            total_pages = data["page"]["total_pages"]
+            next_page = start_page + 1
+
+            while True:
+                # Keep up to 'prefetch' upcoming pages in flight while this page is consumed
+                while len(pending) < prefetch and next_page < total_pages:
+                    pending.append(self._submit(fetch, next_page))
+                    next_page += 1
+
+                yield from data["near_earth_objects"]
+
+                if not data.get("links", {}).get("next") or (not pending and next_page >= total_pages):
+                    break
+
+                if pending:
+                    data = pending.popleft().result()
+                else:
+                    data = fetch(next_page)
+                    next_page += 1
+
+        finally:
+            for future in pending:
+                future.cancel()
 
     # Space Weather Database Of Notifications, Knowledge, Information ( DONKI )
     def donki_cme(self,
                   start_date: str | None = None,
                   end_date: str | None = None,
-                  retry_delays: list[float] | None = None) -> dict:
+                  retry_delays: list[float] | RetryPolicy | None = None) -> dict:
         """
         Retrieves basic DONKI Coronal Mass Injection analyses (CMEs)
         within a specific time frame!
@@ -422,7 +817,9 @@ class NASAClient:
             parameter if specified as well, allowing for further customization
             between API requests! (e.g. the list [5, 10, 15] will cause the
             wrapper to try three times, once for five seconds, once again for
-            ten seconds, etc.) This defaults to [10, 15, 30]
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
         """
 
         url = f"{self._base_nasa_url}/DONKI/CME"
@@ -433,41 +830,7 @@ class NASAClient:
         if end_date:
             params["endDate"] = end_date
 
-        timing_out = False
-        previous_delay = None
-        timeout_error = None
-
-        for delay in retry_delays or self._default_retry_delays:
-            if timing_out:
-                print(
-                    self._timeout_print.format(previous_delay=previous_delay, delay=delay)
-                )
-
-            try:
-                response = self._session.get(url, params=params, timeout=delay)
-                response.raise_for_status()
-
-                return response.json()
-
-            except (ConnectTimeout,
-                    ReadTimeout) as e:
-                timing_out = True
-                previous_delay = delay
-
-                if ConnectTimeout:
-                    timeout_error = ConnectTimeout(
-                        f"{e}"
-                    )
-                if ReadTimeout:
-                    timeout_error = ReadTimeout(
-                        f"{e}"
-                    )
-
-            except HTTPError:
-                raise
-
-        else:
-            raise timeout_error
+        return self._request("donki_cme", url, params, retry_delays)
 
     def donki_cme_analysis(self,
                            start_date: str | None = None,
@@ -478,7 +841,7 @@ class NASAClient:
                            half_angle: int = 0,
                            catalog: str | None = None,
                            keyword: str | None = None,
-                           retry_delays: list[float] | None = None) -> dict:
+                           retry_delays: list[float] | RetryPolicy | None = None) -> dict:
         """
         Retrieves more robust analyses from DONKI Coronal Mass Injections (CMEs)
         within a specific time frame, accuracy, catalog, and/or keyword!
@@ -520,7 +883,9 @@ class NASAClient:
             parameter if specified as well, allowing for further customization
             between API requests! (e.g. the list [5, 10, 15] will cause the
             wrapper to try three times, once for five seconds, once again for
-            ten seconds, etc.) This defaults to [10, 15, 30]
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
         """
 
         url = f"{self._base_nasa_url}/DONKI/CMEAnalysis"
@@ -543,46 +908,12 @@ class NASAClient:
         if keyword:
             params["keyword"] = keyword
 
-        timing_out = False
-        previous_delay = None
-        timeout_error = None
-
-        for delay in retry_delays or self._default_retry_delays:
-            if timing_out:
-                print(
-                    self._timeout_print.format(previous_delay=previous_delay, delay=delay)
-                )
-
-            try:
-                response = self._session.get(url, params=params, timeout=delay)
-                response.raise_for_status()
-
-                return response.json()
-
-            except (ConnectTimeout,
-                    ReadTimeout) as e:
-                timing_out = True
-                previous_delay = delay
-
-                if ConnectTimeout:
-                    timeout_error = ConnectTimeout(
-                        f"{e}"
-                    )
-                if ReadTimeout:
-                    timeout_error = ReadTimeout(
-                        f"{e}"
-                    )
-
-            except HTTPError:
-                raise
-
-        else:
-            raise timeout_error
+        return self._request("donki_cme_analysis", url, params, retry_delays)
 
     def donki_gst(self,
                   start_date: str | None = None,
                   end_date: str | None = None,
-                  retry_delays: list[float] | None = None) -> dict:
+                  retry_delays: list[float] | RetryPolicy | None = None) -> dict:
         """
         Retrieves DONKI Geomagnetic Storm analyses (GSTs)
         within a specific time frame!
@@ -602,7 +933,9 @@ class NASAClient:
             parameter if specified as well, allowing for further customization
             between API requests! (e.g. the list [5, 10, 15] will cause the
             wrapper to try three times, once for five seconds, once again for
-            ten seconds, etc.) This defaults to [10, 15, 30]
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
         """
 
         url = f"{self._base_nasa_url}/DONKI/GST"
@@ -613,48 +946,14 @@ class NASAClient:
         if end_date:
             params["endDate"] = end_date
 
-        timing_out = False
-        previous_delay = None
-        timeout_error = None
-
-        for delay in retry_delays or self._default_retry_delays:
-            if timing_out:
-                print(
-                    self._timeout_print.format(previous_delay=previous_delay, delay=delay)
-                )
-
-            try:
-                response = self._session.get(url, params=params, timeout=delay)
-                response.raise_for_status()
-
-                return response.json()
-
-            except (ConnectTimeout,
-                    ReadTimeout) as e:
-                timing_out = True
-                previous_delay = delay
-
-                if ConnectTimeout:
-                    timeout_error = ConnectTimeout(
-                        f"{e}"
-                    )
-                if ReadTimeout:
-                    timeout_error = ReadTimeout(
-                        f"{e}"
-                    )
-
-            except HTTPError:
-                raise
-
-        else:
-            raise timeout_error
+        return self._request("donki_gst", url, params, retry_delays)
 
     def donki_ips(self,
                   start_date: str | None = None,
                   end_date: str | None = None,
                   location: str | None = None,
                   catalog: str | None = None,
-                  retry_delays: list[float] | None = None) -> dict:
+                  retry_delays: list[float] | RetryPolicy | None = None) -> dict:
         """
         Retrieves DONKI Interplanetary Shock analyses (IPSs)
         within a specific time frame, location, and/or catalog!
@@ -682,7 +981,9 @@ class NASAClient:
             parameter if specified as well, allowing for further customization
             between API requests! (e.g. the list [5, 10, 15] will cause the
             wrapper to try three times, once for five seconds, once again for
-            ten seconds, etc.) This defaults to [10, 15, 30]
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
         """
 
         url = f"{self._base_nasa_url}/DONKI/IPS"
@@ -697,46 +998,12 @@ class NASAClient:
         if catalog:
             params["catalog"] = catalog
 
-        timing_out = False
-        previous_delay = None
-        timeout_error = None
-
-        for delay in retry_delays or self._default_retry_delays:
-            if timing_out:
-                print(
-                    self._timeout_print.format(previous_delay=previous_delay, delay=delay)
-                )
-
-            try:
-                response = self._session.get(url, params=params, timeout=delay)
-                response.raise_for_status()
-
-                return response.json()
-
-            except (ConnectTimeout,
-                    ReadTimeout) as e:
-                timing_out = True
-                previous_delay = delay
-
-                if ConnectTimeout:
-                    timeout_error = ConnectTimeout(
-                        f"{e}"
-                    )
-                if ReadTimeout:
-                    timeout_error = ReadTimeout(
-                        f"{e}"
-                    )
-
-            except HTTPError:
-                raise
-
-        else:
-            raise timeout_error
+        return self._request("donki_ips", url, params, retry_delays)
 
     def donki_flr(self,
                   start_date: str | None = None,
                   end_date: str | None = None,
-                  retry_delays: list[float] | None = None) -> dict:
+                  retry_delays: list[float] | RetryPolicy | None = None) -> dict:
         """
         Retrieves DONKI Solar Flare analyses (FLRs)
         within a specific time frame!
@@ -756,7 +1023,9 @@ class NASAClient:
             parameter if specified as well, allowing for further customization
             between API requests! (e.g. the list [5, 10, 15] will cause the
             wrapper to try three times, once for five seconds, once again for
-            ten seconds, etc.) This defaults to [10, 15, 30]
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
         """
 
         url = f"{self._base_nasa_url}/DONKI/FLR"
@@ -767,46 +1036,12 @@ class NASAClient:
         if end_date:
             params["endDate"] = end_date
 
-        timing_out = False
-        previous_delay = None
-        timeout_error = None
-
-        for delay in retry_delays or self._default_retry_delays:
-            if timing_out:
-                print(
-                    self._timeout_print.format(previous_delay=previous_delay, delay=delay)
-                )
-
-            try:
-                response = self._session.get(url, params=params, timeout=delay)
-                response.raise_for_status()
-
-                return response.json()
-
-            except (ConnectTimeout,
-                    ReadTimeout) as e:
-                timing_out = True
-                previous_delay = delay
-
-                if ConnectTimeout:
-                    timeout_error = ConnectTimeout(
-                        f"{e}"
-                    )
-                if ReadTimeout:
-                    timeout_error = ReadTimeout(
-                        f"{e}"
-                    )
-
-            except HTTPError:
-                raise
-
-        else:
-            raise timeout_error
+        return self._request("donki_flr", url, params, retry_delays)
 
     def donki_sep(self,
                   start_date: str | None = None,
                   end_date: str | None = None,
-                  retry_delays: list[float] | None = None) -> dict:
+                  retry_delays: list[float] | RetryPolicy | None = None) -> dict:
         """
         Retrieves DONKI Solar Energetic Particle analyses (SEP)
         within a specific time frame!
@@ -826,7 +1061,9 @@ class NASAClient:
             parameter if specified as well, allowing for further customization
             between API requests! (e.g. the list [5, 10, 15] will cause the
             wrapper to try three times, once for five seconds, once again for
-            ten seconds, etc.) This defaults to [10, 15, 30]
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
         """
 
         url = f"{self._base_nasa_url}/DONKI/SEP"
@@ -837,46 +1074,12 @@ class NASAClient:
         if end_date:
             params["endDate"] = end_date
 
-        timing_out = False
-        previous_delay = None
-        timeout_error = None
-
-        for delay in retry_delays or self._default_retry_delays:
-            if timing_out:
-                print(
-                    self._timeout_print.format(previous_delay=previous_delay, delay=delay)
-                )
-
-            try:
-                response = self._session.get(url, params=params, timeout=delay)
-                response.raise_for_status()
-
-                return response.json()
-
-            except (ConnectTimeout,
-                    ReadTimeout) as e:
-                timing_out = True
-                previous_delay = delay
-
-                if ConnectTimeout:
-                    timeout_error = ConnectTimeout(
-                        f"{e}"
-                    )
-                if ReadTimeout:
-                    timeout_error = ReadTimeout(
-                        f"{e}"
-                    )
-
-            except HTTPError:
-                raise
-
-        else:
-            raise timeout_error
+        return self._request("donki_sep", url, params, retry_delays)
 
     def donki_mpc(self,
                   start_date: str | None = None,
                   end_date: str | None = None,
-                  retry_delays: list[float] | None = None) -> dict:
+                  retry_delays: list[float] | RetryPolicy | None = None) -> dict:
         """
         Retrieves DONKI Magnetopause Crossing analyses (MPC)
         within a specific time frame!
@@ -896,7 +1099,9 @@ class NASAClient:
             parameter if specified as well, allowing for further customization
             between API requests! (e.g. the list [5, 10, 15] will cause the
             wrapper to try three times, once for five seconds, once again for
-            ten seconds, etc.) This defaults to [10, 15, 30]
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
         """
 
         url = f"{self._base_nasa_url}/DONKI/MPC"
@@ -907,46 +1112,12 @@ class NASAClient:
         if end_date:
             params["endDate"] = end_date
 
-        timing_out = False
-        previous_delay = None
-        timeout_error = None
-
-        for delay in retry_delays or self._default_retry_delays:
-            if timing_out:
-                print(
-                    self._timeout_print.format(previous_delay=previous_delay, delay=delay)
-                )
-
-            try:
-                response = self._session.get(url, params=params, timeout=delay)
-                response.raise_for_status()
-
-                return response.json()
-
-            except (ConnectTimeout,
-                    ReadTimeout) as e:
-                timing_out = True
-                previous_delay = delay
-
-                if ConnectTimeout:
-                    timeout_error = ConnectTimeout(
-                        f"{e}"
-                    )
-                if ReadTimeout:
-                    timeout_error = ReadTimeout(
-                        f"{e}"
-                    )
-
-            except HTTPError:
-                raise
-
-        else:
-            raise timeout_error
+        return self._request("donki_mpc", url, params, retry_delays)
 
     def donki_rbe(self,
                   start_date: str | None = None,
                   end_date: str | None = None,
-                  retry_delays: list[float] | None = None) -> dict:
+                  retry_delays: list[float] | RetryPolicy | None = None) -> dict:
         """
         Retrieves DONKI Radiation Belt Enhancement analyses (RBE)
         within a specific time frame!
@@ -966,7 +1137,9 @@ class NASAClient:
             parameter if specified as well, allowing for further customization
             between API requests! (e.g. the list [5, 10, 15] will cause the
             wrapper to try three times, once for five seconds, once again for
-            ten seconds, etc.) This defaults to [10, 15, 30]
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
         """
 
         url = f"{self._base_nasa_url}/DONKI/RBE"
@@ -977,46 +1150,12 @@ class NASAClient:
         if end_date:
             params["endDate"] = end_date
 
-        timing_out = False
-        previous_delay = None
-        timeout_error = None
-
-        for delay in retry_delays or self._default_retry_delays:
-            if timing_out:
-                print(
-                    self._timeout_print.format(previous_delay=previous_delay, delay=delay)
-                )
-
-            try:
-                response = self._session.get(url, params=params, timeout=delay)
-                response.raise_for_status()
-
-                return response.json()
-
-            except (ConnectTimeout,
-                    ReadTimeout) as e:
-                timing_out = True
-                previous_delay = delay
-
-                if ConnectTimeout:
-                    timeout_error = ConnectTimeout(
-                        f"{e}"
-                    )
-                if ReadTimeout:
-                    timeout_error = ReadTimeout(
-                        f"{e}"
-                    )
-
-            except HTTPError:
-                raise
-
-        else:
-            raise timeout_error
+        return self._request("donki_rbe", url, params, retry_delays)
 
     def donki_hss(self,
                   start_date: str | None = None,
                   end_date: str | None = None,
-                  retry_delays: list[float] | None = None) -> dict:
+                  retry_delays: list[float] | RetryPolicy | None = None) -> dict:
         """
         Retrieves DONKI Hight Speed Stream analyses (HSS)
         within a specific time frame!
@@ -1036,7 +1175,9 @@ class NASAClient:
             parameter if specified as well, allowing for further customization
             between API requests! (e.g. the list [5, 10, 15] will cause the
             wrapper to try three times, once for five seconds, once again for
-            ten seconds, etc.) This defaults to [10, 15, 30]
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
         """
 
         url = f"{self._base_nasa_url}/DONKI/HSS"
@@ -1047,46 +1188,12 @@ class NASAClient:
         if end_date:
             params["endDate"] = end_date
 
-        timing_out = False
-        previous_delay = None
-        timeout_error = None
-
-        for delay in retry_delays or self._default_retry_delays:
-            if timing_out:
-                print(
-                    self._timeout_print.format(previous_delay=previous_delay, delay=delay)
-                )
-
-            try:
-                response = self._session.get(url, params=params, timeout=delay)
-                response.raise_for_status()
-
-                return response.json()
-
-            except (ConnectTimeout,
-                    ReadTimeout) as e:
-                timing_out = True
-                previous_delay = delay
-
-                if ConnectTimeout:
-                    timeout_error = ConnectTimeout(
-                        f"{e}"
-                    )
-                if ReadTimeout:
-                    timeout_error = ReadTimeout(
-                        f"{e}"
-                    )
-
-            except HTTPError:
-                raise
-
-        else:
-            raise timeout_error
+        return self._request("donki_hss", url, params, retry_delays)
 
     def donki_wsa_es(self,
                      start_date: str | None = None,
                      end_date: str | None = None,
-                     retry_delays: list[float] | None = None) -> dict:
+                     retry_delays: list[float] | RetryPolicy | None = None) -> dict:
         """
         Retrieves DONKI WSA+EnlilSimulation analyses
         within a specific time frame!
@@ -1106,7 +1213,9 @@ class NASAClient:
             parameter if specified as well, allowing for further customization
             between API requests! (e.g. the list [5, 10, 15] will cause the
             wrapper to try three times, once for five seconds, once again for
-            ten seconds, etc.) This defaults to [10, 15, 30]
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
         """
 
         url = f"{self._base_nasa_url}/DONKI/WSAEnlilSimulations"
@@ -1117,47 +1226,13 @@ class NASAClient:
         if end_date:
             params["endDate"] = end_date
 
-        timing_out = False
-        previous_delay = None
-        timeout_error = None
-
-        for delay in retry_delays or self._default_retry_delays:
-            if timing_out:
-                print(
-                    self._timeout_print.format(previous_delay=previous_delay, delay=delay)
-                )
-
-            try:
-                response = self._session.get(url, params=params, timeout=delay)
-                response.raise_for_status()
-
-                return response.json()
-
-            except (ConnectTimeout,
-                    ReadTimeout) as e:
-                timing_out = True
-                previous_delay = delay
-
-                if ConnectTimeout:
-                    timeout_error = ConnectTimeout(
-                        f"{e}"
-                    )
-                if ReadTimeout:
-                    timeout_error = ReadTimeout(
-                        f"{e}"
-                    )
-
-            except HTTPError:
-                raise
-
-        else:
-            raise timeout_error
+        return self._request("donki_wsa_es", url, params, retry_delays)
 
     def donki_notifications(self,
                             start_date: str | None = None,
                             end_date: str | None = None,
                             notification_type: str | None = None,
-                            retry_delays: list[float] | None = None) -> dict:
+                            retry_delays: list[float] | RetryPolicy | None = None) -> dict:
         """
         Retrieve DONKI Notifications within a specific time frame
         and/or a notification type!
@@ -1181,7 +1256,9 @@ class NASAClient:
             parameter if specified as well, allowing for further customization
             between API requests! (e.g. the list [5, 10, 15] will cause the
             wrapper to try three times, once for five seconds, once again for
-            ten seconds, etc.) This defaults to [10, 15, 30]
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
         """
 
         url = f"{self._base_nasa_url}/DONKI/notifications"
@@ -1194,43 +1271,161 @@ class NASAClient:
         if notification_type:
             params["type"] = notification_type
 
-        timing_out = False
-        previous_delay = None
-        timeout_error = None
+        return self._request("donki_notifications", url, params, retry_delays)
+
+    def donki_snapshot(self,
+                       start_date: str | None = None,
+                       end_date: str | None = None,
+                       kinds: list[str] | None = None,
+                       max_concurrency: int | None = None,
+                       retry_delays: list[float] | RetryPolicy | None = None) -> dict:
+        """
+        Retrieves multiple DONKI event types within the same time frame
+        at once! All requests are made concurrently over the shared
+        connection pool, so this only takes as long as the slowest request,
+        and returns a dict keyed by event type. (e.g. {"cme": [...], "flr": [...]})
+
+        Date Format: YYYY-MM-DD
+
+        :param start_date: The starting date for the search.
+            This defaults to each endpoint's own default.
+
+        :param end_date: The ending date for the search.
+            This defaults to the current UTC date.
+
+        :param kinds: The event types to retrieve.
+            This defaults to ALL event types.
+            (Options: cme, cme_analysis, gst, ips, flr, sep,
+            mpc, rbe, hss, wsa_es, notifications)
+
+        :param max_concurrency: The maximum number of requests made at once.
+            This defaults to the number of event types.
 
-        for delay in retry_delays or self._default_retry_delays:
-            if timing_out:
-                print(
-                    self._timeout_print.format(previous_delay=previous_delay, delay=delay)
+        :param retry_delays: This parameter can be specified
+            with a list of floats/integers to override the DEFAULT timeout
+            retry delays in which will be attempted if a timeout occurs.
+            This will also override the main 'default_retry_delays'
+            parameter if specified as well, allowing for further customization
+            between API requests! (e.g. the list [5, 10, 15] will cause the
+            wrapper to try three times, once for five seconds, once again for
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
+        """
+
+        kinds = list(kinds or self._donki_kinds)
+        for kind in kinds:
+            if kind not in self._donki_kinds:
+                raise ValueError(
+                    f"Unknown DONKI event type {kind!r}. (Options: {', '.join(self._donki_kinds)})"
                 )
 
-            try:
-                response = self._session.get(url, params=params, timeout=delay)
-                response.raise_for_status()
+        calls = [
+            (getattr(self, f"donki_{kind}"),
+             {"start_date": start_date, "end_date": end_date, "retry_delays": retry_delays})
+            for kind in kinds
+        ]
+
+        return dict(zip(kinds, self._fan_out(calls, max_concurrency or len(kinds))))
+
+    def donki_range(self,
+                    kind: str,
+                    start_date: str,
+                    end_date: str,
+                    window_days: int | None = 30,
+                    max_concurrency: int | None = 4,
+                    retry_delays: list[float] | RetryPolicy | None = None,
+                    **params) -> list:
+        """
+        Retrieves one DONKI event type over a long time frame (e.g. ten years)!
+        Long time frames are slow and tend to time out, so the time frame is
+        split into smaller windows which are requested concurrently, and then
+        merged into one list. Events which appear in more than one window are
+        only included once, based on their IDs ('activityID', 'flrID', 'gstID', etc.)
+
+        Date Format: YYYY-MM-DD
 
-                return response.json()
+        :param kind: The event type to retrieve.
+            (Options: cme, cme_analysis, gst, ips, flr, sep,
+            mpc, rbe, hss, wsa_es, notifications)
 
-            except (ConnectTimeout,
-                    ReadTimeout) as e:
-                timing_out = True
-                previous_delay = delay
+        :param start_date: The starting date for the search.
 
-                if ConnectTimeout:
-                    timeout_error = ConnectTimeout(
-                        f"{e}"
-                    )
-                if ReadTimeout:
-                    timeout_error = ReadTimeout(
-                        f"{e}"
-                    )
+        :param end_date: The ending date for the search.
 
-            except HTTPError:
-                raise
+        :param window_days: The number of days within each window.
+            This defaults to 30.
 
-        else:
-            raise timeout_error
+        :param max_concurrency: The maximum number of windows requested at once.
+            (Requests still follow the 'pace_requests' class parameter!)
+            This defaults to 4.
+
+        :param retry_delays: This parameter can be specified
+            with a list of floats/integers to override the DEFAULT timeout
+            retry delays in which will be attempted if a timeout occurs.
+            This will also override the main 'default_retry_delays'
+            parameter if specified as well, allowing for further customization
+            between API requests! (e.g. the list [5, 10, 15] will cause the
+            wrapper to try three times, once for five seconds, once again for
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
+
+        :param params: Any other parameters of the chosen event type's method.
+            (e.g. location="Earth" for "ips", or notification_type="FLR" for "notifications")
+        """
+
+        self._check_decoded("donki_range")
+
+        if kind not in self._donki_kinds:
+            raise ValueError(
+                f"Unknown DONKI event type {kind!r}. (Options: {', '.join(self._donki_kinds)})"
+            )
+        if window_days < 1:
+            raise ValueError(
+                f"window_days must be at least 1, not {window_days}."
+            )
+
+        calls = [
+            (getattr(self, f"donki_{kind}"),
+             {"start_date": start, "end_date": end, "retry_delays": retry_delays, **params})
+            for start, end in split_date_range(start_date, end_date, window_days - 1)
+        ]
+
+        return merge_donki_events(self._fan_out(calls, max_concurrency))
 
     # The Earth Observatory Natural Event Tracker (EONET)
+    @staticmethod
+    def _eonet_params(source, category, status, limit, days, start_date,
+                      end_date, mag_id, mag_min, mag_max, bounding_box) -> dict:
+        params = {}
+
+        if source:
+            params["source"] = source
+        if category:
+            params["category"] = category
+        if status:
+            params["status"] = status
+        if limit:
+            params["limit"] = limit
+        if days:
+            params["days"] = days
+        if start_date:
+            params["start"] = start_date
+        if end_date:
+            params["end"] = end_date
+        if mag_id:
+            params["magID"] = mag_id
+        if mag_min:
+            params["magMin"] = mag_min
+        if mag_max:
+            params["magMax"] = mag_max
+        if bounding_box:
+            values = ",".join(map(str, bounding_box))
+            params["bbox"] = values
+
+        return params
+
     def eonet_events(self,
                      source: str | None = None,
                      category: str | None = None,
@@ -1243,7 +1438,7 @@ class NASAClient:
                      mag_min: float | None = None,
                      mag_max: float | None = None,
                      bounding_box: list[float] | None = None,
-                     retry_delays: list[float] | None = None) -> dict:
+                     retry_delays: list[float] | RetryPolicy | None = None) -> dict:
         """
         Retrieve Earth Observatory Natural Event Tracker (EONET)
         events with up to eleven optional parameters. Such as: Source,
@@ -1306,71 +1501,16 @@ class NASAClient:
             parameter if specified as well, allowing for further customization
             between API requests! (e.g. the list [5, 10, 15] will cause the
             wrapper to try three times, once for five seconds, once again for
-            ten seconds, etc.) This defaults to [10, 15, 30]
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
         """
 
         url = f"{self._base_eonet_url}/events"
-        params = {}
+        params = self._eonet_params(source, category, status, limit, days, start_date,
+                                    end_date, mag_id, mag_min, mag_max, bounding_box)
 
-        if source:
-            params["source"] = source
-        if category:
-            params["category"] = category
-        if status:
-            params["status"] = status
-        if limit:
-            params["limit"] = limit
-        if days:
-            params["days"] = days
-        if start_date:
-            params["start"] = start_date
-        if end_date:
-            params["end"] = end_date
-        if mag_id:
-            params["magID"] = mag_id
-        if mag_min:
-            params["magMin"] = mag_min
-        if mag_max:
-            params["magMax"] = mag_max
-        if bounding_box:
-            values = ",".join(map(str, bounding_box))
-            params["bbox"] = values
-
-        timing_out = False
-        previous_delay = None
-        timeout_error = None
-
-        for delay in retry_delays or self._default_retry_delays:
-            if timing_out:
-                print(
-                    self._timeout_print.format(previous_delay=previous_delay, delay=delay)
-                )
-
-            try:
-                response = self._session.get(url, params=params, timeout=delay)
-                response.raise_for_status()
-
-                return response.json()
-
-            except (ConnectTimeout,
-                    ReadTimeout) as e:
-                timing_out = True
-                previous_delay = delay
-
-                if ConnectTimeout:
-                    timeout_error = ConnectTimeout(
-                        f"{e}"
-                    )
-                if ReadTimeout:
-                    timeout_error = ReadTimeout(
-                        f"{e}"
-                    )
-
-            except HTTPError:
-                raise
-
-        else:
-            raise timeout_error
+        return self._request("eonet_events", url, params, retry_delays)
 
     def eonet_events_geojson(self,
                              source: str | None = None,
@@ -1384,7 +1524,7 @@ class NASAClient:
                              mag_min: float | None = None,
                              mag_max: float | None = None,
                              bounding_box: list[float] | None = None,
-                             retry_delays: list[float] | None = None) -> dict:
+                             retry_delays: list[float] | RetryPolicy | None = None) -> dict:
         """
         Retrieve Earth Observatory Natural Event Tracker (EONET)
         GeoJSON events with up to eleven optional parameters. Such as:
@@ -1447,71 +1587,68 @@ class NASAClient:
             parameter if specified as well, allowing for further customization
             between API requests! (e.g. the list [5, 10, 15] will cause the
             wrapper to try three times, once for five seconds, once again for
-            ten seconds, etc.) This defaults to [10, 15, 30]
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
         """
 
-        url = f"{self._base_eonet_url}/events"
-        params = {}
-
-        if source:
-            params["source"] = source
-        if category:
-            params["category"] = category
-        if status:
-            params["status"] = status
-        if limit:
-            params["limit"] = limit
-        if days:
-            params["days"] = days
-        if start_date:
-            params["start"] = start_date
-        if end_date:
-            params["end"] = end_date
-        if mag_id:
-            params["magID"] = mag_id
-        if mag_min:
-            params["magMin"] = mag_min
-        if mag_max:
-            params["magMax"] = mag_max
-        if bounding_box:
-            values = ",".join(map(str, bounding_box))
-            params["bbox"] = values
-
-        timing_out = False
-        previous_delay = None
-        timeout_error = None
-
-        for delay in retry_delays or self._default_retry_delays:
-            if timing_out:
-                print(
-                    self._timeout_print.format(previous_delay=previous_delay, delay=delay)
-                )
-
-            try:
-                response = self._session.get(url, params=params, timeout=delay)
-                response.raise_for_status()
-
-                return response.json()
+        url = f"{self._base_eonet_url}/events/geojson"
+        params = self._eonet_params(source, category, status, limit, days, start_date,
+                                    end_date, mag_id, mag_min, mag_max, bounding_box)
+
+        return self._request("eonet_events_geojson", url, params, retry_delays)
+
+    def iter_eonet_events(self,
+                          source: str | None = None,
+                          category: str | None = None,
+                          status: str | None = None,
+                          limit: int | None = None,
+                          days: int | None = None,
+                          start_date: str | None = None,
+                          end_date: str | None = None,
+                          mag_id: str | None = None,
+                          mag_min: float | None = None,
+                          mag_max: float | None = None,
+                          bounding_box: list[float] | None = None,
+                          geojson: bool | None = False,
+                          chunk_size: int | None = 65536,
+                          retry_delays: list[float] | RetryPolicy | None = None):
+        """
+        Streams Earth Observatory Natural Event Tracker (EONET) events,
+        yielding each event as soon as it has been received and parsed,
+        instead of downloading and decoding the whole response first!
+        This keeps memory usage flat for large queries (e.g. status="all"
+        over many years), and the first events are available right away.
+        Stopping the iteration early also closes the connection.
+
+        All filter parameters behave the same as in 'eonet_events'.
+        Streamed responses are never cached.
+
+        :param geojson: If True, GeoJSON features are yielded
+            (as in 'eonet_events_geojson') instead of events.
+            This defaults to False.
 
-            except (ConnectTimeout,
-                    ReadTimeout) as e:
-                timing_out = True
-                previous_delay = delay
+        :param chunk_size: The number of bytes read from the connection at a time.
+            This defaults to 65536.
 
-                if ConnectTimeout:
-                    timeout_error = ConnectTimeout(
-                        f"{e}"
-                    )
-                if ReadTimeout:
-                    timeout_error = ReadTimeout(
-                        f"{e}"
-                    )
+        :param retry_delays: This parameter can be specified
+            with a list of floats/integers to override the DEFAULT timeout
+            retry delays in which will be attempted if a timeout occurs.
+            Retries only cover connecting and receiving the response headers,
+            not the body once streaming has started. This defaults to [10, 15, 30]
+        """
 
-            except HTTPError:
-                raise
+        url = f"{self._base_eonet_url}/events/geojson" if geojson else f"{self._base_eonet_url}/events"
+        params = self._eonet_params(source, category, status, limit, days, start_date,
+                                    end_date, mag_id, mag_min, mag_max, bounding_box)
 
-        else:
-            raise timeout_error
+        request = Request("iter_eonet_events", url, params, retry_delays=retry_delays,
+                          stream=True, options={"chunk_size": chunk_size})
+        response = self._engine.send(request)
+        try:
+            yield from iter_array(response.chunks, "features" if geojson else "events")
+        finally:
+            response.close()
 
     def eonet_categories(self,
                          category: str | None = None,
@@ -1521,7 +1658,7 @@ class NASAClient:
                          days: int | None = None,
                          start_date: str | None = None,
                          end_date: str | None = None,
-                         retry_delays: list[float] | None = None) -> dict:
+                         retry_delays: list[float] | RetryPolicy | None = None) -> dict:
         """
         "Categories are the types of events by which individual
         events are cataloged. Categories can be used to filter
@@ -1565,7 +1702,9 @@ class NASAClient:
             parameter if specified as well, allowing for further customization
             between API requests! (e.g. the list [5, 10, 15] will cause the
             wrapper to try three times, once for five seconds, once again for
-            ten seconds, etc.) This defaults to [10, 15, 30]
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
         """
 
         url = f"{self._base_eonet_url}/categories"
@@ -1586,45 +1725,11 @@ class NASAClient:
         if end_date:
             params["end"] = end_date
 
-        timing_out = False
-        previous_delay = None
-        timeout_error = None
-
-        for delay in retry_delays or self._default_retry_delays:
-            if timing_out:
-                print(
-                    self._timeout_print.format(previous_delay=previous_delay, delay=delay)
-                )
-
-            try:
-                response = self._session.get(url, params=params, timeout=delay)
-                response.raise_for_status()
-
-                return response.json()
-
-            except (ConnectTimeout,
-                    ReadTimeout) as e:
-                timing_out = True
-                previous_delay = delay
-
-                if ConnectTimeout:
-                    timeout_error = ConnectTimeout(
-                        f"{e}"
-                    )
-                if ReadTimeout:
-                    timeout_error = ReadTimeout(
-                        f"{e}"
-                    )
-
-            except HTTPError:
-                raise
-
-        else:
-            raise timeout_error
+        return self._request("eonet_categories", url, params, retry_delays)
 
     def eonet_layers(self,
                      category: str,
-                     retry_delays: list[float] | None = None) -> dict:
+                     retry_delays: list[float] | RetryPolicy | None = None) -> dict:
         """
         "A Layer is a reference to a specific web service
         (e.g., WMS, WMTS) that can be used to produce imagery
@@ -1649,43 +1754,11 @@ class NASAClient:
             parameter if specified as well, allowing for further customization
             between API requests! (e.g. the list [5, 10, 15] will cause the
             wrapper to try three times, once for five seconds, once again for
-            ten seconds, etc.) This defaults to [10, 15, 30]
+            ten seconds, etc.) A RetryPolicy can also be given instead, to
+            customize the backoff and retried statuses of this request as well!
+            This defaults to [10, 15, 30]
         """
 
         url = f"{self._base_eonet_url}/layers/{category}"
 
-        timing_out = False
-        previous_delay = None
-        timeout_error = None
-
-        for delay in retry_delays or self._default_retry_delays:
-            if timing_out:
-                print(
-                    self._timeout_print.format(previous_delay=previous_delay, delay=delay)
-                )
-
-            try:
-                response = self._session.get(url, timeout=delay)
-                response.raise_for_status()
-
-                return response.json()
-
-            except (ConnectTimeout,
-                    ReadTimeout) as e:
-                timing_out = True
-                previous_delay = delay
-
-                if ConnectTimeout:
-                    timeout_error = ConnectTimeout(
-                        f"{e}"
-                    )
-                if ReadTimeout:
-                    timeout_error = ReadTimeout(
-                        f"{e}"
-                    )
-
-            except HTTPError:
-                raise
-
-        else:
-            raise timeout_error
+        return self._request("eonet_layers", url, retry_delays=retry_delays)
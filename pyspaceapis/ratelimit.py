@@ -0,0 +1,127 @@
+from threading import Lock
+from time import monotonic, sleep
+from asyncio import sleep as async_sleep
+
+from .engine import Request, Response, Stage
+
+
+class RateLimitStage(Stage):
+    """
+    Passively tracks the X-RateLimit-Remaining and X-RateLimit-Limit
+    headers of every api.nasa.gov response, so the current budget of the
+    API key can be read at any time without making an extra request!
+
+    If 'pace' is True, the tracked headers also drive a token bucket
+    which holds the API key's hourly limit and refills at limit / 3600
+    tokens per second. Every keyed request takes one token, and when
+    the bucket is empty, requests wait (queue) for a token instead of
+    running into a 429 error. Until the first rate limit headers have
+    been seen, requests are never held back.
+    """
+
+    def __init__(self,
+                 pace: bool | None = False,
+                 window: float | None = 3600):
+        self.pace = pace
+        self.window = window
+
+        # Last Observed Headers (as returned by the API)
+        self.remaining_header = None
+        self.limit_header = None
+
+        # Token Bucket
+        self._lock = Lock()
+        self._limit = None
+        self._tokens = None
+        self._refilled_at = monotonic()
+
+    @property
+    def remaining(self) -> int | None:
+        """
+        The number of requests remaining for the API key, as of the last response.
+        """
+
+        return int(self.remaining_header) if self.remaining_header is not None else None
+
+    @property
+    def limit(self) -> int | None:
+        """
+        The total number of requests allowed per hour for the API key.
+        """
+
+        return self._limit
+
+    def _refill(self, now: float) -> None:
+        if self._tokens is not None and self._limit:
+            rate = self._limit / self.window
+            self._tokens = min(self._limit, self._tokens + (now - self._refilled_at) * rate)
+        self._refilled_at = now
+
+    def _reserve(self) -> float:
+        # Takes a token (possibly going into debt) and returns how long to wait for it
+        with self._lock:
+            if not self.pace or self._tokens is None or not self._limit:
+                return 0.0
+
+            self._refill(monotonic())
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+
+            return -self._tokens * self.window / self._limit
+
+    def observe(self, response: Response) -> None:
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        limit = response.headers.get("X-RateLimit-Limit")
+
+        if remaining is None and limit is None:
+            return
+
+        with self._lock:
+            self.remaining_header = remaining
+            self.limit_header = limit
+
+            if limit is not None:
+                self._limit = int(limit)
+            if remaining is not None:
+                self._refill(monotonic())
+                if self._tokens is None:
+                    self._tokens = float(remaining)
+                else:
+                    # The server's count is the truth, but never hand out tokens already reserved
+                    self._tokens = min(self._tokens, float(remaining))
+
+            if response.status_code == 429 and self._tokens is not None:
+                self._tokens = min(self._tokens, 0.0)
+
+    @staticmethod
+    def _is_keyed(request: Request) -> bool:
+        # Only api.nasa.gov requests carry (and count against) the API key
+        return "api_key" in request.params
+
+    def handle(self, request: Request, call_next) -> Response:
+        if not self._is_keyed(request):
+            return call_next(request)
+
+        wait = self._reserve()
+        if wait:
+            request.emit("throttle_wait", wait=wait)
+            sleep(wait)
+
+        # A 429 drains the bucket, so the RetryStage's retry of it waits for a token
+        response = call_next(request)
+        self.observe(response)
+        return response
+
+    async def handle_async(self, request: Request, call_next) -> Response:
+        if not self._is_keyed(request):
+            return await call_next(request)
+
+        wait = self._reserve()
+        if wait:
+            request.emit("throttle_wait", wait=wait)
+            await async_sleep(wait)
+
+        response = await call_next(request)
+        self.observe(response)
+        return response
@@ -0,0 +1,229 @@
+import json
+import sqlite3
+import zlib
+from os import path as os_path
+from threading import Lock
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.models import PreparedRequest
+from requests.structures import CaseInsensitiveDict
+
+from .cache import cache_key
+from .engine import Request, Response
+from .transport import Transport, RequestsTransport
+
+# Headers describing the original encoding of the body, which no longer apply once it is stored decoded
+_DROPPED_HEADERS = {"content-length", "content-encoding", "transfer-encoding", "set-cookie"}
+
+_SCHEMA = ("CREATE TABLE IF NOT EXISTS recordings ("
+           "key TEXT PRIMARY KEY, status INTEGER, reason TEXT, headers TEXT, content BLOB, url TEXT)")
+
+
+def _url(request: Request) -> str:
+    # The full URL of a request, without the API key
+    prepared = PreparedRequest()
+    prepared.prepare_url(request.url, {key: value for key, value in request.params.items() if key != "api_key"})
+    return prepared.url
+
+
+def _recorded(status: int) -> bool:
+    # Rate limits, server errors and 304s (which only make sense next to a stored response) aren't recorded
+    return status < 500 and status not in (304, 429)
+
+
+class RecordingTransport(Transport):
+    """
+    Sends requests through another transport, and records every response into
+    a compact archive (a single SQLite file, with zlib-compressed bodies) which
+    a ReplayTransport can serve later without any network access!
+
+    The API key is scrubbed from everything that is stored (including response
+    bodies, as NeoWs links contain it), and is never part of the lookup key,
+    so archives can be shared and replayed with any API key. Rate limited (429)
+    and failed (5xx) responses are not recorded, and streamed responses are
+    recorded once they are closed (reading whatever the iteration left).
+
+    :param path: The path of the archive. Recording into an existing archive
+        adds to it, replacing older recordings of the same requests.
+        This defaults to "pyspaceapis_recording.sqlite".
+
+    :param transport: The transport which actually sends the requests.
+        This defaults to None, which uses a RequestsTransport.
+        (Give an HTTPXTransport when recording with AsyncNASAClient)
+    """
+
+    def __init__(self,
+                 path: str | None = "pyspaceapis_recording.sqlite",
+                 transport: Transport | None = None):
+        self.path = os_path.expanduser(path)
+        self.transport = transport or RequestsTransport()
+
+        self._lock = Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+    def record(self, request: Request, response: Response, content: bytes) -> None:
+        if not _recorded(response.status_code):
+            return
+
+        api_key = request.params.get("api_key")
+        if api_key and api_key != "DEMO_KEY":
+            content = content.replace(api_key.encode(), b"DEMO_KEY")
+
+        headers = json.dumps({name: value for name, value in response.headers.items()
+                              if name.lower() not in _DROPPED_HEADERS})
+        row = (cache_key(request), response.status_code, response.reason, headers,
+               zlib.compress(content), _url(request))
+        with self._lock:
+            self._connection.execute("INSERT OR REPLACE INTO recordings VALUES (?, ?, ?, ?, ?, ?)", row)
+            self._connection.commit()
+
+    def _record_chunks(self, request: Request, response: Response, chunks):
+        body = []
+        for chunk in chunks:
+            body.append(chunk)
+            yield chunk
+        self.record(request, response, b"".join(body))
+
+    async def _record_chunks_async(self, request: Request, response: Response, chunks):
+        body = []
+        async for chunk in chunks:
+            body.append(chunk)
+            yield chunk
+        self.record(request, response, b"".join(body))
+
+    def _record_stream(self, request: Request, response: Response) -> None:
+        chunks = self._record_chunks(request, response, response.chunks)
+        closer = response.closer
+
+        def close():
+            # Streams are usually closed right after the last item was parsed, so the rest is read first
+            try:
+                for _ in chunks:
+                    pass
+            except Exception:
+                pass  # Nothing is recorded for a body which couldn't be read to the end
+            finally:
+                if closer is not None:
+                    closer()
+
+        response.chunks = chunks
+        response.closer = close
+
+    def _record_stream_async(self, request: Request, response: Response) -> None:
+        chunks = self._record_chunks_async(request, response, response.chunks)
+        closer = response.closer
+
+        async def close():
+            try:
+                async for _ in chunks:
+                    pass
+            except Exception:
+                pass
+            finally:
+                if closer is not None:
+                    await closer()
+
+        response.chunks = chunks
+        response.closer = close
+
+    def send(self, request: Request) -> Response:
+        response = self.transport.send(request)
+        if request.stream:
+            self._record_stream(request, response)
+        else:
+            self.record(request, response, response.content)
+        return response
+
+    async def send_async(self, request: Request) -> Response:
+        response = await self.transport.send_async(request)
+        if request.stream:
+            self._record_stream_async(request, response)
+        else:
+            self.record(request, response, response.content)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+        with self._lock:
+            self._connection.close()
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+        with self._lock:
+            self._connection.close()
+
+
+class ReplayTransport(Transport):
+    """
+    Serves the responses recorded by a RecordingTransport, without any
+    network I/O. The whole archive is loaded (and decompressed) into memory
+    up front, so replayed requests run as fast as the client itself allows,
+    which makes them handy for CI, load tests and reproducible benchmarks!
+
+    Requests are matched by their method, URL and parameters (except the
+    API key). Requests which were never recorded raise a ConnectionError.
+
+    :param path: The path of the archive.
+        This defaults to "pyspaceapis_recording.sqlite".
+    """
+
+    def __init__(self, path: str | None = "pyspaceapis_recording.sqlite"):
+        self.path = os_path.expanduser(path)
+        if not os_path.exists(self.path):
+            raise FileNotFoundError(f"No recording archive found at '{self.path}'.")
+
+        connection = sqlite3.connect(self.path)
+        try:
+            rows = connection.execute("SELECT key, status, reason, headers, content, url FROM recordings").fetchall()
+        finally:
+            connection.close()
+
+        self._recordings = {key: (status, reason, json.loads(headers), zlib.decompress(content), url)
+                            for key, status, reason, headers, content, url in rows}
+
+    def __len__(self) -> int:
+        return len(self._recordings)
+
+    def _lookup(self, request: Request) -> tuple:
+        recording = self._recordings.get(cache_key(request))
+        if recording is None:
+            raise RequestsConnectionError(
+                f"No recorded response for {request.method} {_url(request)} in '{self.path}'.",
+                request=request
+            )
+        return recording
+
+    @staticmethod
+    def _response(request: Request, recording: tuple, chunks=None) -> Response:
+        status, reason, headers, content, url = recording
+        return Response(status_code=status,
+                        headers=CaseInsensitiveDict(headers),
+                        content=b"" if request.stream else content,
+                        url=url,
+                        reason=reason,
+                        request=request,
+                        elapsed=0.0,
+                        chunks=chunks)
+
+    @staticmethod
+    def _chunks(request: Request, content: bytes):
+        size = request.options.get("chunk_size", 65536)
+        return (content[start:start + size] for start in range(0, len(content), size))
+
+    @staticmethod
+    async def _chunks_async(request: Request, content: bytes):
+        size = request.options.get("chunk_size", 65536)
+        for start in range(0, len(content), size):
+            yield content[start:start + size]
+
+    def send(self, request: Request) -> Response:
+        recording = self._lookup(request)
+        chunks = self._chunks(request, recording[3]) if request.stream else None
+        return self._response(request, recording, chunks)
+
+    async def send_async(self, request: Request) -> Response:
+        recording = self._lookup(request)
+        chunks = self._chunks_async(request, recording[3]) if request.stream else None
+        return self._response(request, recording, chunks)
@@ -0,0 +1,277 @@
+from asyncio import sleep as async_sleep
+from collections import deque
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from random import uniform
+from threading import Lock
+from time import monotonic, sleep
+
+from requests.exceptions import HTTPError, ReadTimeout, ConnectTimeout
+
+from .engine import Request, Response, Stage
+
+
+class RetryBudget:
+    """
+    Limits the share of requests which may be retried, so that when
+    the API is failing, every worker retrying at once doesn't hammer
+    it even harder! Within any 'window' of seconds, retries are allowed
+    while there have been fewer than 'min_retries' plus 'ratio' times
+    the number of requests. A budget can be shared by multiple clients.
+
+    :param ratio: The number of retries allowed per request.
+        This defaults to 0.2 (one retry per five requests).
+
+    :param min_retries: The number of retries always allowed per window,
+        so clients making few requests can still retry.
+        This defaults to 10.
+
+    :param window: The length of the sliding window in seconds.
+        This defaults to 60.
+    """
+
+    def __init__(self,
+                 ratio: float | None = 0.2,
+                 min_retries: int | None = 10,
+                 window: float | None = 60):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+
+        self._lock = Lock()
+        self._requests = deque()
+        self._retries = deque()
+
+    def _prune(self, now: float) -> None:
+        for timestamps in (self._requests, self._retries):
+            while timestamps and timestamps[0] <= now - self.window:
+                timestamps.popleft()
+
+    def record_request(self) -> None:
+        with self._lock:
+            now = monotonic()
+            self._prune(now)
+            self._requests.append(now)
+
+    def try_retry(self) -> bool:
+        """
+        Takes one retry from the budget, returning False if it is used up.
+        """
+
+        with self._lock:
+            now = monotonic()
+            self._prune(now)
+            if len(self._retries) >= self.min_retries + self.ratio * len(self._requests):
+                return False
+
+            self._retries.append(now)
+            return True
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Decides how requests are retried. Each attempt uses the next of
+    'timeouts' as its timeout (so there are as many attempts as timeouts),
+    and between attempts, the policy waits with exponential backoff and
+    jitter. Timeouts and responses with a status in 'retry_statuses' are
+    retried, honoring the Retry-After header of the response!
+
+    A RetryPolicy can be given to a client via 'retry_policy', or to a
+    single method call in place of its 'retry_delays' list.
+
+    :param timeouts: The timeout (in seconds) of each attempt.
+        This defaults to (10, 15, 30).
+
+    :param backoff: The base wait (in seconds) before the first retry,
+        which doubles with every retry after that. This defaults to 0.5.
+
+    :param max_backoff: The maximum wait (in seconds) between attempts.
+        This defaults to 30.
+
+    :param jitter: Whether each wait is picked randomly between zero and the
+        backoff ("full jitter"), so retrying workers spread out instead of
+        retrying in lockstep. This defaults to True.
+
+    :param retry_statuses: The HTTP status codes which are retried.
+        This defaults to (429, 502, 503, 504).
+
+    :param respect_retry_after: Whether to wait at least as long as the
+        Retry-After header of a response asks. This defaults to True.
+
+    :param max_retry_after: The longest Retry-After (in seconds) which is waited
+        for. Responses asking for longer are not retried. This defaults to 120.
+
+    :param budget: An optional RetryBudget limiting how many requests are
+        retried across all calls using this policy. This defaults to None.
+    """
+
+    timeouts: tuple = (10, 15, 30)
+    backoff: float = 0.5
+    max_backoff: float = 30
+    jitter: bool = True
+    retry_statuses: tuple = (429, 502, 503, 504)
+    respect_retry_after: bool = True
+    max_retry_after: float = 120
+    budget: RetryBudget | None = field(default=None, compare=False)
+
+    def with_timeouts(self, timeouts) -> "RetryPolicy":
+        """
+        Returns a copy of this policy with different per-attempt timeouts.
+        """
+
+        return replace(self, timeouts=tuple(timeouts))
+
+    def backoff_for(self, retry: int) -> float:
+        """
+        The wait (in seconds) before the given retry (1 being the first).
+        """
+
+        delay = min(self.max_backoff, self.backoff * 2 ** (retry - 1))
+        return uniform(0, delay) if self.jitter else delay
+
+
+def retry_after(response: Response) -> float | None:
+    """
+    Reads the Retry-After header of a response (either a number of seconds or an
+    HTTP date) as a number of seconds, returning None if it is missing or invalid.
+    """
+
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(0.0, (moment - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryStage(Stage):
+    """
+    Retries requests which time out or fail with a retryable status,
+    following the request's RetryPolicy (given via its 'retry_delays'),
+    or the client's policy. A plain list of 'retry_delays' keeps the
+    client's policy, with the list as its per-attempt timeouts.
+    Other HTTP errors are raised immediately.
+    """
+
+    def __init__(self,
+                 policy: RetryPolicy | None = None,
+                 timeout_print: bool | None = False):
+        self.policy = policy or RetryPolicy()
+        self.timeout_print = timeout_print
+
+    def _policy(self, request: Request) -> RetryPolicy:
+        if isinstance(request.retry_delays, RetryPolicy):
+            policy = request.retry_delays
+        elif request.retry_delays:
+            policy = self.policy.with_timeouts(request.retry_delays)
+        else:
+            policy = self.policy
+
+        if policy.budget is not None:
+            policy.budget.record_request()
+        return policy
+
+    def _wait(self, request: Request, policy: RetryPolicy, attempt: int, response: Response | None) -> float | None:
+        # Returns how long to wait before retrying, or None if the attempt should not be retried
+        if attempt >= len(policy.timeouts):
+            return None
+        if response is not None and response.status_code not in policy.retry_statuses:
+            return None
+
+        wait = policy.backoff_for(attempt)
+        if response is not None and policy.respect_retry_after:
+            requested = retry_after(response)
+            if requested is not None:
+                if requested > policy.max_retry_after:
+                    return None
+                wait = max(wait, requested)
+
+        if policy.budget is not None and not policy.budget.try_retry():
+            return None
+
+        if self.timeout_print:
+            if response is None:
+                print(
+                    f"(Request timed out after {policy.timeouts[attempt - 1]} seconds. "
+                    f"Retrying for {policy.timeouts[attempt]} seconds.)\n"
+                )
+            else:
+                print(
+                    f"(Request failed with status {response.status_code}. Retrying in {wait:.2f} seconds.)\n"
+                )
+
+        request.emit("retry", attempt=attempt, wait=wait,
+                     status=None if response is None else response.status_code)
+        return wait
+
+    def handle(self, request: Request, call_next) -> Response:
+        policy = self._policy(request)
+
+        for attempt, timeout in enumerate(policy.timeouts, start=1):
+            request.timeout = timeout
+            try:
+                response = call_next(request)
+
+            except (ConnectTimeout,
+                    ReadTimeout):
+                wait = self._wait(request, policy, attempt, None)
+                if wait is None:
+                    raise
+
+            else:
+                wait = self._wait(request, policy, attempt, response)
+                if wait is None:
+                    if request.check_status:
+                        try:
+                            response.raise_for_status()
+                        except HTTPError:
+                            # Streamed responses hold on to their connection until closed
+                            response.close()
+                            raise
+                    return response
+
+                response.close()
+
+            sleep(wait)
+
+    async def handle_async(self, request: Request, call_next) -> Response:
+        policy = self._policy(request)
+
+        for attempt, timeout in enumerate(policy.timeouts, start=1):
+            request.timeout = timeout
+            try:
+                response = await call_next(request)
+
+            except (ConnectTimeout,
+                    ReadTimeout):
+                wait = self._wait(request, policy, attempt, None)
+                if wait is None:
+                    raise
+
+            else:
+                wait = self._wait(request, policy, attempt, response)
+                if wait is None:
+                    if request.check_status:
+                        try:
+                            response.raise_for_status()
+                        except HTTPError:
+                            await response.aclose()
+                            raise
+                    return response
+
+                await response.aclose()
+
+            await async_sleep(wait)
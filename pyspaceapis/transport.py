@@ -0,0 +1,421 @@
+import socket
+from threading import Lock, local
+from time import perf_counter
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestsConnectionError, ReadTimeout, ConnectTimeout
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+from .engine import Request, Response
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+class Transport:
+    """
+    The innermost layer of the request engine, which actually
+    sends a Request over the network and returns a Response.
+    Subclasses implement 'send' and/or 'send_async'!
+    """
+
+    def send(self, request: Request) -> Response:
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support synchronous requests."
+        )
+
+    async def send_async(self, request: Request) -> Response:
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support asynchronous requests."
+        )
+
+    def close(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
+
+
+def _emit_phases(request: Request, phases: dict) -> None:
+    for name, seconds in phases.items():
+        request.emit("phase", name=name, seconds=seconds)
+
+
+# Phase Tracing (requests/urllib3)
+
+# The phases of the request being traced on this thread, if any (see RequestsTransport.send)
+_trace = local()
+
+
+def _record(phase: str, seconds: float) -> None:
+    phases = getattr(_trace, "phases", None)
+    if phases is not None:
+        phases[phase] = phases.get(phase, 0.0) + seconds
+
+
+class _TracedConnection(HTTPConnection):
+    """
+    Times the DNS lookup and TCP connect of new connections made for traced
+    requests. The host is resolved once up front, then each of its addresses
+    is connected to in turn, as urllib3 does. Untraced requests connect as usual.
+    """
+
+    _connected_in = 0.0
+
+    def _new_conn(self) -> socket.socket:
+        if getattr(_trace, "phases", None) is None:
+            return super()._new_conn()
+
+        start = perf_counter()
+        try:
+            addresses = socket.getaddrinfo(self._dns_host, self.port, allowed_gai_family(), socket.SOCK_STREAM)
+        except socket.gaierror:
+            # Lets urllib3 raise its usual NameResolutionError
+            return super()._new_conn()
+        resolved = perf_counter()
+        _record("dns", resolved - start)
+
+        host = self._dns_host
+        try:
+            for index, (*_, address) in enumerate(addresses):
+                self._dns_host = address[0]
+                try:
+                    sock = super()._new_conn()
+                    break
+                except (ConnectTimeoutError, NewConnectionError):
+                    if index == len(addresses) - 1:
+                        raise
+        finally:
+            self._dns_host = host
+
+        connected = perf_counter()
+        _record("connect", connected - resolved)
+        self._connected_in = connected - start
+        return sock
+
+
+class _TracedHTTPSConnection(_TracedConnection, HTTPSConnection):
+    def connect(self) -> None:
+        if getattr(_trace, "phases", None) is None:
+            return super().connect()
+
+        self._connected_in = 0.0
+        start = perf_counter()
+        super().connect()
+        # Whatever 'connect' spent beyond the DNS lookup and TCP connect was the TLS handshake
+        _record("tls", perf_counter() - start - self._connected_in)
+
+
+class _TracedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TracedConnection
+
+
+class _TracedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TracedHTTPSConnection
+
+
+class _TracedAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": _TracedHTTPConnectionPool,
+                                                   "https": _TracedHTTPSConnectionPool}
+
+
+class RequestsTransport(Transport):
+    """
+    Sends requests through a (pooled) 'requests.Session'.
+    This is the default transport of NASAClient.
+
+    :param session: An existing session to send requests through, in which
+        case the pool parameters are ignored. This defaults to None.
+
+    :param pool_connections: The number of per-host connection pools to keep.
+        This defaults to 10.
+
+    :param pool_maxsize: The maximum number of connections kept per host,
+        which should be at least the number of threads making requests at once.
+        This defaults to 10.
+
+    :param pool_block: Whether requests wait for a free connection once
+        'pool_maxsize' connections are in use, instead of opening (and then
+        throwing away) extra ones. This defaults to False.
+
+    :param keep_alive: Whether connections are kept open and reused between
+        requests. This defaults to True.
+
+    While a "phase" hook is listening, the DNS, connect, TLS, TTFB and download
+    phases of each request are timed. (DNS, connect and TLS only on sessions
+    created by the transport itself, and only when a new connection is opened)
+    """
+
+    def __init__(self,
+                 session: requests.Session | None = None,
+                 pool_connections: int | None = 10,
+                 pool_maxsize: int | None = 10,
+                 pool_block: bool | None = False,
+                 keep_alive: bool | None = True):
+        if session is None:
+            session = requests.Session()
+            adapter = _TracedAdapter(pool_connections=pool_connections,
+                                     pool_maxsize=pool_maxsize,
+                                     pool_block=pool_block)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            if not keep_alive:
+                session.headers["Connection"] = "close"
+
+        self.session = session
+
+    def send(self, request: Request) -> Response:
+        traced = request.listening("phase")
+        if traced:
+            _trace.phases = {}
+
+        start = perf_counter()
+        try:
+            response = self.session.request(request.method,
+                                            request.url,
+                                            params=request.params,
+                                            headers=request.headers,
+                                            timeout=request.timeout,
+                                            stream=request.stream)
+        finally:
+            if traced:
+                phases, _trace.phases = _trace.phases, None
+
+        if request.stream:
+            result = Response(status_code=response.status_code,
+                              headers=response.headers,
+                              content=b"",
+                              url=response.url,
+                              reason=response.reason,
+                              request=request,
+                              elapsed=perf_counter() - start,
+                              chunks=response.iter_content(request.options.get("chunk_size", 65536)),
+                              closer=response.close)
+        else:
+            result = Response(status_code=response.status_code,
+                              headers=response.headers,
+                              content=response.content,
+                              url=response.url,
+                              reason=response.reason,
+                              request=request,
+                              elapsed=perf_counter() - start)
+
+        if traced:
+            # 'response.elapsed' runs from sending until the headers were parsed, connecting included
+            headers = response.elapsed.total_seconds()
+            phases["ttfb"] = max(0.0, headers - sum(phases.values()))
+            if not request.stream:
+                phases["download"] = max(0.0, result.elapsed - headers)
+            _emit_phases(request, phases)
+
+        return result
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class _HTTPXTrace:
+    """
+    Collects the phases of one httpx request from httpcore's trace events.
+    httpcore resolves hosts as part of connecting, so there is no separate "dns" phase.
+    """
+
+    _PHASES = {"connect_tcp": "connect",
+               "start_tls": "tls",
+               "send_request_headers": "ttfb",
+               "receive_response_headers": "ttfb",
+               "receive_response_body": "download"}
+
+    def __init__(self):
+        self.phases = {}
+        self._started = {}
+
+    def __call__(self, name: str, info: dict) -> None:
+        *_, step, state = name.split(".")
+        phase = self._PHASES.get(step)
+        if phase is None:
+            return
+
+        if state == "started":
+            # TTFB starts with sending the headers, so receiving them doesn't restart it
+            self._started.setdefault(phase, perf_counter())
+        elif step != "send_request_headers":
+            started = self._started.pop(phase, None)
+            if started is not None:
+                self.phases[phase] = self.phases.get(phase, 0.0) + perf_counter() - started
+
+    async def atrace(self, name: str, info: dict) -> None:
+        self(name, info)
+
+
+class HTTPXTransport(Transport):
+    """
+    Sends requests through pooled httpx clients, optionally over HTTP/2.
+    This is the default transport of AsyncNASAClient, and can also be
+    used by NASAClient (e.g. for HTTP/2). httpx timeouts and connection
+    errors (including those breaking off a streamed body) are mapped onto
+    the same 'requests.exceptions' raised by RequestsTransport.
+
+    :param client: An existing 'httpx.AsyncClient' for asynchronous requests.
+        This defaults to None.
+
+    :param max_connections: The maximum number of simultaneous connections.
+        This defaults to 100.
+
+    :param max_keepalive_connections: The maximum number of idle connections
+        kept alive for reuse (0 disables keep-alive). This defaults to 20.
+
+    :param http2: Whether to use HTTP/2 where the server supports it, which
+        sends concurrent requests over a single connection per host.
+        This requires 'h2': pip install pyspaceapis[http2]
+        This defaults to False.
+
+    :param sync_client: An existing 'httpx.Client' for synchronous requests.
+        This defaults to None.
+
+    While a "phase" hook is listening, the connect, TLS, TTFB and download
+    phases of each request are timed via httpcore's trace extension.
+    """
+
+    def __init__(self,
+                 client=None,
+                 max_connections: int | None = 100,
+                 max_keepalive_connections: int | None = 20,
+                 http2: bool | None = False,
+                 sync_client=None):
+        if httpx is None:
+            raise ImportError(
+                "HTTPXTransport requires 'httpx'. Install it via: pip install pyspaceapis[async]"
+            )
+
+        self._limits = httpx.Limits(max_connections=max_connections,
+                                    max_keepalive_connections=max_keepalive_connections)
+        self._http2 = http2
+        self._lock = Lock()
+
+        self._client = client
+        self._sync_client = sync_client
+
+    @property
+    def client(self):
+        # Only created once an asynchronous request is made, as NASAClient never needs one
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.AsyncClient(limits=self._limits, http2=self._http2)
+        return self._client
+
+    @property
+    def sync_client(self):
+        # Only created once a synchronous request is made, as AsyncNASAClient never needs one
+        if self._sync_client is None:
+            with self._lock:
+                if self._sync_client is None:
+                    self._sync_client = httpx.Client(limits=self._limits, http2=self._http2)
+        return self._sync_client
+
+    @staticmethod
+    def _build(client, request: Request, trace=None):
+        return client.build_request(request.method,
+                                    request.url,
+                                    params=request.params,
+                                    headers=request.headers,
+                                    timeout=request.timeout,
+                                    extensions={"trace": trace} if trace is not None else None)
+
+    @staticmethod
+    def _iter_chunks(request: Request, response):
+        try:
+            yield from response.iter_bytes(request.options.get("chunk_size", 65536))
+        except httpx.TimeoutException as e:
+            raise ReadTimeout(f"{e}", request=request) from e
+        except httpx.TransportError as e:
+            raise RequestsConnectionError(f"{e}", request=request) from e
+
+    @staticmethod
+    async def _aiter_chunks(request: Request, response):
+        try:
+            async for chunk in response.aiter_bytes(request.options.get("chunk_size", 65536)):
+                yield chunk
+        except httpx.TimeoutException as e:
+            raise ReadTimeout(f"{e}", request=request) from e
+        except httpx.TransportError as e:
+            raise RequestsConnectionError(f"{e}", request=request) from e
+
+    @staticmethod
+    def _response(request: Request, response, start: float, trace=None, chunks=None, closer=None) -> Response:
+        result = Response(status_code=response.status_code,
+                          headers=CaseInsensitiveDict(response.headers),
+                          content=b"" if request.stream else response.content,
+                          url=str(response.url),
+                          reason=response.reason_phrase,
+                          request=request,
+                          elapsed=perf_counter() - start,
+                          chunks=chunks,
+                          closer=closer)
+
+        if trace is not None:
+            _emit_phases(request, trace.phases)
+        return result
+
+    def send(self, request: Request) -> Response:
+        trace = _HTTPXTrace() if request.listening("phase") else None
+        start = perf_counter()
+        try:
+            response = self.sync_client.send(self._build(self.sync_client, request, trace), stream=request.stream)
+
+        except httpx.ConnectTimeout as e:
+            raise ConnectTimeout(f"{e}", request=request) from e
+
+        except httpx.TimeoutException as e:
+            raise ReadTimeout(f"{e}", request=request) from e
+
+        except httpx.TransportError as e:
+            raise RequestsConnectionError(f"{e}", request=request) from e
+
+        if request.stream:
+            return self._response(request, response, start, trace,
+                                  chunks=self._iter_chunks(request, response),
+                                  closer=response.close)
+
+        return self._response(request, response, start, trace)
+
+    async def send_async(self, request: Request) -> Response:
+        trace = _HTTPXTrace() if request.listening("phase") else None
+        start = perf_counter()
+        try:
+            response = await self.client.send(self._build(self.client, request, trace and trace.atrace),
+                                              stream=request.stream)
+
+        except httpx.ConnectTimeout as e:
+            raise ConnectTimeout(f"{e}", request=request) from e
+
+        except httpx.TimeoutException as e:
+            raise ReadTimeout(f"{e}", request=request) from e
+
+        except httpx.TransportError as e:
+            raise RequestsConnectionError(f"{e}", request=request) from e
+
+        if request.stream:
+            return self._response(request, response, start, trace,
+                                  chunks=self._aiter_chunks(request, response),
+                                  closer=response.aclose)
+
+        return self._response(request, response, start, trace)
+
+    def close(self) -> None:
+        if self._sync_client is not None:
+            self._sync_client.close()
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
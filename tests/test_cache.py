@@ -0,0 +1,148 @@
+import asyncio
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+from requests.structures import CaseInsensitiveDict
+
+from pyspaceapis.cache import CacheStage, DiskCache, MemoryCache
+from pyspaceapis.engine import Request, Response
+
+
+def _response(content: bytes = b"{}") -> Response:
+    return Response(status_code=200, headers=CaseInsensitiveDict(), content=content, url="https://api.nasa.gov/test")
+
+
+def _request(name: str = "test") -> Request:
+    return Request("neows_lookup", f"https://api.nasa.gov/{name}")
+
+
+class _ThreadRecorder:
+    # A backend remembering which threads it was called from
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.threads = set()
+        if hasattr(backend, "blocking"):
+            self.blocking = backend.blocking
+
+    def get(self, key):
+        self.threads.add(threading.get_ident())
+        return self.backend.get(key)
+
+    def set(self, key, response, ttl):
+        self.threads.add(threading.get_ident())
+        self.backend.set(key, response, ttl)
+
+
+class DiskCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "cache.sqlite")
+
+    def _backdate(self, key: str) -> float:
+        # Moves an entry's access time into the past, so any later hit is newer
+        with sqlite3.connect(self.path) as connection:
+            connection.execute("UPDATE responses SET accessed_at = 0 WHERE key = ?", (key,))
+        return 0
+
+    def _accessed_at(self, key: str) -> float:
+        with sqlite3.connect(self.path) as connection:
+            return connection.execute("SELECT accessed_at FROM responses WHERE key = ?", (key,)).fetchone()[0]
+
+    def test_hits_are_written_in_batches(self):
+        cache = DiskCache(self.path, touch_batch=3, touch_interval=60)
+        for key in "abc":
+            cache.set(key, _response(), None)
+        stored = self._backdate("a")
+
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+        self.assertEqual(self._accessed_at("a"), stored)
+
+        cache.get("c")
+        self.assertGreater(self._accessed_at("a"), stored)
+        cache.close()
+
+    def test_close_writes_pending_hits(self):
+        cache = DiskCache(self.path, touch_interval=60)
+        cache.set("a", _response(), None)
+        stored = self._backdate("a")
+
+        cache.get("a")
+        cache.close()
+        self.assertGreater(self._accessed_at("a"), stored)
+
+    def test_eviction_sees_pending_hits(self):
+        cache = DiskCache(self.path, max_size=20, touch_interval=60)
+        cache.set("a", _response(b"a" * 10), None)
+        cache.set("b", _response(b"b" * 10), None)
+
+        # "a" was used more recently than "b", so "b" is evicted first
+        cache.get("a")
+        cache.set("c", _response(b"c" * 10), None)
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        cache.close()
+
+
+class CacheStageAsyncTests(unittest.TestCase):
+
+    def _run(self, backend) -> tuple[set, int]:
+        stage = CacheStage(backend)
+
+        async def send(request):
+            return _response()
+
+        async def requests():
+            for _ in range(2):
+                await stage.handle_async(_request(), send)
+            return threading.get_ident()
+
+        return asyncio.run(requests()), stage.stats["hits"]
+
+    def test_disk_cache_is_used_off_the_event_loop(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        backend = _ThreadRecorder(DiskCache(os.path.join(directory.name, "cache.sqlite")))
+
+        loop_thread, hits = self._run(backend)
+        self.assertEqual(hits, 1)
+        self.assertNotIn(loop_thread, backend.threads)
+        backend.backend.close()
+
+    def test_memory_cache_is_used_on_the_event_loop(self):
+        backend = _ThreadRecorder(MemoryCache())
+
+        loop_thread, hits = self._run(backend)
+        self.assertEqual(hits, 1)
+        self.assertEqual(backend.threads, {loop_thread})
+
+    def test_coalesced_requests_share_one_lookup(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        backend = DiskCache(os.path.join(directory.name, "cache.sqlite"))
+        stage = CacheStage(backend)
+        sent = []
+
+        async def send(request):
+            sent.append(request)
+            await asyncio.sleep(0.01)
+            return _response()
+
+        async def requests():
+            return await asyncio.gather(*(stage.handle_async(_request(), send) for _ in range(5)))
+
+        self.assertEqual(len(asyncio.run(requests())), 5)
+        self.assertEqual(len(sent), 1)
+        self.assertEqual(stage.stats, {"hits": 0, "misses": 1, "coalesced": 4})
+        backend.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
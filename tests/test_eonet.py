@@ -0,0 +1,52 @@
+import unittest
+
+from pyspaceapis import EONETIndex, eonet_arrays
+
+EVENTS = {"events": [
+    {"id": "EONET_1", "title": "Wildfire", "categories": [{"id": "wildfires"}], "geometry": [
+        {"date": "2024-01-01T00:00:00Z", "type": "Point", "coordinates": [10.0, 20.0]},
+        {"date": "2024-01-02T00:00:00Z", "type": "Point", "coordinates": [11.0, 21.0]},
+    ]},
+    {"id": "EONET_2", "title": "Iceberg", "categories": [{"id": "seaLakeIce"}], "geometry": [
+        {"date": "2024-01-03T00:00:00Z", "magnitudeValue": 40, "type": "Point", "coordinates": [-60.0, -70.0]},
+    ]},
+]}
+
+
+def _geojson(events: dict) -> dict:
+    # The same events as GeoJSON, one feature per geometry, with the features of both events interleaved
+    features = []
+    for event in events["events"]:
+        properties = {key: value for key, value in event.items() if key != "geometry"}
+        for geometry in event["geometry"]:
+            features.append({"type": "Feature",
+                             "properties": {**properties, "date": geometry["date"],
+                                            "magnitudeValue": geometry.get("magnitudeValue")},
+                             "geometry": {"type": geometry["type"], "coordinates": geometry["coordinates"]}})
+    features.insert(1, features.pop())
+    return {"type": "FeatureCollection", "features": features}
+
+
+class GeoJSONGroupingTests(unittest.TestCase):
+
+    def test_arrays_group_features_by_event(self):
+        arrays = eonet_arrays(_geojson(EVENTS))
+        self.assertEqual(arrays.event_ids, ["EONET_1", "EONET_2"])
+        self.assertEqual(arrays.event_index.tolist(), [0, 0, 1])
+        self.assertEqual(arrays.lon.tolist(), [10.0, 11.0, -60.0])
+        self.assertEqual(arrays.categories, ["wildfires", "seaLakeIce"])
+
+        expected = eonet_arrays(EVENTS)
+        self.assertEqual(arrays.timestamp.tolist(), expected.timestamp.tolist())
+        self.assertEqual(arrays.geometry_index.tolist(), expected.geometry_index.tolist())
+
+    def test_index_counts_events(self):
+        index = EONETIndex()
+        index.build(_geojson(EVENTS))
+        self.assertEqual(len(index), 2)
+        self.assertEqual([event["id"] for event in index.events], ["EONET_1", "EONET_2"])
+        self.assertEqual([event["id"] for event in index.query_bbox(9, 22, 12, 19)], ["EONET_1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import asyncio
+import json
+import unittest
+
+from pyspaceapis.jsonstream import JSONArrayStream, aiter_array, iter_array
+
+DOCUMENTS = [
+    b'{"events": [22.5, -3e10, 0, -0.25E-2, 1e+3, 7]}',
+    b'{"count": 12.5, "flag": true, "none": null, "events": [{"id": "EONET_1", "mag": 1.5e2}, 3.25, false]}',
+    b'{"title": "Volc\xc3\xa1n \xe6\xb8\xa9\xe5\xba\xa6 \xf0\x9f\x8c\x8b", "events": ["caf\xc3\xa9", {"n\xc3\xa4me": "\xf0\x9f\x94\xa5 fire"}, -12.75]}',
+    b'{"nested": {"events": [1, 2]}, "events": [[1.5, [2e-3, {"a": [3]}]], {"b": {"c": -4.0}}], "after": 99.9}',
+    b'  {\n  "events" : [ 1.0 , 2 ,\n 3e1 ] ,\n "tail": [1, 2, 3] }  ',
+    b'{"events": []}'
+]
+
+
+def _chunked(document: bytes, size: int) -> list:
+    return [document[start:start + size] for start in range(0, len(document), size)]
+
+
+class JSONArrayStreamTests(unittest.TestCase):
+
+    def assertStreams(self, chunks: list, document: bytes):
+        self.assertEqual(list(iter_array(chunks, "events")), json.loads(document)["events"])
+
+    def test_fixed_size_chunks(self):
+        for document in DOCUMENTS:
+            for size in (1, 2, 3):
+                with self.subTest(document=document, size=size):
+                    self.assertStreams(_chunked(document, size), document)
+
+    def test_every_split_offset(self):
+        for document in DOCUMENTS:
+            for offset in range(len(document) + 1):
+                with self.subTest(document=document, offset=offset):
+                    self.assertStreams([document[:offset], document[offset:]], document)
+
+    def test_numbers_split_after_decimal_point_or_exponent(self):
+        self.assertStreams([b'{"events":[22.', b'5]}'], b'{"events":[22.5]}')
+        self.assertStreams([b'{"events":[-3e', b'10]}'], b'{"events":[-3e10]}')
+        self.assertStreams([b'{"count": 12.', b'5, "events":[1]}'], b'{"count": 12.5, "events":[1]}')
+
+    def test_async_chunks(self):
+        async def chunks(document):
+            for chunk in _chunked(document, 2):
+                yield chunk
+
+        async def collect(document):
+            return [item async for item in aiter_array(chunks(document), "events")]
+
+        for document in DOCUMENTS:
+            with self.subTest(document=document):
+                self.assertEqual(asyncio.run(collect(document)), json.loads(document)["events"])
+
+    def test_truncated_document_raises(self):
+        for document in (b'{"events": [1, 2', b'{"events": [1.', b'{"count": 1'):
+            with self.subTest(document=document):
+                parser = JSONArrayStream("events")
+                parser.feed(document)
+                with self.assertRaises(json.JSONDecodeError):
+                    parser.close()
+
+    def test_stops_after_the_array(self):
+        parser = JSONArrayStream("events")
+        self.assertEqual(parser.feed(b'{"events": [1, 2]'), [1, 2])
+        self.assertTrue(parser.done)
+
+
+if __name__ == "__main__":
+    unittest.main()
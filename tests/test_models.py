@@ -0,0 +1,79 @@
+import pickle
+import unittest
+
+from pyspaceapis import models
+
+# A raw value for every lazy field key, keyed by (model name, key) where models disagree on its shape
+SAMPLES = {
+    "close_approach_data": [{"close_approach_date": "2024-01-01", "miss_distance": {"kilometers": "1000.5"}}],
+    "orbital_data": {"orbit_id": "921", "eccentricity": ".36"},
+    ("NEOFeed", "near_earth_objects"): {"2024-01-01": [{"id": "2001980", "name": "Tezcatlipoca"}]},
+    ("NEOBrowsePage", "near_earth_objects"): [{"id": "2001980", "name": "Tezcatlipoca"}],
+    "instruments": [{"displayName": "SOHO: LASCO/C2"}],
+    "cmeAnalyses": [{"speed": 500, "isMostAccurate": True}],
+    "linkedEvents": [{"activityID": "2024-01-01T00:00:00-IPS-001"}],
+    "allKpIndex": [{"observedTime": "2024-01-01T03:00Z", "kpIndex": 5}],
+    "cmeInputs": [{"cmeStartTime": "2024-01-01T00:00Z"}],
+    "impactList": [{"location": "Earth"}],
+    "coordinates": [[-120.5, 38.25], [-120.0, 38.0]],
+    "categories": [{"id": "wildfires"}],
+    "sources": [{"id": "InciWeb"}],
+    "geometry": [{"date": "2024-01-01T00:00:00Z", "type": "Point", "coordinates": [-120.5, 38.25]}]
+}
+
+
+def _lazy_models():
+    found, pending = [], [models.Model]
+    while pending:
+        model = pending.pop()
+        pending.extend(model.__subclasses__())
+        if model._lazy:
+            found.append(model)
+    return found
+
+
+def _sample(model) -> dict:
+    return {key: SAMPLES.get((model.__name__, key), SAMPLES.get(key)) for _, key, _ in model._lazy}
+
+
+class LazyFieldTests(unittest.TestCase):
+
+    def test_every_lazy_field_can_be_read_twice(self):
+        for model in _lazy_models():
+            instance = model(_sample(model))
+            for attribute, _, _ in model._lazy:
+                with self.subTest(model=model.__name__, field=attribute):
+                    first = getattr(instance, attribute)
+                    self.assertIsNotNone(first)
+                    self.assertEqual(getattr(instance, attribute), first)
+
+    def test_models_compare_equal_after_decoding(self):
+        for model in _lazy_models():
+            with self.subTest(model=model.__name__):
+                first, second = model(_sample(model)), model(_sample(model))
+                self.assertEqual(first, second)
+                self.assertEqual(first, second)
+
+    def test_missing_lazy_fields_are_none(self):
+        for model in _lazy_models():
+            instance = model({})
+            for attribute, _, _ in model._lazy:
+                with self.subTest(model=model.__name__, field=attribute):
+                    self.assertIsNone(getattr(instance, attribute))
+
+    def test_neo_feed_keys_by_date(self):
+        feed = models.NEOFeed({"element_count": 1, **_sample(models.NEOFeed)})
+        self.assertEqual(feed.near_earth_objects, feed.near_earth_objects)
+        (day, neos), = feed.near_earth_objects.items()
+        self.assertEqual(day.isoformat(), "2024-01-01")
+        self.assertEqual(neos[0].name, "Tezcatlipoca")
+
+    def test_pickling_keeps_undecoded_fields(self):
+        event = models.EONETEvent({"id": "EONET_1", **_sample(models.EONETEvent)})
+        restored = pickle.loads(pickle.dumps(event))
+        self.assertEqual(restored.categories, ("wildfires",))
+        self.assertEqual(restored, event)
+
+
+if __name__ == "__main__":
+    unittest.main()
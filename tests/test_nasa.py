@@ -0,0 +1,65 @@
+import json
+import threading
+import unittest
+
+from requests.structures import CaseInsensitiveDict
+
+from pyspaceapis import NASAClient, Transport
+from pyspaceapis.engine import Response
+
+
+class _BrowseTransport(Transport):
+    # Serves 'neows_browse' pages of two Asteroids each, noting the page and thread of every request
+
+    def __init__(self, total_pages: int):
+        self.total_pages = total_pages
+        self.sent = []
+
+    def send(self, request):
+        page = int(request.params.get("page", 0))
+        self.sent.append((page, threading.current_thread()))
+        body = {"page": {"number": page, "total_pages": self.total_pages},
+                "links": {"next": "next"} if page + 1 < self.total_pages else {},
+                "near_earth_objects": [{"id": f"{page}-{index}"} for index in range(2)]}
+        return Response(status_code=200, headers=CaseInsensitiveDict(), content=json.dumps(body).encode(),
+                        url=request.url, reason="OK", request=request)
+
+
+class IterNeoWsBrowseTests(unittest.TestCase):
+
+    def _client(self, total_pages: int) -> tuple[NASAClient, _BrowseTransport]:
+        transport = _BrowseTransport(total_pages)
+        client = NASAClient(transport=transport)
+        self.addCleanup(client.close)
+        return client, transport
+
+    def test_every_asteroid_in_order(self):
+        for prefetch in (0, 1, 2, 5):
+            with self.subTest(prefetch=prefetch):
+                client, _ = self._client(4)
+                ids = [asteroid["id"] for asteroid in client.iter_neows_browse(start_page=1, prefetch=prefetch)]
+                self.assertEqual(ids, [f"{page}-{index}" for page in range(1, 4) for index in range(2)])
+
+    def test_no_prefetch_requests_pages_on_demand(self):
+        client, transport = self._client(3)
+        asteroids = client.iter_neows_browse(prefetch=0)
+
+        next(asteroids)
+        next(asteroids)
+        self.assertEqual([page for page, _ in transport.sent], [0])
+
+        next(asteroids)
+        self.assertEqual(transport.sent, [(0, threading.current_thread()), (1, threading.current_thread())])
+        asteroids.close()
+
+    def test_prefetches_on_the_client_executor(self):
+        client, transport = self._client(3)
+        list(client.iter_neows_browse(prefetch=2))
+
+        prefetched = {thread for page, thread in transport.sent if page}
+        self.assertEqual(len(transport.sent), 3)
+        self.assertTrue(all(thread.name.startswith("pyspaceapis") for thread in prefetched))
+
+
+if __name__ == "__main__":
+    unittest.main()
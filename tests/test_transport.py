@@ -0,0 +1,76 @@
+import asyncio
+import socket
+import unittest
+
+import httpx
+from requests.exceptions import ConnectionError as RequestsConnectionError
+
+from pyspaceapis.engine import Request
+from pyspaceapis.transport import HTTPXTransport
+
+
+def _closed_port_url() -> str:
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        port = listener.getsockname()[1]
+    return f"http://127.0.0.1:{port}/"
+
+
+class _BrokenStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    # A body which breaks off after its first chunk
+
+    def __iter__(self):
+        yield b"partial"
+        raise httpx.RemoteProtocolError("peer closed connection")
+
+    async def __aiter__(self):
+        yield b"partial"
+        raise httpx.RemoteProtocolError("peer closed connection")
+
+
+def _broken_response(request):
+    return httpx.Response(200, stream=_BrokenStream())
+
+
+class HTTPXTransportErrorTests(unittest.TestCase):
+
+    def test_refused_connection_raises_requests_error(self):
+        transport = HTTPXTransport(http2=True)
+        with self.assertRaises(RequestsConnectionError) as caught:
+            transport.send(Request("test", _closed_port_url(), timeout=5))
+        self.assertIsInstance(caught.exception.__cause__, httpx.TransportError)
+        transport.close()
+
+    def test_refused_connection_raises_requests_error_async(self):
+        async def send():
+            transport = HTTPXTransport()
+            try:
+                await transport.send_async(Request("test", _closed_port_url(), timeout=5))
+            finally:
+                await transport.aclose()
+
+        with self.assertRaises(RequestsConnectionError):
+            asyncio.run(send())
+
+    def test_broken_stream_raises_requests_error(self):
+        transport = HTTPXTransport(sync_client=httpx.Client(transport=httpx.MockTransport(_broken_response)))
+        response = transport.send(Request("test", "http://test/", stream=True))
+        with self.assertRaises(RequestsConnectionError):
+            list(response.chunks)
+        transport.close()
+
+    def test_broken_stream_raises_requests_error_async(self):
+        async def read():
+            transport = HTTPXTransport(httpx.AsyncClient(transport=httpx.MockTransport(_broken_response)))
+            try:
+                response = await transport.send_async(Request("test", "http://test/", stream=True))
+                return [chunk async for chunk in response.chunks]
+            finally:
+                await transport.aclose()
+
+        with self.assertRaises(RequestsConnectionError):
+            asyncio.run(read())
+
+
+if __name__ == "__main__":
+    unittest.main()